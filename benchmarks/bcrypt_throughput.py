@@ -0,0 +1,59 @@
+"""Measure bcrypt hashes per second for a range of work factors.
+
+    python -m benchmarks.bcrypt_throughput --rounds 10 11 12 --seconds 3
+
+Prints one JSON object per work factor. Use the numbers to pick
+BCRYPT_LOG_ROUNDS and BCRYPT_POOL_SIZE for an environment.
+"""
+import argparse
+import json
+import os
+import threading
+import time
+
+import bcrypt
+
+
+def hashes_per_second(rounds, threads, seconds):
+    salt = bcrypt.gensalt(rounds)
+    stop = time.perf_counter() + seconds
+    counts = [0] * threads
+
+    def worker(index):
+        while time.perf_counter() < stop:
+            bcrypt.hashpw(b"Benchmark-passw0rd!", salt)
+            counts[index] += 1
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    return sum(counts) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    for rounds in args.rounds:
+        single = hashes_per_second(rounds, 1, args.seconds)
+        pooled = hashes_per_second(rounds, args.threads, args.seconds)
+
+        print(json.dumps({
+            "rounds": rounds,
+            "ms_per_hash": round(1000 / single, 1),
+            "hashes_per_sec_single_thread": round(single, 2),
+            "threads": args.threads,
+            "hashes_per_sec_pool": round(pooled, 2),
+            "hashes_per_sec_per_core": round(pooled / args.threads, 2),
+        }))
+
+
+if __name__ == "__main__":
+    main()
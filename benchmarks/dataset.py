@@ -0,0 +1,264 @@
+"""Seed a reproducible synthetic dataset for load tests.
+
+    python -m benchmarks.dataset --database-url sqlite:///bench.db --reset
+    python -m benchmarks.dataset --database-url postgresql://... --teachers 10000 --disciplines 2000 --reviews 5000000
+
+The same --seed and --end-date always produce the same rows. Teachers,
+disciplines and reviewers are picked with a Zipf-like skew, so a few of them
+collect most of the reviews, and every entity has its own rating level.
+Review dates lean towards --end-date. All users share PASSWORD, which
+benchmarks.load logs in with. Prints a JSON summary when done.
+"""
+import argparse
+import json
+import os
+import random
+import time
+from datetime import date, timedelta
+from itertools import accumulate
+
+PASSWORD = "Benchmark-passw0rd!"
+
+FACULTIES = (
+    "Faculty of Information Technology",
+    "Faculty of Business",
+    "Faculty of Energy",
+    "Faculty of Economics",
+    "Faculty of Mathematics and Cybernetics",
+    "Faculty of Chemistry and Biology",
+)
+
+TYPES = ("mandatory", "elective", "special course")
+TYPE_WEIGHTS = (6, 3, 1)
+
+NAMES = ("Ivan", "Anna", "Sergey", "Olga", "Dmitry", "Elena", "Alexey", "Maria", "Pavel", "Natalia", "Andrey", "Irina")
+SURNAMES = ("Petrov", "Ivanova", "Smirnov", "Kuznetsova", "Popov", "Sokolova", "Lebedev", "Kozlova", "Novikov", "Morozova")
+SUBJECTS = ("Algebra", "Databases", "Physics", "Economics", "Statistics", "Chemistry", "Networks", "Marketing", "Biology", "Programming")
+
+WORDS = (
+    "clear", "lectures", "fair", "exam", "homework", "strict", "helpful", "boring", "interesting", "deadlines",
+    "slides", "practice", "labs", "grading", "explains", "well", "too", "fast", "recommend", "difficult",
+)
+
+
+def zipf_weights(n, skew):
+    """Cumulative weights for random.choices: the item at rank k gets weight 1 / k**skew."""
+    return list(accumulate(1 / rank ** skew for rank in range(1, n + 1)))
+
+
+def level(rng):
+    # each teacher/discipline has its own typical rating
+    return min(9.5, max(2.0, rng.gauss(7.0, 1.5)))
+
+
+def rating(rng, mean):
+    return min(10, max(1, round(rng.gauss(mean, 1.8))))
+
+
+def difficulty(rng, hardness):
+    return rng.choices(("easy", "medium", "hard"), weights=(3 - hardness, 2, 1 + hardness))[0]
+
+
+def review_day(rng, end_date):
+    # most reviews are recent, with a long tail over four years
+    return end_date - timedelta(days=min(int(rng.expovariate(1 / 240)), 1460))
+
+
+def feedback(rng):
+    return " ".join(rng.choices(WORDS, k=rng.randint(5, 40))).capitalize() + "."
+
+
+def generate_disciplines(rng, count):
+    for id in range(1, count + 1):
+        yield {
+            "id": id,
+            "name": f"{rng.choice(SUBJECTS)} {id}",
+            "faculty": rng.choice(FACULTIES),
+            "type": rng.choices(TYPES, weights=TYPE_WEIGHTS)[0],
+        }
+
+
+def generate_teachers(rng, count):
+    for id in range(1, count + 1):
+        # the id keeps (name, surname) unique
+        yield {"id": id, "name": rng.choice(NAMES), "surname": f"{rng.choice(SURNAMES)}-{id}"}
+
+
+def generate_assignments(rng, teachers, disciplines):
+    assignments = {}
+    for teacher_id in range(1, teachers + 1):
+        assignments[teacher_id] = rng.sample(range(1, disciplines + 1), k=min(disciplines, rng.randint(1, 4)))
+    return assignments
+
+
+def generate_users(count, password_hash):
+    for id in range(1, count + 1):
+        yield {"id": id, "username": f"user{id}", "email": f"user{id}@example.com", "passwordHash": password_hash}
+
+
+def shuffled_ids(rng, count):
+    # popularity rank -> entity id, so the popular ones are not simply the lowest ids
+    ids = list(range(1, count + 1))
+    rng.shuffle(ids)
+    return ids
+
+
+def generate_teacher_reviews(rng, args, teachers, disciplines, assignments):
+    teacher_ids = shuffled_ids(rng, args.teachers)
+    user_ids = shuffled_ids(rng, args.users)
+    teacher_weights = zipf_weights(args.teachers, args.skew)
+    user_weights = zipf_weights(args.users, args.skew)
+    levels = {teacher_id: level(rng) for teacher_id in teacher_ids}
+    hardness = {teacher_id: rng.random() * 2 for teacher_id in teacher_ids}
+
+    for _ in range(args.reviews):
+        teacher_id = rng.choices(teacher_ids, cum_weights=teacher_weights)[0]
+        discipline_id = rng.choice(assignments[teacher_id])
+        teacher = teachers[teacher_id - 1]
+
+        yield {
+            "user_id": rng.choices(user_ids, cum_weights=user_weights)[0],
+            "teacher_id": teacher_id,
+            "discipline_id": discipline_id,
+            "name": teacher["name"],
+            "surname": teacher["surname"],
+            "discipline_name": disciplines[discipline_id - 1]["name"],
+            "difficulty": difficulty(rng, hardness[teacher_id]),
+            "rating": rating(rng, levels[teacher_id]),
+            "feedback": feedback(rng),
+            "time": review_day(rng, args.end_date),
+        }
+
+
+def generate_discipline_reviews(rng, args, disciplines):
+    discipline_ids = shuffled_ids(rng, args.disciplines)
+    user_ids = shuffled_ids(rng, args.users)
+    discipline_weights = zipf_weights(args.disciplines, args.skew)
+    user_weights = zipf_weights(args.users, args.skew)
+    levels = {discipline_id: level(rng) for discipline_id in discipline_ids}
+    hardness = {discipline_id: rng.random() * 2 for discipline_id in discipline_ids}
+
+    for _ in range(args.discipline_reviews):
+        discipline_id = rng.choices(discipline_ids, cum_weights=discipline_weights)[0]
+
+        yield {
+            "user_id": rng.choices(user_ids, cum_weights=user_weights)[0],
+            "discipline_id": discipline_id,
+            "name": disciplines[discipline_id - 1]["name"],
+            "difficulty": difficulty(rng, hardness[discipline_id]),
+            "rating": rating(rng, levels[discipline_id]),
+            "feedback": feedback(rng),
+            "time": review_day(rng, args.end_date),
+        }
+
+
+def insert_batches(table, rows, batch_size):
+    from sqlalchemy import insert
+
+    from blueprintapp.app import db
+
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            db.session.execute(insert(table), batch)
+            db.session.commit()
+            count += len(batch)
+            batch = []
+    if batch:
+        db.session.execute(insert(table), batch)
+        db.session.commit()
+        count += len(batch)
+
+    return count
+
+
+def seed(args):
+    from blueprintapp.app import db
+    from blueprintapp.blueprints.auth.models import User
+    from blueprintapp.blueprints.auth.hashing import hash_password
+    from blueprintapp.blueprints.admin.models import Teacher, Discipline, teacher_discipline
+    from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+    from blueprintapp.blueprints.reviews.aggregates import rebuild_aggregates
+    from blueprintapp.blueprints.reviews.rollups import rebuild_rollups
+    from blueprintapp.blueprints.reviews.distributions import rebuild_distributions
+
+    if args.reset:
+        db.drop_all(bind_key=None)
+    db.create_all(bind_key=None)
+
+    if db.session.query(Teacher.id).first() is not None:
+        raise SystemExit("The database already has data; pass --reset to start over.")
+
+    rng = random.Random(args.seed)
+    counts = {}
+
+    disciplines = list(generate_disciplines(rng, args.disciplines))
+    teachers = list(generate_teachers(rng, args.teachers))
+    assignments = generate_assignments(rng, args.teachers, args.disciplines)
+
+    counts["disciplines"] = insert_batches(Discipline.__table__, disciplines, args.batch_size)
+    counts["teachers"] = insert_batches(Teacher.__table__, teachers, args.batch_size)
+    counts["assignments"] = insert_batches(teacher_discipline, (
+        {"teacher_id": teacher_id, "discipline_id": discipline_id}
+        for teacher_id, discipline_ids in assignments.items()
+        for discipline_id in discipline_ids
+    ), args.batch_size)
+    # one hash for everyone: hashing a million passwords would dominate the run
+    counts["users"] = insert_batches(User.__table__, generate_users(args.users, hash_password(PASSWORD)), args.batch_size)
+
+    counts["teacher_reviews"] = insert_batches(
+        TeacherReview.__table__, generate_teacher_reviews(rng, args, teachers, disciplines, assignments), args.batch_size
+    )
+    counts["discipline_reviews"] = insert_batches(
+        DisciplineReview.__table__, generate_discipline_reviews(rng, args, disciplines), args.batch_size
+    )
+
+    # reviews were inserted directly, so derive the stored aggregates in SQL afterwards
+    rebuild_aggregates()
+    rebuild_rollups()
+    rebuild_distributions()
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="Defaults to $DATABASE_URL.")
+    parser.add_argument("--teachers", type=int, default=10000)
+    parser.add_argument("--disciplines", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--reviews", type=int, default=5000000, help="Teacher reviews.")
+    parser.add_argument("--discipline-reviews", type=int, default=1000000)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent for popularity; 0 is uniform.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date.today(), help="Date of the newest reviews (YYYY-MM-DD).")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate the tables first.")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("--database-url or $DATABASE_URL is required")
+
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+
+    from blueprintapp.app import create_app
+    app = create_app()
+
+    started = time.perf_counter()
+    with app.app_context():
+        counts = seed(args)
+
+    print(json.dumps({
+        **counts,
+        "seed": args.seed,
+        "skew": args.skew,
+        "end_date": args.end_date.isoformat(),
+        "seconds": round(time.perf_counter() - started, 1),
+    }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""Drive the app with concurrent requests and report latency per route.
+
+    python -m benchmarks.load --database-url sqlite:///bench.db --requests 500 --concurrency 8
+    python -m benchmarks.load --url http://localhost:5000 --requests 2000 --concurrency 32 --output before.json
+
+Without --url, requests go through Flask's test client in this process,
+against --database-url. With --url, they go over HTTP to a running server;
+start it with SQL_INSTRUMENTATION=1 to get query counts and
+RATELIMIT_ENABLED=0 so the login route is not rejected. Either way the
+database should be seeded by benchmarks.dataset, and --teachers/--users
+must not exceed what was seeded.
+
+Each route runs on its own, after --warmup untimed requests. The JSON report
+holds p50/p95/p99 latency, throughput, errors and SQL queries per request
+for every route, plus the commit it was run on, so runs can be compared.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+
+from benchmarks.dataset import PASSWORD, zipf_weights
+
+WINDOWS = ("all", "30d", "semester", "trending")
+
+
+class ClientSession:
+    """One logged-in user, requests through Flask's test client."""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, data=None):
+        response = self.client.open(path, method=method, data=data)
+        response.close()
+        return response.status_code, response.headers
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    # report redirects like the test client does instead of following them
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HttpSession:
+    """One logged-in user, requests over HTTP with its own cookie jar."""
+
+    def __init__(self, url, timeout=30):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(_NoRedirect, urllib.request.HTTPCookieProcessor(CookieJar()))
+
+    def request(self, method, path, data=None):
+        body = urllib.parse.urlencode(data).encode("utf-8") if data is not None else None
+        request = urllib.request.Request(self.url + path, data=body, method=method)
+
+        try:
+            with self.opener.open(request, timeout=self.timeout) as response:
+                response.read()
+                return response.status, response.headers
+        except urllib.error.HTTPError as e:
+            e.read()
+            return e.code, e.headers
+
+
+class Scenarios:
+    """Builds (method, path, form data) for each route, with the dataset's popularity skew."""
+
+    def __init__(self, args):
+        self.args = args
+        self.teacher_weights = zipf_weights(args.teachers, args.skew)
+        self.user_weights = zipf_weights(args.users, args.skew)
+
+    def teacher_id(self, rng):
+        return rng.choices(range(1, self.args.teachers + 1), cum_weights=self.teacher_weights)[0]
+
+    def credentials(self, rng):
+        user_id = rng.choices(range(1, self.args.users + 1), cum_weights=self.user_weights)[0]
+        return {"email": f"user{user_id}@example.com", "password": PASSWORD}
+
+    def search_teacher(self, rng):
+        data = {"teacher_id": self.teacher_id(rng)}
+        if rng.random() < 0.3:
+            data["rating"] = rng.randint(1, 10)
+        if rng.random() < 0.2:
+            data["difficulty"] = rng.choice(("easy", "medium", "hard"))
+        return "POST", "/reviews/search_teacher", data
+
+    def ratings(self, rng):
+        return "POST", "/reviews/ratings", {
+            "rank_type": rng.choice(("teacherRank", "disciplineRank")),
+            "window": rng.choice(WINDOWS),
+            "limit": rng.choice((10, 25, 50)),
+        }
+
+    def teacher(self, rng):
+        return "GET", f"/reviews/teacher/{self.teacher_id(rng)}", None
+
+    def profile(self, rng):
+        return "GET", "/auth/profile", None
+
+    def login(self, rng):
+        return "POST", "/auth/login", self.credentials(rng)
+
+
+ROUTES = ("search_teacher", "ratings", "teacher", "profile", "login")
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))]
+
+
+def summarize(samples, seconds):
+    latencies = sorted(latency for latency, _, _ in samples)
+    queries = [count for _, _, count in samples if count is not None]
+    errors = sum(1 for _, status, _ in samples if status is None or status >= 400)
+
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": round(len(samples) / seconds, 1) if seconds else None,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else None,
+        **{f"p{p}_ms": round(percentile(latencies, p) * 1000, 2) if latencies else None for p in (50, 95, 99)},
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+        "queries_mean": round(sum(queries) / len(queries), 1) if queries else None,
+        "queries_max": max(queries) if queries else None,
+    }
+
+
+def run_route(sessions, build, total, warmup, seed):
+    """Send `warmup` untimed and then `total` timed requests, one worker thread per session."""
+    remaining = [warmup + total]
+    lock = threading.Lock()
+    samples = []
+    # first timed start and last timed finish, so throughput ignores the warmup
+    span = [float("inf"), 0.0]
+
+    def worker(index, session):
+        rng = random.Random(seed * 1000 + index)
+        while True:
+            with lock:
+                if remaining[0] == 0:
+                    return
+                remaining[0] -= 1
+                timed = remaining[0] < total
+
+            method, path, data = build(rng)
+            started = time.perf_counter()
+            try:
+                status, headers = session.request(method, path, data)
+                queries = headers.get("X-SQL-Queries")
+            except Exception:
+                status, queries = None, None
+            finished = time.perf_counter()
+
+            if timed:
+                with lock:
+                    samples.append((finished - started, status, int(queries) if queries is not None else None))
+                    span[0] = min(span[0], started)
+                    span[1] = max(span[1], finished)
+
+    with ThreadPoolExecutor(max_workers=len(sessions)) as pool:
+        for future in [pool.submit(worker, index, session) for index, session in enumerate(sessions)]:
+            future.result()
+
+    return samples, max(span[1] - span[0], 0.0)
+
+
+def commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server; the test client is used when omitted.")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="Test client only; defaults to $DATABASE_URL.")
+    parser.add_argument("--routes", nargs="+", choices=ROUTES, default=list(ROUTES))
+    parser.add_argument("--requests", type=int, default=500, help="Timed requests per route.")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed requests per route.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--teachers", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--skew", type=float, default=1.1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the report here instead of stdout.")
+    args = parser.parse_args()
+
+    if args.url:
+        new_session = lambda: HttpSession(args.url)
+    else:
+        if not args.database_url:
+            parser.error("--url, --database-url or $DATABASE_URL is required")
+
+        os.environ["DATABASE_URL"] = args.database_url
+        os.environ.setdefault("SECRET_KEY", "benchmark")
+        os.environ["SQL_INSTRUMENTATION"] = "1"
+        # every session logs in from the same address, which the login limits would soon reject
+        os.environ.setdefault("RATELIMIT_ENABLED", "0")
+
+        from blueprintapp.app import create_app
+        app = create_app()
+        new_session = lambda: ClientSession(app)
+
+    scenarios = Scenarios(args)
+    rng = random.Random(args.seed)
+
+    sessions = []
+    for _ in range(args.concurrency):
+        session = new_session()
+        status, _ = session.request("POST", "/auth/login", scenarios.credentials(rng))
+        if status != 302:
+            raise SystemExit(f"Login failed with status {status}; is the database seeded by benchmarks.dataset?")
+        sessions.append(session)
+
+    routes = {}
+    for route in args.routes:
+        samples, seconds = run_route(sessions, getattr(scenarios, route), args.requests, args.warmup, args.seed)
+        routes[route] = summarize(samples, seconds)
+
+    report = {
+        "commit": commit(),
+        "driver": "http" if args.url else "client",
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "requests_per_route": args.requests,
+        "routes": routes,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
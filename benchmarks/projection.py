@@ -0,0 +1,117 @@
+"""Compare loading review listings as ORM objects and as column projections.
+
+    python -m benchmarks.projection --rows 100000 --repeat 5
+
+Fills a throwaway SQLite database with `--rows` teacher reviews, then loads
+them all both ways. Prints one JSON object per mode with the best wall time
+and the peak memory allocated while the result list is alive.
+"""
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+
+def build_app(path):
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+
+    from blueprintapp.app import create_app
+    return create_app()
+
+
+def fill(rows):
+    from sqlalchemy import insert
+
+    from blueprintapp.app import db
+    from blueprintapp.blueprints.auth.models import User
+    from blueprintapp.blueprints.admin.models import Teacher, Discipline
+    from blueprintapp.blueprints.reviews.models import TeacherReview
+
+    db.create_all(bind_key=None)
+
+    db.session.add_all([
+        User(id=1, username="bench", email="bench@example.com", passwordHash="-"),
+        Teacher(id=1, name="Ivan", surname="Petrov"),
+        Discipline(id=1, name="Mathematics", faculty="Faculty of Mathematics and Cybernetics", type="mandatory"),
+    ])
+    db.session.commit()
+
+    today = date.today()
+    batch = []
+    for i in range(rows):
+        batch.append({
+            "user_id": 1, "teacher_id": 1, "discipline_id": 1,
+            "name": "Ivan", "surname": "Petrov", "discipline_name": "Mathematics",
+            "difficulty": ("easy", "medium", "hard")[i % 3], "rating": i % 10 + 1,
+            "feedback": f"Review number {i}: clear lectures, fair exam, a lot of homework.",
+            "time": today - timedelta(days=i % 365),
+        })
+        if len(batch) == 10000:
+            db.session.execute(insert(TeacherReview.__table__), batch)
+            batch = []
+    if batch:
+        db.session.execute(insert(TeacherReview.__table__), batch)
+    db.session.commit()
+
+
+def measure(load, repeat):
+    from blueprintapp.app import db
+
+    best = float("inf")
+    for _ in range(repeat):
+        db.session.expunge_all()
+        gc.collect()
+        started = time.perf_counter()
+        result = load()
+        best = min(best, time.perf_counter() - started)
+        del result
+
+    db.session.expunge_all()
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return len(result), best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = build_app(os.path.join(directory, "projection.db"))
+
+        with app.app_context():
+            from blueprintapp.app import db
+            from blueprintapp.blueprints.reviews.models import TeacherReview
+            from blueprintapp.blueprints.reviews.projections import user_reviews_query
+
+            fill(args.rows)
+
+            modes = {
+                "orm": lambda: TeacherReview.query.filter_by(user_id=1).order_by(TeacherReview.id).all(),
+                "projection": lambda: db.session.execute(user_reviews_query(TeacherReview, 1)).all(),
+            }
+
+            for mode, load in modes.items():
+                rows, seconds, peak = measure(load, args.repeat)
+                print(json.dumps({
+                    "mode": mode,
+                    "rows": rows,
+                    "seconds": round(seconds, 3),
+                    "us_per_row": round(seconds / rows * 1e6, 2),
+                    "peak_mb": round(peak / 2 ** 20, 1),
+                }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Measure how long a fresh worker takes to serve its first pages, with and without compiled templates.
+
+    python -m benchmarks.startup --database-url sqlite:///bench.db --runs 5
+
+Each run starts a new Python process, creates the app and requests --paths
+in order through the test client. The "cold" runs use an empty template
+cache directory, like a worker right after a deploy without precompiling;
+the "precompiled" runs use a directory filled by `flask templates precompile`.
+Prints the median of each timing over --runs as JSON.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PATHS = ("/", "/auth/login", "/auth/signup", "/auth/forgot_password")
+
+
+def child(paths):
+    from blueprintapp.app import create_app
+    from blueprintapp.instrumentation import startup
+
+    app = create_app()
+    client = app.test_client()
+
+    timings = {}
+    for path in paths:
+        started = time.perf_counter()
+        response = client.get(path)
+        response.close()
+        timings[path] = round((time.perf_counter() - started) * 1000, 2)
+
+    with app.app_context():
+        from blueprintapp.templating import stats
+        templates = stats()
+
+    print(json.dumps({**startup, "requests_ms": timings, "templates": templates}))
+
+
+def run(env, paths):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--child", *paths],
+        env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def median(results, *keys):
+    values = []
+    for result in results:
+        for key in keys:
+            result = result[key]
+        values.append(result)
+    return round(statistics.median(values), 2)
+
+
+def summarize(results, paths):
+    return {
+        "create_app_ms": median(results, "create_app_ms"),
+        "first_response_ms": median(results, "first_response_ms"),
+        "requests_ms": {path: median(results, "requests_ms", path) for path in paths},
+        "templates_compiled": median(results, "templates", "misses"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="Defaults to $DATABASE_URL.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", nargs="+", metavar="PATH", help=argparse.SUPPRESS)
+    parser.add_argument("--paths", nargs="+", default=list(PATHS))
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    if not args.database_url:
+        parser.error("--database-url or $DATABASE_URL is required")
+
+    env = dict(os.environ, DATABASE_URL=args.database_url)
+    env.setdefault("SECRET_KEY", "benchmark")
+
+    report = {}
+    with tempfile.TemporaryDirectory() as directory:
+        env["TEMPLATE_CACHE_DIR"] = directory
+
+        cold = []
+        for _ in range(args.runs):
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+            cold.append(run(env, args.paths))
+        report["cold"] = summarize(cold, args.paths)
+
+        subprocess.run(
+            [sys.executable, "-m", "flask", "--app", "blueprintapp.app:create_app", "templates", "precompile", "--clean"],
+            env=env, capture_output=True, check=True
+        )
+        report["precompiled"] = summarize([run(env, args.paths) for _ in range(args.runs)], args.paths)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import os
+import time
 
-from flask import Flask, redirect, url_for
+from flask import Flask, redirect, url_for, request, jsonify
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
@@ -8,42 +9,174 @@ from flask_bcrypt import Bcrypt
 
 from dotenv import load_dotenv
 
+from blueprintapp.routing import RoutingSession, engine_options
+
 load_dotenv()
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 bcrypt = Bcrypt()
 
 def create_app():
-    app = Flask(__name__, template_folder="templates", static_folder="templates/assets")
+    started = time.perf_counter()
+
+    app = Flask(__name__, template_folder="templates", static_folder="static")
 
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options('DATABASE', os.getenv('DATABASE_URL'))
+    del app.config['SQLALCHEMY_ENGINE_OPTIONS']['url']
+
+    # DATABASE_REPLICA_URLS=url1,url2 adds binds replica_0, replica_1, ... used by routing.RoutingSession
+    replica_urls = [url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+    app.config['SQLALCHEMY_BINDS'] = {
+        f'replica_{index}': engine_options('DATABASE_REPLICA', url) for index, url in enumerate(replica_urls)
+    }
+    app.config['DATABASE_REPLICA_RETRY_AFTER'] = float(os.getenv('DATABASE_REPLICA_RETRY_AFTER', 30))
     app.secret_key = os.getenv('SECRET_KEY')
 
+    app.config['ADMIN_EMAILS'] = [email.strip().lower() for email in os.getenv('ADMIN_EMAILS', '').split(',') if email.strip()]
+
+    app.config['SQL_INSTRUMENTATION'] = os.getenv('SQL_INSTRUMENTATION', '').lower() in ('1', 'true', 'yes')
+    app.config['SQL_SLOW_QUERY_MS'] = float(os.getenv('SQL_SLOW_QUERY_MS', 100))
+    app.config['SQL_N_PLUS_ONE_THRESHOLD'] = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', 3))
+
+    app.config['BCRYPT_LOG_ROUNDS'] = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+    app.config['BCRYPT_POOL_SIZE'] = int(os.getenv('BCRYPT_POOL_SIZE', os.cpu_count() or 1))
+    app.config['BCRYPT_QUEUE_DEPTH'] = int(os.getenv('BCRYPT_QUEUE_DEPTH', 16))
+    app.config['BCRYPT_TIMEOUT'] = float(os.getenv('BCRYPT_TIMEOUT', 5))
+
+    # cookie keeps Flask's signed cookie session; memory, sql or redis keep the data server-side
+    app.config['SESSION_BACKEND'] = os.getenv('SESSION_BACKEND', 'sql').lower()
+    app.config['SESSION_REDIS_URL'] = os.getenv('SESSION_REDIS_URL', 'redis://localhost:6379/0')
+    app.config['SESSION_TTL'] = int(os.getenv('SESSION_TTL', 86400))
+    app.config['SESSION_SWEEP_INTERVAL'] = float(os.getenv('SESSION_SWEEP_INTERVAL', 300))
+
+    # "<key>:<count>/<period>" joined with ";", key is ip, email or session (the signup/reset being verified)
+    app.config['RATELIMIT_ENABLED'] = os.getenv('RATELIMIT_ENABLED', '1').lower() in ('1', 'true', 'yes')
+    app.config['RATELIMIT_STORAGE_URL'] = os.getenv('RATELIMIT_STORAGE_URL')
+    app.config['RATELIMIT_MAX_KEYS'] = int(os.getenv('RATELIMIT_MAX_KEYS', 100000))
+    # number of reverse proxies in front of the app; the ip key then comes from X-Forwarded-For
+    app.config['RATELIMIT_TRUSTED_PROXIES'] = int(os.getenv('RATELIMIT_TRUSTED_PROXIES', 0))
+    app.config['RATELIMIT_LOGIN'] = os.getenv('RATELIMIT_LOGIN', 'ip:20/minute; email:10/minute')
+    app.config['RATELIMIT_SIGNUP'] = os.getenv('RATELIMIT_SIGNUP', 'ip:5/minute')
+    app.config['RATELIMIT_FORGOT_PASSWORD'] = os.getenv('RATELIMIT_FORGOT_PASSWORD', 'ip:5/minute; email:3/minute')
+    app.config['RATELIMIT_VERIFICATION'] = os.getenv('RATELIMIT_VERIFICATION', 'ip:20/minute; session:5/minute')
+
+    app.config['USER_CACHE_SIZE'] = int(os.getenv('USER_CACHE_SIZE', 1024))
+    app.config['USER_CACHE_TTL'] = int(os.getenv('USER_CACHE_TTL', 300))
+
+    app.config['REVIEWS_PAGE_SIZE'] = int(os.getenv('REVIEWS_PAGE_SIZE', 20))
+
+    app.config['REFERENCE_DATA_CHECK_INTERVAL'] = float(os.getenv('REFERENCE_DATA_CHECK_INTERVAL', 5))
+
+    app.config['ASSETS_BUILD_DIR'] = os.getenv('ASSETS_BUILD_DIR', os.path.join(app.root_path, 'static-build'))
+    app.config['ASSETS_URL_PATH'] = os.getenv('ASSETS_URL_PATH', '/assets')
+
+    # compiled template bytecode; an empty value compiles templates in memory on first use
+    app.config['TEMPLATE_CACHE_DIR'] = os.getenv('TEMPLATE_CACHE_DIR', os.path.join(app.root_path, 'template-cache'))
+
+    app.config['API_MAX_PAGE_SIZE'] = int(os.getenv('API_MAX_PAGE_SIZE', 100))
+    app.config['API_CACHE_CONTROL'] = os.getenv('API_CACHE_CONTROL', 'private, max-age=30, must-revalidate')
+
+    app.config['REVIEW_WRITE_BEHIND'] = os.getenv('REVIEW_WRITE_BEHIND', '').lower() in ('1', 'true', 'yes')
+    app.config['REVIEW_QUEUE_PATH'] = os.getenv('REVIEW_QUEUE_PATH', os.path.join(app.instance_path, 'review-queue.db'))
+    app.config['REVIEW_QUEUE_MAX'] = int(os.getenv('REVIEW_QUEUE_MAX', 10000))
+    app.config['REVIEW_BATCH_SIZE'] = int(os.getenv('REVIEW_BATCH_SIZE', 200))
+    app.config['REVIEW_FLUSH_INTERVAL'] = float(os.getenv('REVIEW_FLUSH_INTERVAL', 0.5))
+    app.config['REVIEW_ENQUEUE_TIMEOUT'] = float(os.getenv('REVIEW_ENQUEUE_TIMEOUT', 1))
+
+    # console prints messages (development); smtp sends them through MAIL_SMTP_HOST
+    app.config['MAIL_BACKEND'] = os.getenv('MAIL_BACKEND', 'console').lower()
+    app.config['MAIL_SENDER'] = os.getenv('MAIL_SENDER', 'TeacherRank <no-reply@teacherrank.local>')
+    app.config['MAIL_SMTP_HOST'] = os.getenv('MAIL_SMTP_HOST', 'localhost')
+    app.config['MAIL_SMTP_PORT'] = int(os.getenv('MAIL_SMTP_PORT', 25))
+    app.config['MAIL_SMTP_USERNAME'] = os.getenv('MAIL_SMTP_USERNAME')
+    app.config['MAIL_SMTP_PASSWORD'] = os.getenv('MAIL_SMTP_PASSWORD')
+    app.config['MAIL_SMTP_STARTTLS'] = os.getenv('MAIL_SMTP_STARTTLS', '').lower() in ('1', 'true', 'yes')
+    app.config['MAIL_SMTP_TIMEOUT'] = float(os.getenv('MAIL_SMTP_TIMEOUT', 10))
+    app.config['MAIL_QUEUE_PATH'] = os.getenv('MAIL_QUEUE_PATH', os.path.join(app.instance_path, 'mail-queue.db'))
+    app.config['MAIL_WORKERS'] = int(os.getenv('MAIL_WORKERS', 2))
+    app.config['MAIL_BATCH_SIZE'] = int(os.getenv('MAIL_BATCH_SIZE', 20))
+    app.config['MAIL_POLL_INTERVAL'] = float(os.getenv('MAIL_POLL_INTERVAL', 1))
+    app.config['MAIL_MAX_ATTEMPTS'] = int(os.getenv('MAIL_MAX_ATTEMPTS', 8))
+    app.config['MAIL_RETRY_BACKOFF'] = float(os.getenv('MAIL_RETRY_BACKOFF', 5))
+    app.config['MAIL_RETRY_MAX_DELAY'] = float(os.getenv('MAIL_RETRY_MAX_DELAY', 600))
+
+    app.config['FRAGMENT_CACHE_URL'] = os.getenv('FRAGMENT_CACHE_URL')
+    app.config['FRAGMENT_CACHE_SIZE'] = int(os.getenv('FRAGMENT_CACHE_SIZE', 512))
+    app.config['FRAGMENT_CACHE_TTL'] = int(os.getenv('FRAGMENT_CACHE_TTL', 600))
+
+    app.config['LEADERBOARD_SIZE'] = int(os.getenv('LEADERBOARD_SIZE', 10))
+    app.config['LEADERBOARD_MAX_SIZE'] = int(os.getenv('LEADERBOARD_MAX_SIZE', 100))
+    app.config['LEADERBOARD_TTL'] = int(os.getenv('LEADERBOARD_TTL', 60))
+    app.config['LEADERBOARD_VERSION_CHECK_INTERVAL'] = float(os.getenv('LEADERBOARD_VERSION_CHECK_INTERVAL', 5))
+    app.config['LEADERBOARD_MAX_ENTRIES'] = int(os.getenv('LEADERBOARD_MAX_ENTRIES', 256))
+    app.config['LEADERBOARD_TRENDING_DAYS'] = int(os.getenv('LEADERBOARD_TRENDING_DAYS', 14))
+    app.config['LEADERBOARD_TRENDING_BASELINE_DAYS'] = int(os.getenv('LEADERBOARD_TRENDING_BASELINE_DAYS', 60))
+
     db.init_app(app)
-    bcrypt = Bcrypt(app)
+
+    from blueprintapp import routing
+    routing.init_app(app, db)
+
+    from blueprintapp import instrumentation
+    instrumentation.init_app(app)
+
+    bcrypt.init_app(app)
+
+    from blueprintapp.blueprints.auth import hashing
+    hashing.init_app(app)
+
+    from blueprintapp.blueprints.auth import ratelimit
+    ratelimit.init_app(app)
 
     login_manager = LoginManager()
     login_manager.init_app(app)
 
-    from blueprintapp.blueprints.auth.models import User
-    @login_manager.user_loader
-    def load_user(uid):
-        return User.query.get(int(uid))
+    from blueprintapp.blueprints.auth import identity
+    identity.init_app(app)
+    login_manager.user_loader(identity.load_user)
     
     @login_manager.unauthorized_handler
     def unauthorized():
+        if request.blueprint == "api":
+            return jsonify(error="unauthorized"), 401
         return redirect(url_for("auth.login"))
 
     from blueprintapp.blueprints.core.routes import core
     from blueprintapp.blueprints.auth.routes import auth
     from blueprintapp.blueprints.reviews.routes import reviews
     from blueprintapp.blueprints.admin.routes import admin
+    from blueprintapp.blueprints.api.routes import api
 
     app.register_blueprint(core, url_prefix="/")
     app.register_blueprint(auth, url_prefix="/auth")
     app.register_blueprint(reviews, url_prefix="/reviews")
     app.register_blueprint(admin, url_prefix="/admin")
+    app.register_blueprint(api, url_prefix="/api/v1")
+
+    from blueprintapp.blueprints.reviews import leaderboard
+    leaderboard.init_app(app)
+
+    from blueprintapp.blueprints.reviews import writebehind
+    writebehind.init_app(app)
+
+    from blueprintapp import mail
+    mail.init_app(app)
+
+    from blueprintapp import templating
+    templating.init_app(app)
+
+    from blueprintapp import assets
+    assets.init_app(app)
+
+    from blueprintapp import fragments
+    fragments.init_app(app)
+
+    from blueprintapp import sessions
+    sessions.init_app(app)
 
     migrate = Migrate(app, db)
 
+    instrumentation.track_startup(app, started)
+
     return app
\ No newline at end of file
@@ -0,0 +1,171 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import shutil
+
+import click
+from flask import current_app, request, send_from_directory, url_for
+from flask.cli import AppGroup
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST = "manifest.json"
+
+COMPRESSIBLE = {".css", ".js", ".svg", ".ttf", ".eot", ".json", ".txt", ".html"}
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+CSS_URL = re.compile(r"""url\((['"]?)([^'")]+)\1\)""")
+
+assets_cli = AppGroup("assets", help="Build fingerprinted static assets.")
+
+_manifest = {}
+
+
+def init_app(app):
+    """Serve the built assets and expose asset_url() to templates.
+
+    Without a build the helper falls back to the plain static files, so a
+    fresh checkout works before `flask assets build` has been run.
+    """
+    _manifest.clear()
+    _manifest.update(load_manifest(app.config["ASSETS_BUILD_DIR"]))
+
+    app.add_url_rule(app.config["ASSETS_URL_PATH"] + "/<path:filename>", "assets", serve_asset)
+    app.jinja_env.globals["asset_url"] = asset_url
+    app.cli.add_command(assets_cli)
+
+
+def load_manifest(build_dir):
+    try:
+        with open(os.path.join(build_dir, MANIFEST), encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def asset_url(filename):
+    hashed = _manifest.get(filename)
+    if hashed is None:
+        return url_for("static", filename=filename)
+    return url_for("assets", filename=hashed)
+
+
+def serve_asset(filename):
+    build_dir = current_app.config["ASSETS_BUILD_DIR"]
+    accepted = request.accept_encodings
+
+    # pick the best precompressed variant the client accepts
+    for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+        if accepted[encoding] and os.path.isfile(os.path.join(build_dir, filename + suffix)):
+            mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            response = send_from_directory(build_dir, filename + suffix, mimetype=mimetype)
+            response.content_encoding = encoding
+            break
+    else:
+        response = send_from_directory(build_dir, filename)
+
+    # the name changes whenever the content does, so the file never needs revalidating
+    response.headers["Cache-Control"] = IMMUTABLE
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def fingerprint(path, content):
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    root, ext = posixpath.splitext(path)
+    return f"{root}.{digest}{ext}"
+
+
+def rewrite_css(path, content, manifest):
+    """Point relative url() references in a stylesheet at their fingerprinted names."""
+    directory = posixpath.dirname(path)
+
+    def replace(match):
+        quote, target = match.groups()
+        if target.startswith(("data:", "http:", "https:", "//", "/", "#")):
+            return match.group(0)
+
+        suffix = ""
+        for separator in ("#", "?"):
+            if separator in target:
+                target, rest = target.split(separator, 1)
+                suffix = separator + rest + suffix
+
+        hashed = manifest.get(posixpath.normpath(posixpath.join(directory, target)))
+        if hashed is None:
+            return match.group(0)
+        return f"url({quote}{posixpath.relpath(hashed, directory)}{suffix}{quote})"
+
+    return CSS_URL.sub(replace, content.decode("utf-8")).encode("utf-8")
+
+
+def write_variants(target, content, level):
+    with open(target, "wb") as file:
+        file.write(content)
+
+    if posixpath.splitext(target)[1] not in COMPRESSIBLE:
+        return
+
+    with open(target + ".gz", "wb") as file:
+        file.write(gzip.compress(content, compresslevel=level, mtime=0))
+    if brotli is not None:
+        with open(target + ".br", "wb") as file:
+            file.write(brotli.compress(content, quality=11))
+
+
+def build(source, build_dir, level=9):
+    """Copy every file under `source` into `build_dir` under a content-hashed name.
+
+    Stylesheets are processed last so their url() references can be rewritten
+    to the hashed names of the fonts and images they load. Returns the manifest.
+    """
+    paths = []
+    for root, _, files in os.walk(source):
+        for name in files:
+            paths.append(os.path.relpath(os.path.join(root, name), source).replace(os.sep, "/"))
+    paths.sort(key=lambda path: (path.endswith(".css"), path))
+
+    manifest = {}
+    for path in paths:
+        with open(os.path.join(source, path), "rb") as file:
+            content = file.read()
+        if path.endswith(".css"):
+            content = rewrite_css(path, content, manifest)
+
+        hashed = fingerprint(path, content)
+        target = os.path.join(build_dir, hashed)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        write_variants(target, content, level)
+
+        manifest[path] = hashed
+
+    with open(os.path.join(build_dir, MANIFEST), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+
+    return manifest
+
+
+@assets_cli.command("build")
+@click.option("--clean", is_flag=True, help="Remove earlier builds first.")
+def build_command(clean):
+    """Fingerprint and precompress the static assets."""
+    source = current_app.static_folder
+    build_dir = current_app.config["ASSETS_BUILD_DIR"]
+
+    if clean and os.path.isdir(build_dir):
+        shutil.rmtree(build_dir)
+
+    manifest = build(source, build_dir)
+
+    _manifest.clear()
+    _manifest.update(manifest)
+
+    click.echo(f"Built {len(manifest)} assets into {build_dir}" + ("" if brotli else " (brotli not installed, gzip only)"))
@@ -0,0 +1,87 @@
+import csv
+import io
+import itertools
+import json
+import zlib
+
+from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+
+KINDS = {"teacher_reviews": 0, "discipline_reviews": 1}
+
+COLUMNS = {
+    0: ("id", "user_id", "teacher_id", "discipline_id", "name", "surname", "discipline_name", "difficulty", "rating", "feedback", "time"),
+    1: ("id", "user_id", "discipline_id", "name", "difficulty", "rating", "feedback", "time"),
+}
+
+FILTERS = ("teacher_id", "discipline_id", "difficulty", "rating", "time", "faculty", "type", "q")
+
+CHUNK_SIZE = 64 * 1024
+
+
+def export_query(kind, filters):
+    """Build the query for an export; raises ValueError for an unusable filter value before anything is sent."""
+    from blueprintapp.blueprints.reviews.routes import reviews_query
+
+    call = KINDS[kind]
+    model = (TeacherReview, DisciplineReview)[call]
+
+    query = reviews_query(**filters, call=call)
+    return query.with_entities(*(getattr(model, column) for column in COLUMNS[call]))
+
+
+def export_rows(query, batch_size=1000):
+    """Yield plain tuples for every matching review, fetched `batch_size` rows at a time.
+
+    yield_per() turns on stream_results, so PostgreSQL serves the rows from a
+    server-side cursor instead of buffering the whole result in the client.
+    """
+    yield from query.yield_per(batch_size)
+
+
+def _chunked(pieces):
+    buffer = io.StringIO()
+    for piece in pieces:
+        buffer.write(piece)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def as_csv(columns, rows):
+    def lines():
+        line = io.StringIO()
+        writer = csv.writer(line)
+        for row in itertools.chain([columns], rows):
+            writer.writerow(row)
+            yield line.getvalue()
+            line.seek(0)
+            line.truncate()
+    return _chunked(lines())
+
+
+def as_jsonl(columns, rows):
+    return _chunked(
+        json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str) + "\n"
+        for row in rows
+    )
+
+
+def gzipped(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_stream(kind, filters, format="csv", compress=False):
+    """Chunks of the export; the query is built here, so bad filters raise ValueError before the first chunk."""
+    columns = COLUMNS[KINDS[kind]]
+    rows = export_rows(export_query(kind, filters))
+
+    chunks = as_csv(columns, rows) if format == "csv" else as_jsonl(columns, rows)
+    return gzipped(chunks) if compress else chunks
@@ -0,0 +1,328 @@
+import csv
+import io
+import itertools
+import json
+import time
+from datetime import date
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import sqlite
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.models import Teacher, Discipline, teacher_discipline
+from blueprintapp.blueprints.admin.versions import REFERENCE, bump_version
+from blueprintapp.blueprints.auth.models import User
+from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+from blueprintapp.blueprints.reviews.aggregates import apply_reviews
+from blueprintapp.blueprints.reviews.validation import check_difficulty, parse_rating
+
+
+class ImportFileError(ValueError):
+    """The file as a whole cannot be imported, e.g. its CSV header lacks a column."""
+
+
+class ImportSpec:
+    """How one kind of input row maps onto a table.
+
+    `fields` are the input columns every row must fill and `optional` the
+    ones it may leave empty. `key` is the unique key used for upserts and
+    `update` the columns overwritten when a row with that key already
+    exists. Reviews have no key and are always appended.
+    """
+
+    def __init__(self, table, columns, fields, optional=(), key=(), update=(), convert=None, resolve=None, review_model=None):
+        self.table = table
+        self.columns = columns
+        self.fields = fields
+        self.optional = optional
+        self.key = key
+        self.update = update
+        self.convert = convert
+        self.resolve = resolve
+        self.review_model = review_model
+
+
+def read_rows(stream, format, fields=()):
+    """Yield (line number, row); a CSV header lacking any of `fields` fails before the first row."""
+    if format == "csv":
+        reader = csv.DictReader(stream)
+        missing = [field for field in fields if field not in (reader.fieldnames or ())]
+        if missing:
+            raise ImportFileError(f"the CSV header lacks {', '.join(missing)}")
+        for row in reader:
+            yield reader.line_num, row
+    else:
+        for number, line in enumerate(stream, 1):
+            if line.strip():
+                try:
+                    yield number, json.loads(line)
+                except ValueError:
+                    yield number, None
+
+
+def batched(rows, size):
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def clean_row(spec, row):
+    """Return the row's fields as strings, converted by the spec; raises ValueError saying what is wrong."""
+    if not isinstance(row, dict):
+        raise ValueError("not a JSON object")
+
+    cleaned = {}
+    for field in (*spec.fields, *spec.optional):
+        value = row.get(field)
+        cleaned[field] = None if value is None else str(value)
+
+    missing = [field for field in spec.fields if not (cleaned[field] or "").strip()]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+
+    if spec.convert:
+        cleaned.update(spec.convert(cleaned))
+    return cleaned
+
+
+def lookup(model, column, values, *fields):
+    """Map one unique column to rows of (id, *fields) for one batch, so memory does not grow with the input file."""
+    values = {value for value in values if value is not None}
+    if not values:
+        return {}
+
+    key = getattr(model, column)
+    rows = db.session.execute(select(key, model.id, *fields).where(key.in_(values)))
+    return {row[0]: row for row in rows}
+
+
+def unknown_reference(row, **found):
+    for field, records in found.items():
+        if row[field] not in records:
+            return f"unknown {field} {row[field]!r}"
+    return None
+
+
+def resolve_assignments(rows, skip):
+    teachers = lookup(Teacher, "external_id", (row["teacher_external_id"] for _, row in rows))
+    disciplines = lookup(Discipline, "external_id", (row["discipline_external_id"] for _, row in rows))
+
+    for line, row in rows:
+        if reason := unknown_reference(row, teacher_external_id=teachers, discipline_external_id=disciplines):
+            skip(line, reason)
+            continue
+        yield {
+            "teacher_id": teachers[row["teacher_external_id"]].id,
+            "discipline_id": disciplines[row["discipline_external_id"]].id,
+        }
+
+
+def review_fields(row):
+    difficulty = check_difficulty(row["difficulty"])
+    rating = parse_rating(row["rating"])
+
+    try:
+        time = date.fromisoformat(row["time"]) if row["time"] else date.today()
+    except ValueError:
+        raise ValueError(f"time {row['time']!r} is not a YYYY-MM-DD date") from None
+
+    return {"difficulty": difficulty, "rating": rating, "feedback": row["feedback"] or "", "time": time}
+
+
+def review_columns(row):
+    return {column: row[column] for column in REVIEW_COLUMNS}
+
+
+def resolve_teacher_reviews(rows, skip):
+    users = lookup(User, "email", (row["user_email"] for _, row in rows))
+    teachers = lookup(Teacher, "external_id", (row["teacher_external_id"] for _, row in rows), Teacher.name, Teacher.surname)
+    disciplines = lookup(Discipline, "external_id", (row["discipline_external_id"] for _, row in rows), Discipline.name)
+
+    for line, row in rows:
+        if reason := unknown_reference(row, user_email=users, teacher_external_id=teachers, discipline_external_id=disciplines):
+            skip(line, reason)
+            continue
+        teacher = teachers[row["teacher_external_id"]]
+        discipline = disciplines[row["discipline_external_id"]]
+        yield {
+            "user_id": users[row["user_email"]].id,
+            "teacher_id": teacher.id,
+            "discipline_id": discipline.id,
+            "name": teacher.name,
+            "surname": teacher.surname,
+            "discipline_name": discipline.name,
+            **review_columns(row),
+        }
+
+
+def resolve_discipline_reviews(rows, skip):
+    users = lookup(User, "email", (row["user_email"] for _, row in rows))
+    disciplines = lookup(Discipline, "external_id", (row["discipline_external_id"] for _, row in rows), Discipline.name)
+
+    for line, row in rows:
+        if reason := unknown_reference(row, user_email=users, discipline_external_id=disciplines):
+            skip(line, reason)
+            continue
+        discipline = disciplines[row["discipline_external_id"]]
+        yield {
+            "user_id": users[row["user_email"]].id,
+            "discipline_id": discipline.id,
+            "name": discipline.name,
+            **review_columns(row),
+        }
+
+
+def resolve_columns(columns):
+    def resolve(rows, skip):
+        for _, row in rows:
+            yield {column: row[column] for column in columns}
+    return resolve
+
+
+REVIEW_COLUMNS = ("difficulty", "rating", "feedback", "time")
+
+SPECS = {
+    "teachers": ImportSpec(
+        Teacher.__table__, ("external_id", "name", "surname"),
+        fields=("external_id", "name", "surname"),
+        key=("external_id",), update=("name", "surname"),
+        resolve=resolve_columns(("external_id", "name", "surname"))
+    ),
+    "disciplines": ImportSpec(
+        Discipline.__table__, ("external_id", "name", "faculty", "type"),
+        fields=("external_id", "name", "faculty", "type"),
+        key=("external_id",), update=("name", "faculty", "type"),
+        resolve=resolve_columns(("external_id", "name", "faculty", "type"))
+    ),
+    "assignments": ImportSpec(
+        teacher_discipline, ("teacher_id", "discipline_id"),
+        fields=("teacher_external_id", "discipline_external_id"),
+        key=("teacher_id", "discipline_id"),
+        resolve=resolve_assignments
+    ),
+    "teacher-reviews": ImportSpec(
+        TeacherReview.__table__, ("user_id", "teacher_id", "discipline_id", "name", "surname", "discipline_name", *REVIEW_COLUMNS),
+        fields=("user_email", "teacher_external_id", "discipline_external_id", "difficulty", "rating"),
+        optional=("feedback", "time"),
+        convert=review_fields, resolve=resolve_teacher_reviews, review_model=TeacherReview
+    ),
+    "discipline-reviews": ImportSpec(
+        DisciplineReview.__table__, ("user_id", "discipline_id", "name", *REVIEW_COLUMNS),
+        fields=("user_email", "discipline_external_id", "difficulty", "rating"),
+        optional=("feedback", "time"),
+        convert=review_fields, resolve=resolve_discipline_reviews, review_model=DisciplineReview
+    ),
+}
+
+
+def write_batch(spec, rows):
+    connection = db.session.connection()
+    dialect = connection.dialect.name
+
+    if dialect == "postgresql":
+        copy_batch(spec, rows, connection)
+        return
+
+    if dialect == "sqlite" and spec.key:
+        statement = sqlite.insert(spec.table)
+        if spec.update:
+            statement = statement.on_conflict_do_update(
+                index_elements=spec.key,
+                set_={column: statement.excluded[column] for column in spec.update}
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=spec.key)
+    else:
+        statement = insert(spec.table)
+
+    # a list of parameter dicts runs as a single executemany()
+    connection.execute(statement, rows)
+
+
+def copy_batch(spec, rows, connection):
+    """COPY the batch into a temp table, then merge it into the target in one statement."""
+    name = spec.table.name
+    columns = ", ".join(spec.columns)
+    staging = f"import_{name}"
+
+    connection.exec_driver_sql(
+        f"CREATE TEMP TABLE IF NOT EXISTS {staging} AS SELECT {columns} FROM {name} WITH NO DATA"
+    )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["" if row[column] is None else row[column] for column in spec.columns])
+    buffer.seek(0)
+
+    # COPY reads an unquoted empty field as NULL; for NOT NULL columns it must stay an empty string
+    options = "FORMAT csv"
+    not_null = [column for column in spec.columns if not spec.table.c[column].nullable]
+    if not_null:
+        options += f", FORCE_NOT_NULL ({', '.join(not_null)})"
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {staging} ({columns}) FROM STDIN WITH ({options})", buffer)
+    finally:
+        cursor.close()
+
+    if spec.key:
+        # ON CONFLICT may touch each target row only once per statement
+        key = ", ".join(spec.key)
+        merge = f"INSERT INTO {name} ({columns}) SELECT DISTINCT ON ({key}) {columns} FROM {staging} ON CONFLICT ({key}) "
+        if spec.update:
+            merge += "DO UPDATE SET " + ", ".join(f"{column} = EXCLUDED.{column}" for column in spec.update)
+        else:
+            merge += "DO NOTHING"
+    else:
+        merge = f"INSERT INTO {name} ({columns}) SELECT {columns} FROM {staging}"
+
+    connection.exec_driver_sql(merge)
+    connection.exec_driver_sql(f"TRUNCATE {staging}")
+
+
+def import_rows(kind, rows, batch_size=1000, progress=None, skipped=None):
+    """Import (line number, row) pairs, as yielded by read_rows.
+
+    Rows that are malformed or refer to unknown users, teachers or
+    disciplines are left out and passed to `skipped(line, reason)`, so one
+    bad line neither aborts the import halfway nor goes unnoticed.
+    """
+    spec = SPECS[kind]
+
+    def skip(line, reason):
+        if skipped:
+            skipped(line, reason)
+
+    started = time.perf_counter()
+    read = written = 0
+
+    for batch in batched(rows, batch_size):
+        read += len(batch)
+
+        valid = []
+        for line, row in batch:
+            try:
+                valid.append((line, clean_row(spec, row)))
+            except ValueError as error:
+                skip(line, str(error))
+
+        resolved = list(spec.resolve(valid, skip))
+
+        if resolved:
+            write_batch(spec, resolved)
+            if spec.review_model is not None:
+                apply_reviews(spec.review_model, resolved)
+
+        if spec.review_model is None:
+            bump_version(REFERENCE)
+
+        # one transaction per batch keeps locks short and memory flat
+        db.session.commit()
+        written += len(resolved)
+
+        if progress:
+            progress(read, written, time.perf_counter() - started)
+
+    return read, written, time.perf_counter() - started
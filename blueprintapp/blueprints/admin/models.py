@@ -1,22 +1,31 @@
 from blueprintapp.app import db
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy import func, select
+from sqlalchemy import Float, case, cast
 
 from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
 
 teacher_discipline = db.Table(
     'teacher_discipline',
     db.Column('teacher_id', db.Integer, db.ForeignKey('teachers.id', ondelete='CASCADE'), primary_key=True),
-    db.Column('discipline_id', db.Integer, db.ForeignKey('disciplines.id', ondelete='CASCADE'), primary_key=True)
+    db.Column('discipline_id', db.Integer, db.ForeignKey('disciplines.id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_teacher_discipline_discipline_id', 'discipline_id')
 )
 
 
 class Teacher(db.Model):
     __tablename__ = 'teachers'
+    __table_args__ = (
+        db.UniqueConstraint('external_id', name='uq_teachers_external_id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(80), nullable=False)
     surname = db.Column(db.String(80), nullable=False)
+    # id in the system the data is imported from; two teachers may share a name
+    external_id = db.Column(db.String(64))
+
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     disciplines = db.relationship(
         "Discipline",
@@ -33,33 +42,37 @@ class Teacher(db.Model):
         return self.id
 
     def avg_rating_method(self):
-        if not self.reviews:
-            return 0
-        return round(sum(r.rating for r in self.reviews) / len(self.reviews), 2)
+        return self.avg_rating
 
     @hybrid_property
     def avg_rating(self):
-        if not self.reviews:
+        if not self.review_count:
             return 0
-        return round(sum(r.rating for r in self.reviews) / len(self.reviews), 2)
+        return round(self.rating_sum / self.review_count, 2)
 
     @avg_rating.expression
     def avg_rating(cls):
-        return (
-            select(func.coalesce(func.avg(TeacherReview.rating), 0))
-            .where(TeacherReview.teacher_id == cls.id)
-            .correlate(cls)
-            .scalar_subquery()
+        return case(
+            (cls.review_count > 0, cast(cls.rating_sum, Float) / cls.review_count),
+            else_=0
         )
 
 
 class Discipline(db.Model):
     __tablename__ = 'disciplines'
+    __table_args__ = (
+        db.Index('ix_disciplines_faculty_type', 'faculty', 'type'),
+        db.UniqueConstraint('external_id', name='uq_disciplines_external_id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(80), nullable=False)
     faculty = db.Column(db.String(80), nullable=False)
     type = db.Column(db.String(80), nullable=False)
+    external_id = db.Column(db.String(64))
+
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     teachers = db.relationship(
         "Teacher",
@@ -76,21 +89,27 @@ class Discipline(db.Model):
         return self.id
 
     def avg_rating_method(self):
-        if not self.reviews:
-            return 0
-        return round(sum(r.rating for r in self.reviews) / len(self.reviews), 2)
+        return self.avg_rating
 
     @hybrid_property
     def avg_rating(self):
-        if not self.reviews:
+        if not self.review_count:
             return 0
-        return round(sum(r.rating for r in self.reviews) / len(self.reviews), 2)
+        return round(self.rating_sum / self.review_count, 2)
 
     @avg_rating.expression
     def avg_rating(cls):
-        return (
-            select(func.coalesce(func.avg(DisciplineReview.rating), 0))
-            .where(DisciplineReview.discipline_id == cls.id)
-            .correlate(cls)
-            .scalar_subquery()
+        return case(
+            (cls.review_count > 0, cast(cls.rating_sum, Float) / cls.review_count),
+            else_=0
         )
+
+
+class DataVersion(db.Model):
+    __tablename__ = 'data_versions'
+
+    name = db.Column(db.String(40), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return f"<DataVersion {self.name}={self.version}>"
@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import namedtuple
+
+from flask import current_app
+from sqlalchemy import select
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.models import Teacher, Discipline, teacher_discipline
+from blueprintapp.blueprints.admin.versions import REFERENCE, get_version, on_version_bump
+
+TeacherRow = namedtuple("TeacherRow", "id name surname")
+DisciplineRow = namedtuple("DisciplineRow", "id name faculty type")
+
+
+class ReferenceData:
+    """Immutable snapshot of teachers, disciplines and who teaches what."""
+
+    __slots__ = ("version", "teachers", "disciplines", "teacher_by_id", "discipline_by_id", "teacher_disciplines")
+
+    def __init__(self, version, teachers, disciplines, pairs):
+        self.version = version
+        self.teachers = teachers
+        self.disciplines = disciplines
+        self.teacher_by_id = {teacher.id: teacher for teacher in teachers}
+        self.discipline_by_id = {discipline.id: discipline for discipline in disciplines}
+
+        adjacency = {}
+        for teacher_id, discipline_id in pairs:
+            adjacency.setdefault(teacher_id, set()).add(discipline_id)
+        self.teacher_disciplines = {teacher_id: frozenset(ids) for teacher_id, ids in adjacency.items()}
+
+    def teaches(self, teacher_id, discipline_id):
+        return discipline_id in self.teacher_disciplines.get(teacher_id, ())
+
+
+_snapshot = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def load_reference_data(version):
+    teachers = tuple(
+        TeacherRow(*row)
+        for row in db.session.query(Teacher.id, Teacher.name, Teacher.surname).order_by(Teacher.id)
+    )
+    disciplines = tuple(
+        DisciplineRow(*row)
+        for row in db.session.query(Discipline.id, Discipline.name, Discipline.faculty, Discipline.type).order_by(Discipline.id)
+    )
+    pairs = db.session.execute(
+        select(teacher_discipline.c.teacher_id, teacher_discipline.c.discipline_id)
+    ).all()
+
+    return ReferenceData(version, teachers, disciplines, pairs)
+
+
+def get_reference_data():
+    global _snapshot, _checked_at
+
+    snapshot = _snapshot
+    interval = current_app.config["REFERENCE_DATA_CHECK_INTERVAL"]
+
+    # other processes bump the version in the database; only look at it every `interval` seconds
+    if snapshot is not None and time.monotonic() - _checked_at < interval:
+        return snapshot
+
+    version = get_version(REFERENCE)
+
+    with _lock:
+        if _snapshot is None or _snapshot.version != version:
+            _snapshot = load_reference_data(version)
+        _checked_at = time.monotonic()
+
+        return _snapshot
+
+
+def invalidate_reference_data():
+    global _checked_at
+    _checked_at = 0.0
+
+
+@on_version_bump
+def reference_version_bumped(names):
+    if REFERENCE in names:
+        invalidate_reference_data()
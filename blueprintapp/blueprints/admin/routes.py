@@ -1,7 +1,178 @@
-from flask import Blueprint, render_template, redirect, url_for, request, session
+import click
+
+from functools import wraps
+
+from flask import Blueprint, render_template, redirect, url_for, request, session, abort, current_app, jsonify, Response, stream_with_context
 from flask_login import login_user, logout_user, current_user, login_required
 
 from blueprintapp.app import db
 from blueprintapp.blueprints.admin.models import Teacher, Discipline
+from blueprintapp.blueprints.admin.importer import SPECS, ImportFileError, import_rows, read_rows
+from blueprintapp.blueprints.admin.export import KINDS, FILTERS, export_stream
+from blueprintapp.blueprints.reviews.aggregates import rebuild_aggregates
+from blueprintapp.blueprints.reviews.models import TeacherDailyRating, DisciplineDailyRating, TeacherDistribution, DisciplineDistribution
+from blueprintapp.blueprints.reviews.rollups import rebuild_rollups
+from blueprintapp.blueprints.reviews.distributions import rebuild_distributions
+from blueprintapp.instrumentation import request_summary, startup
+from blueprintapp import fragments, mail, templating
+from blueprintapp.blueprints.auth import hashing, ratelimit
+from blueprintapp.blueprints.auth.identity import user_cache
+from blueprintapp.blueprints.reviews import leaderboard, writebehind
+
+admin = Blueprint("admin", __name__, template_folder="templates", cli_group=None) #static_folder="templates/admin/assets"
+
+
+def admin_required(view):
+    @wraps(view)
+    @login_required
+    def wrapper(*args, **kwargs):
+        if current_user.email.lower() not in current_app.config["ADMIN_EMAILS"]:
+            abort(403)
+        return view(*args, **kwargs)
+    return wrapper
+
+
+
+@admin.route("/sql_stats")
+@admin_required
+def sql_stats():
+    if not current_app.config["SQL_INSTRUMENTATION"]:
+        return jsonify(error="SQL instrumentation is disabled. Set SQL_INSTRUMENTATION=1 to enable it."), 404
+
+    return jsonify(request_summary())
+
+
+
+@admin.route("/cache_stats")
+@admin_required
+def cache_stats():
+    return jsonify(
+        users=user_cache.stats(),
+        leaderboards=leaderboard.cache.stats(),
+        fragments=fragments.cache.stats(),
+        password_hashing=hashing.stats(),
+        rate_limits=ratelimit.stats(),
+        review_queue=writebehind.stats(),
+        mail=mail.stats(),
+        templates=templating.stats(),
+        startup=dict(startup)
+    )
+
+
+
+@admin.route("/export/<kind>.<format>")
+@admin_required
+def export(kind, format):
+    if kind not in KINDS or format not in ("csv", "jsonl"):
+        abort(404)
+
+    filters = {key: request.args.get(key) for key in FILTERS if request.args.get(key)}
+    compress = request.args.get("gzip") == "1"
+
+    try:
+        chunks = export_stream(kind, filters, format, compress)
+    except ValueError:
+        abort(400)
+
+    filename = f"{kind}.{format}" + (".gz" if compress else "")
+    mimetype = "application/gzip" if compress else ("text/csv" if format == "csv" else "application/x-ndjson")
+
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+
+@admin.cli.command("recount-ratings")
+def recount_ratings():
+    """Recompute stored review counts and rating sums from the review tables."""
+    rebuild_aggregates()
+    click.echo(f"Recounted ratings for {Teacher.query.count()} teachers and {Discipline.query.count()} disciplines.")
+
+
+
+@admin.cli.command("rebuild-rollups")
+def rebuild_rollups_command():
+    """Recompute the daily rating rollups from the review tables."""
+    rebuild_rollups()
+    click.echo(f"Rebuilt {TeacherDailyRating.query.count()} teacher and {DisciplineDailyRating.query.count()} discipline daily rollups.")
+
+
+
+@admin.cli.command("rebuild-distributions")
+def rebuild_distributions_command():
+    """Recompute the rating and difficulty distributions from the review tables."""
+    rebuild_distributions()
+    click.echo(f"Rebuilt distributions for {TeacherDistribution.query.count()} teachers and {DisciplineDistribution.query.count()} disciplines.")
+
+
+
+@admin.cli.command("import")
+@click.argument("kind", type=click.Choice(sorted(SPECS)))
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "format", type=click.Choice(["csv", "jsonl"]), help="Input format, guessed from the file extension by default.")
+@click.option("--batch-size", default=1000, show_default=True, help="Rows written per transaction.")
+def import_data(kind, path, format, batch_size):
+    """Stream teachers, disciplines, assignments or reviews from a CSV/JSONL file.
+
+    \b
+    teachers            external_id, name, surname
+    disciplines         external_id, name, faculty, type
+    assignments         teacher_external_id, discipline_external_id
+    teacher-reviews     user_email, teacher_external_id, discipline_external_id,
+                        difficulty, rating, feedback, time
+    discipline-reviews  user_email, discipline_external_id, difficulty, rating,
+                        feedback, time
+
+    Teachers and disciplines are upserted on external_id, the id they have in
+    the system the file comes from; assignments are upserted and reviews
+    appended. Malformed rows and rows referring to unknown users, teachers or
+    disciplines are skipped and reported with their line number.
+    """
+    format = format or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+
+    def progress(read, written, elapsed):
+        click.echo(f"{read} rows read, {written} written ({read / elapsed:.0f} rows/s)")
+
+    def skipped(line, reason):
+        click.echo(f"{path}:{line}: skipped, {reason}", err=True)
+
+    with open(path, newline="", encoding="utf-8") as stream:
+        try:
+            read, written, elapsed = import_rows(kind, read_rows(stream, format, SPECS[kind].fields), batch_size, progress, skipped)
+        except ImportFileError as error:
+            raise click.ClickException(f"{path}: {error}")
+
+    click.echo(f"Imported {written} of {read} {kind} rows in {elapsed:.1f}s ({read / max(elapsed, 1e-9):.0f} rows/s); {read - written} skipped.")
+
+
+
+@admin.cli.command("export")
+@click.argument("kind", type=click.Choice(sorted(KINDS)))
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="Write to a file instead of stdout.")
+@click.option("--format", "format", type=click.Choice(["csv", "jsonl"]), default="csv", show_default=True)
+@click.option("--gzip", "compress", is_flag=True, help="Compress the output with gzip.")
+@click.option("--filter", "filters", multiple=True, metavar="KEY=VALUE", help=f"Same filters as the search pages: {', '.join(FILTERS)}.")
+def export_data(kind, output, format, compress, filters):
+    """Stream teacher or discipline reviews as CSV or JSONL."""
+    parsed = {}
+    for item in filters:
+        key, _, value = item.partition("=")
+        if key not in FILTERS:
+            raise click.BadParameter(f"unknown filter {key!r}", param_hint="--filter")
+        parsed[key] = value
+
+    try:
+        chunks = export_stream(kind, parsed, format, compress)
+    except ValueError as error:
+        raise click.BadParameter(str(error), param_hint="--filter")
 
-admin = Blueprint("admin", __name__, template_folder="templates") #static_folder="templates/admin/assets"
\ No newline at end of file
+    stream = open(output, "wb") if output else click.get_binary_stream("stdout")
+    try:
+        for chunk in chunks:
+            stream.write(chunk)
+    finally:
+        if output:
+            stream.close()
@@ -0,0 +1,75 @@
+from sqlalchemy import event, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.models import Teacher, Discipline, DataVersion
+
+REFERENCE = "reference"
+
+# called with the bumped names after the transaction that bumped them commits
+_listeners = []
+
+
+def on_version_bump(listener):
+    _listeners.append(listener)
+    return listener
+
+
+def bump_version(name, session=None):
+    session = session or db.session
+
+    versions = DataVersion.__table__
+    dialect = db.engine.dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        # one statement, so two transactions bumping a name that has no row yet cannot both insert it
+        statement = (postgresql if dialect == "postgresql" else sqlite).insert(versions).values(name=name, version=1)
+        session.execute(statement.on_conflict_do_update(index_elements=["name"], set_={"version": versions.c.version + 1}))
+    else:
+        result = session.execute(
+            update(versions).where(versions.c.name == name).values(version=versions.c.version + 1)
+        )
+        if result.rowcount == 0:
+            session.execute(versions.insert().values(name=name, version=1))
+
+    session.info.setdefault("bumped_versions", set()).add(name)
+
+
+def get_version(name):
+    return db.session.execute(select(DataVersion.version).where(DataVersion.name == name)).scalar() or 0
+
+
+def get_versions(*names):
+    rows = db.session.execute(select(DataVersion.name, DataVersion.version).where(DataVersion.name.in_(names)))
+    versions = dict.fromkeys(names, 0)
+    # Result has keys(), so dict.update() would treat it as a mapping
+    versions.update(rows.all())
+    return versions
+
+
+@event.listens_for(db.session, "before_flush")
+def bump_reference_version(session, flush_context, instances):
+    if session.info.get("bumping"):
+        return
+
+    changed = (*session.new, *session.dirty, *session.deleted)
+
+    if any(isinstance(obj, (Teacher, Discipline)) for obj in changed):
+        session.info["bumping"] = True
+        try:
+            bump_version(REFERENCE, session)
+        finally:
+            session.info["bumping"] = False
+
+
+@event.listens_for(db.session, "after_commit")
+def notify_version_bumps(session):
+    names = session.info.pop("bumped_versions", None)
+    if names:
+        for listener in _listeners:
+            listener(names)
+
+
+@event.listens_for(db.session, "after_rollback")
+def discard_version_bumps(session):
+    session.info.pop("bumped_versions", None)
@@ -0,0 +1,151 @@
+import hashlib
+import json
+from datetime import date
+from functools import wraps
+
+from flask import Blueprint, request, jsonify, current_app, abort, g
+from flask_login import login_required
+
+from blueprintapp.blueprints.admin.reference import get_reference_data
+from blueprintapp.blueprints.admin.versions import REFERENCE, get_versions
+from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+from blueprintapp.blueprints.reviews.leaderboard import get_leaderboard
+from blueprintapp.blueprints.reviews.distributions import get_distribution
+from blueprintapp.blueprints.reviews.routes import get_reviews
+from blueprintapp.routing import replica_reads
+
+api = Blueprint("api", __name__)
+
+REVIEW_COLUMNS = {
+    TeacherReview: ("id", "teacher_id", "discipline_id", "name", "surname", "discipline_name", "difficulty", "rating", "feedback", "time"),
+    DisciplineReview: ("id", "discipline_id", "name", "difficulty", "rating", "feedback", "time"),
+}
+
+REVIEW_FILTERS = {
+    TeacherReview: ("teacher_id", "discipline_id", "difficulty", "rating", "time", "q", "cursor"),
+    DisciplineReview: ("discipline_id", "faculty", "type", "difficulty", "rating", "time", "q", "cursor"),
+}
+
+
+def versioned(*names, daily=False):
+    """Answer with a strong ETag derived from the named data versions and the request.
+
+    The versions are read first (one small query), so a matching
+    If-None-Match is answered with 304 before the view does any real work.
+    With `daily`, the tag also changes at midnight, for data that depends on
+    the date as well as on writes. The versions are left in g.data_versions
+    for views that cache by version, so the body matches the tag.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            versions = get_versions(*names)
+            g.data_versions = versions
+            key = [request.endpoint, kwargs, sorted(request.args.items(multi=True)), versions]
+            if daily:
+                key.append(date.today().isoformat())
+            key = json.dumps(key)
+            etag = hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+            if request.if_none_match.contains(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = jsonify(view(*args, **kwargs))
+
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = current_app.config["API_CACHE_CONTROL"]
+            response.vary.add("Cookie")
+            return response
+        return wrapper
+    return decorator
+
+
+def rows(items, columns):
+    return [
+        {column: value.isoformat() if isinstance(value, date) else value for column, value in zip(columns, item)}
+        for item in items
+    ]
+
+
+@api.route("/teachers")
+@login_required
+@replica_reads()
+@versioned(REFERENCE)
+def teachers():
+    reference = get_reference_data()
+    return {
+        "items": [
+            {**teacher._asdict(), "discipline_ids": sorted(reference.teacher_disciplines.get(teacher.id, ()))}
+            for teacher in reference.teachers
+        ]
+    }
+
+
+@api.route("/disciplines")
+@login_required
+@replica_reads()
+@versioned(REFERENCE)
+def disciplines():
+    return {"items": [discipline._asdict() for discipline in get_reference_data().disciplines]}
+
+
+@api.route("/teachers/<int:teacher_id>/distribution")
+@login_required
+@replica_reads()
+@versioned(TeacherReview.__tablename__)
+def teacher_distribution(teacher_id):
+    return get_distribution(TeacherReview, teacher_id)
+
+
+@api.route("/disciplines/<int:discipline_id>/distribution")
+@login_required
+@replica_reads()
+@versioned(DisciplineReview.__tablename__)
+def discipline_distribution(discipline_id):
+    return get_distribution(DisciplineReview, discipline_id)
+
+
+def review_page(model):
+    columns = REVIEW_COLUMNS[model]
+    filters = {key: request.args.get(key) for key in REVIEW_FILTERS[model] if request.args.get(key)}
+
+    try:
+        page_size = min(request.args.get("page_size", type=int) or current_app.config["REVIEWS_PAGE_SIZE"], current_app.config["API_MAX_PAGE_SIZE"])
+        items, next_cursor = get_reviews(
+            **filters,
+            call=0 if model is TeacherReview else 1,
+            page_size=max(page_size, 1),
+            columns=[getattr(model, column) for column in columns]
+        )
+    except ValueError:
+        abort(400)
+
+    return {"items": rows(items, columns), "next_cursor": next_cursor}
+
+
+@api.route("/reviews/teachers")
+@login_required
+@replica_reads()
+@versioned(TeacherReview.__tablename__, REFERENCE)
+def teacher_reviews():
+    return review_page(TeacherReview)
+
+
+@api.route("/reviews/disciplines")
+@login_required
+@replica_reads()
+@versioned(DisciplineReview.__tablename__, REFERENCE)
+def discipline_reviews():
+    return review_page(DisciplineReview)
+
+
+@api.route("/leaderboards/<any(teacher, discipline):kind>")
+@login_required
+@replica_reads()
+@versioned(TeacherReview.__tablename__, DisciplineReview.__tablename__, REFERENCE, daily=True)
+def leaderboards(kind):
+    board = get_leaderboard(
+        kind, request.args.get("limit", type=int), request.args.get("faculty"), request.args.get("type"),
+        request.args.get("window", "all"), versions=g.data_versions
+    )
+    return {"items": [row._asdict() for row in board]}
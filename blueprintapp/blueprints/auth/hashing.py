@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from flask import current_app
+
+from blueprintapp.app import bcrypt
+
+
+class HashingOverloaded(Exception):
+    """Raised instead of queueing more bcrypt work than the pool is sized for."""
+
+
+_executor = None
+_slots = None
+
+_counters = {"in_flight": 0, "completed": 0, "rejected": 0}
+_counters_lock = threading.Lock()
+
+
+def init_app(app):
+    global _executor, _slots
+
+    workers = app.config["BCRYPT_POOL_SIZE"]
+
+    # bcrypt releases the GIL while hashing, so a thread pool runs hashes in parallel
+    _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+    _slots = threading.BoundedSemaphore(workers + app.config["BCRYPT_QUEUE_DEPTH"])
+
+
+def _count(name, delta=1):
+    with _counters_lock:
+        _counters[name] += delta
+
+
+def _done(future):
+    _slots.release()
+    _count("in_flight", -1)
+    _count("completed")
+
+
+def _run(fn, *args):
+    if not _slots.acquire(blocking=False):
+        _count("rejected")
+        raise HashingOverloaded()
+
+    _count("in_flight")
+    try:
+        future = _executor.submit(fn, *args)
+    except BaseException:
+        _slots.release()
+        _count("in_flight", -1)
+        raise
+    future.add_done_callback(_done)
+
+    try:
+        return future.result(timeout=current_app.config["BCRYPT_TIMEOUT"])
+    except TimeoutError:
+        _count("rejected")
+        raise HashingOverloaded()
+
+
+def hash_password(password):
+    return _run(bcrypt.generate_password_hash, password).decode('utf-8')
+
+
+def check_password(password_hash, password):
+    return _run(bcrypt.check_password_hash, password_hash, password)
+
+
+def stats():
+    with _counters_lock:
+        return dict(_counters)
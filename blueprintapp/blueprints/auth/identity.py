@@ -0,0 +1,35 @@
+from sqlalchemy.orm import make_transient_to_detached
+
+from blueprintapp.app import db
+from blueprintapp.cache import LRUCache
+from blueprintapp.blueprints.auth.models import User
+
+COLUMNS = ("id", "username", "email", "passwordHash")
+
+user_cache = LRUCache()
+
+
+def init_app(app):
+    user_cache.maxsize = app.config["USER_CACHE_SIZE"]
+    user_cache.ttl = app.config["USER_CACHE_TTL"]
+
+
+def load_user(uid):
+    uid = int(uid)
+    data = user_cache.get(uid)
+
+    if data is None:
+        user = db.session.get(User, uid)
+        if user is not None:
+            user_cache.set(uid, {column: getattr(user, column) for column in COLUMNS})
+        return user
+
+    user = User(**data)
+    make_transient_to_detached(user)
+
+    # attach without a SELECT so later queries for this user return the same instance
+    return db.session.merge(user, load=False)
+
+
+def forget_user(uid):
+    user_cache.delete(int(uid))
@@ -13,4 +13,15 @@ class User(db.Model, UserMixin):
         return f'User {self.id}; {self.username}; {self.email}'
     
     def get_id(self):
-        return str(self.id)
\ No newline at end of file
+        return str(self.id)
+
+class StoredSession(db.Model):
+    __tablename__ = 'sessions'
+
+    id = db.Column(db.String(64), primary_key=True)
+    data = db.Column(db.Text, nullable=False)
+    # naive UTC
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f'StoredSession {self.id[:8]}...; expires {self.expires_at}'
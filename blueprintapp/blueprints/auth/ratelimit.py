@@ -0,0 +1,194 @@
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, request, session
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+LIMIT = re.compile(r"^\s*(\w+)\s*:\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?\s*$")
+
+# keep one token bucket per key: takes a token or reports how long until one is free
+TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RateLimited(Exception):
+    """Raised before an expensive view runs when one of its limits is used up."""
+
+    def __init__(self, retry_after):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
+class MemoryBuckets:
+    """Token buckets for this process, spread over shards so threads rarely share a lock.
+
+    Each shard keeps its least recently used keys first and drops them past
+    `max_keys` in total; a dropped bucket simply starts full again.
+    """
+
+    def __init__(self, shards=16, max_keys=100000):
+        self.shards = [(threading.Lock(), OrderedDict()) for _ in range(shards)]
+        self.max_keys = max(1, max_keys // shards)
+
+    def take(self, key, capacity, rate):
+        lock, buckets = self.shards[zlib.crc32(key.encode("utf-8")) % len(self.shards)]
+        now = time.monotonic()
+
+        with lock:
+            tokens, updated = buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / rate
+
+            buckets[key] = (tokens, now)
+            while len(buckets) > self.max_keys:
+                buckets.popitem(last=False)
+
+        return wait
+
+
+class RedisBuckets:
+    """Token buckets shared by every process that points at the same Redis-protocol server."""
+
+    def __init__(self, url, prefix="ratelimit:"):
+        if redis is None:
+            raise RuntimeError("RATELIMIT_STORAGE_URL needs the 'redis' package")
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.script = self.client.register_script(TAKE_SCRIPT)
+
+    def take(self, key, capacity, rate):
+        return float(self.script(keys=[self.prefix + key], args=[capacity, rate]))
+
+
+def client_ip():
+    # behind N proxies the client is the Nth address from the right of X-Forwarded-For;
+    # anything further left came from the client itself and cannot be trusted
+    proxies = current_app.config["RATELIMIT_TRUSTED_PROXIES"]
+    if proxies:
+        forwarded = [part.strip() for part in request.headers.get("X-Forwarded-For", "").split(",") if part.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.remote_addr or "-"
+
+
+def form_email():
+    email = (request.form.get("email") or "").strip().lower()
+    return email or None
+
+
+def session_flow():
+    # the signup or password reset being verified; a new code needs a new signup/reset request
+    return session.get("email")
+
+
+KEYS = {"ip": client_ip, "email": form_email, "session": session_flow}
+
+buckets = MemoryBuckets()
+_rules = {}
+
+_counters = {}
+_counters_lock = threading.Lock()
+
+
+def parse_limits(value):
+    """'ip:10/minute; email:5/15minutes' -> [("ip", 10, 60.0), ("email", 5, 900.0)]"""
+    limits = []
+    for part in filter(None, (part.strip() for part in value.split(";"))):
+        match = LIMIT.match(part)
+        if match is None or match.group(1) not in KEYS:
+            raise ValueError(f"Invalid rate limit {part!r}; expected e.g. 'ip:10/minute'")
+        key, count, multiple, period = match.groups()
+        limits.append((key, int(count), float(PERIODS[period] * int(multiple or 1))))
+    return limits
+
+
+def init_app(app):
+    global buckets
+
+    url = app.config["RATELIMIT_STORAGE_URL"]
+    buckets = RedisBuckets(url) if url else MemoryBuckets(max_keys=app.config["RATELIMIT_MAX_KEYS"])
+
+    _rules.clear()
+    for name in ("login", "signup", "forgot_password", "verification"):
+        _rules[name] = parse_limits(app.config[f"RATELIMIT_{name.upper()}"])
+
+
+def _count(name, outcome):
+    with _counters_lock:
+        counters = _counters.setdefault(name, {"allowed": 0, "rejected": 0})
+        counters[outcome] += 1
+
+
+def check(name):
+    """Take one token from every bucket of the rule; raise RateLimited if any is empty.
+
+    Tokens are taken from each bucket in turn, so a rejected request still
+    counts against the buckets checked before the one that was empty.
+    """
+    for key, count, period in _rules[name]:
+        value = KEYS[key]()
+        if value is None:
+            continue
+
+        wait = buckets.take(f"{name}:{key}:{value}", count, count / period)
+        if wait > 0:
+            _count(name, "rejected")
+            raise RateLimited(wait)
+
+    _count(name, "allowed")
+
+
+def rate_limited(name, methods=("POST",)):
+    """Check the RATELIMIT_<NAME> limits before the view does any work."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if current_app.config["RATELIMIT_ENABLED"] and request.method in methods:
+                check(name)
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def stats():
+    with _counters_lock:
+        return {
+            "backend": "redis" if isinstance(buckets, RedisBuckets) else "memory",
+            **{name: dict(counters) for name, counters in _counters.items()},
+        }
@@ -3,15 +3,34 @@ from flask_login import login_user, logout_user, current_user, login_required
 
 from email_validator import validate_email, EmailNotValidError
 
+import math
 import secrets
 
-from blueprintapp.app import db, bcrypt
+from blueprintapp.app import db
+from blueprintapp.routing import replica_reads
+from blueprintapp.mail import send_verification_code
 from blueprintapp.blueprints.auth.models import User
+from blueprintapp.blueprints.auth.hashing import HashingOverloaded, hash_password, check_password
+from blueprintapp.blueprints.auth.identity import forget_user
+from blueprintapp.blueprints.auth.ratelimit import RateLimited, rate_limited
 from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+from blueprintapp.blueprints.reviews.projections import user_reviews_query
+
+auth = Blueprint("auth", __name__, template_folder="templates")
+
+
+@auth.errorhandler(HashingOverloaded)
+def hashing_overloaded(e):
+    return "The server is busy verifying passwords. Please try again in a moment.", 503, {"Retry-After": "1"}
+
+
+@auth.errorhandler(RateLimited)
+def rate_limit_exceeded(e):
+    return "Too many attempts. Please wait a little and try again.", 429, {"Retry-After": str(math.ceil(e.retry_after))}
 
-auth = Blueprint("auth", __name__, template_folder="templates", static_folder="templates/auth/assets")
 
 @auth.route("/login", methods=["GET", "POST"])
+@rate_limited("login")
 def login():
     if request.method == "GET":
         return render_template("auth/login.html")
@@ -30,7 +49,7 @@ def login():
         if not user:
             return render_template("auth/login.html", error="User not found. Please sign up first.")
 
-        if bcrypt.check_password_hash(user.passwordHash, password):
+        if check_password(user.passwordHash, password):
             login_user(user)
 
             session['name'] = user.username
@@ -43,6 +62,7 @@ def login():
 
 
 @auth.route("/signup", methods=["GET", "POST"])
+@rate_limited("signup")
 def signup():
     if request.method == "GET":
         return render_template("auth/signup.html")
@@ -61,10 +81,10 @@ def signup():
             return render_template("auth/signup.html", error="This email is already registered.")
 
         if correct_password(password):
-            passwordHash = bcrypt.generate_password_hash(password).decode('utf-8')
+            passwordHash = hash_password(password)
 
             verification_code = str(secrets.randbelow(10**6)).zfill(6)
-            print(f"Verification code for {email}: {verification_code}")
+            send_verification_code(email, verification_code)
 
             session['verification_code'] = verification_code
             session['name'] = name
@@ -90,6 +110,7 @@ def logout():
 
 
 @auth.route("/verification", methods=["POST", "GET"])
+@rate_limited("verification")
 def verification():
     if request.method == "GET":
         return render_template("auth/verification.html")
@@ -103,9 +124,11 @@ def verification():
                 user = User.query.filter_by(email=session['email']).first()
                 session['name'] = user.username
 
-                user.passwordHash = bcrypt.generate_password_hash(session['newpassword']).decode('utf-8')
+                user.passwordHash = hash_password(session['newpassword'])
                 db.session.commit()
 
+                forget_user(user.id)
+
                 session.pop('verification_code', None)
                 session.pop('newpassword', None)
                 session.pop('purpose', None)
@@ -129,6 +152,7 @@ def verification():
 
 
 @auth.route("/forgot_password", methods=["GET", "POST"])
+@rate_limited("forgot_password")
 def forgot_password():
     if request.method == "GET":
         return render_template("auth/forgot_password.html")
@@ -149,7 +173,7 @@ def forgot_password():
                 session['purpose'] = 'reset'
 
                 verification_code = str(secrets.randbelow(10**6)).zfill(6)
-                print(f"Verification code for {session['email']}: {verification_code}")
+                send_verification_code(session['email'], verification_code)
 
                 session['verification_code'] = verification_code
 
@@ -166,9 +190,10 @@ def forgot_password():
 
 @auth.route("/profile", methods=["GET", "POST"])
 @login_required
+@replica_reads("GET")
 def profile():
-    teachReviews = TeacherReview.query.filter_by(user_id = current_user.id).all()
-    disReviews = DisciplineReview.query.filter_by(user_id = current_user.id).all()
+    teachReviews = db.session.execute(user_reviews_query(TeacherReview, current_user.id)).all()
+    disReviews = db.session.execute(user_reviews_query(DisciplineReview, current_user.id)).all()
     
     if request.method == "GET":
         return render_template("auth/profile.html", user=current_user, teachReviews=teachReviews, disReviews=disReviews)
@@ -179,10 +204,12 @@ def profile():
         if new_username == "" and new_password:
             if correct_password(new_password):
                 user = User.query.filter_by(id=current_user.id).first()
-                user.passwordHash = bcrypt.generate_password_hash(new_password).decode('utf-8')
+                user.passwordHash = hash_password(new_password)
 
                 db.session.commit()
 
+                forget_user(user.id)
+
                 return render_template("auth/profile.html", user=current_user, error="Password updated successfully.", disReviews=disReviews, teachReviews=teachReviews)
             else:
                 return render_template(
@@ -202,6 +229,8 @@ def profile():
 
             db.session.commit()
 
+            forget_user(user.id)
+
             return render_template("auth/profile.html", user=current_user, error="Username updated successfully.", disReviews=disReviews, teachReviews=teachReviews)
         elif new_username and new_password:
             if correct_password(new_password):
@@ -211,10 +240,12 @@ def profile():
                 user = User.query.filter_by(id=current_user.id).first()
 
                 user.username = new_username
-                user.passwordHash = bcrypt.generate_password_hash(new_password).decode('utf-8')
+                user.passwordHash = hash_password(new_password)
 
                 db.session.commit()
 
+                forget_user(user.id)
+
                 return render_template("auth/profile.html", user=current_user, error="Profile updated successfully.", disReviews=disReviews, teachReviews=teachReviews)
             else:
                 return render_template(
@@ -1,6 +1,6 @@
 from flask import Blueprint, render_template
 
-core = Blueprint("core", __name__, template_folder="templates", static_folder="templates/core/assets")
+core = Blueprint("core", __name__, template_folder="templates")
 
 @core.route('/')
 def index():
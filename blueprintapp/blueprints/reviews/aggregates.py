@@ -0,0 +1,87 @@
+from datetime import date
+
+from sqlalchemy import func, select, update
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.models import Teacher, Discipline
+from blueprintapp.blueprints.admin.versions import bump_version
+from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+from blueprintapp.blueprints.reviews.rollups import apply_rollups
+from blueprintapp.blueprints.reviews.distributions import apply_distributions
+
+# review model -> (rated model, foreign key column on the review)
+TARGETS = {
+    TeacherReview: (Teacher, TeacherReview.teacher_id),
+    DisciplineReview: (Discipline, DisciplineReview.discipline_id),
+}
+
+
+def review_row(review):
+    model, column = TARGETS[type(review)]
+    # time is filled in by the column default at flush, which is today
+    return {
+        column.key: int(getattr(review, column.key)),
+        "rating": int(review.rating),
+        "difficulty": review.difficulty,
+        "time": review.time or date.today(),
+    }
+
+
+def apply_rating_delta(model, entity_id, count, rating_sum):
+    # Increment in SQL so concurrent writers never overwrite each other's counts.
+    db.session.execute(
+        update(model)
+        .where(model.id == entity_id)
+        .values(
+            review_count=model.review_count + count,
+            rating_sum=model.rating_sum + rating_sum
+        )
+    )
+
+
+def apply_reviews(review_model, rows, sign=1):
+    """Fold a batch of review rows (dicts) into the stored aggregates, one UPDATE per rated entity,
+    and into the daily rollups and distributions."""
+    model, column = TARGETS[review_model]
+
+    totals = {}
+    for row in rows:
+        count, rating_sum = totals.get(row[column.key], (0, 0))
+        totals[row[column.key]] = (count + 1, rating_sum + int(row["rating"]))
+
+    for entity_id, (count, rating_sum) in totals.items():
+        apply_rating_delta(model, entity_id, sign * count, sign * rating_sum)
+
+    apply_rollups(review_model, rows, sign)
+    apply_distributions(review_model, rows, sign)
+
+    if totals:
+        bump_version(review_model.__tablename__)
+
+
+def save_review(review):
+    db.session.add(review)
+    apply_reviews(type(review), [review_row(review)])
+
+
+def delete_review(review):
+    apply_reviews(type(review), [review_row(review)], sign=-1)
+    db.session.delete(review)
+
+
+def rebuild_aggregates():
+    for review_model, (model, column) in TARGETS.items():
+        db.session.execute(
+            update(model).values(
+                review_count=select(func.count(review_model.id))
+                    .where(column == model.id)
+                    .scalar_subquery(),
+                rating_sum=select(func.coalesce(func.sum(review_model.rating), 0))
+                    .where(column == model.id)
+                    .scalar_subquery()
+            )
+        )
+        # cached boards and ETags move on with the same commit as the recounted rows
+        bump_version(review_model.__tablename__)
+
+    db.session.commit()
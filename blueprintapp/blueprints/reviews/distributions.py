@@ -0,0 +1,72 @@
+from sqlalchemy import case, delete, func, insert, select
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.versions import bump_version
+from blueprintapp.blueprints.reviews.models import (
+    TeacherReview, DisciplineReview, TeacherDistribution, DisciplineDistribution, RATINGS, DIFFICULTIES
+)
+from blueprintapp.blueprints.reviews.rollups import COUNTERS as RATING_COUNTERS, count_rating, increment, rating_sums
+
+# review model -> (distribution model, entity key on both tables)
+DISTRIBUTIONS = {
+    TeacherReview: (TeacherDistribution, "teacher_id"),
+    DisciplineReview: (DisciplineDistribution, "discipline_id"),
+}
+
+COUNTERS = (*RATING_COUNTERS, *DIFFICULTIES)
+
+
+def distribution_deltas(rows, key, sign=1):
+    """Sum review rows (dicts with `key`, rating and difficulty) into one counter dict per entity."""
+    deltas = {}
+    for row in rows:
+        counters = deltas.setdefault(row[key], dict.fromkeys(COUNTERS, 0))
+        count_rating(counters, row, sign)
+        # labels outside the known set are stored on the review but not counted
+        if row.get("difficulty") in DIFFICULTIES:
+            counters[row["difficulty"]] += sign
+
+    return deltas
+
+
+def apply_distributions(review_model, rows, sign=1):
+    model, key = DISTRIBUTIONS[review_model]
+
+    deltas = distribution_deltas(rows, key, sign)
+    if deltas:
+        increment(model, [key], [{key: entity_id, **counters} for entity_id, counters in deltas.items()], COUNTERS)
+
+
+def get_distribution(review_model, entity_id):
+    """Rating and difficulty histograms for one teacher or discipline, read from a single row."""
+    model, key = DISTRIBUTIONS[review_model]
+    stored = db.session.get(model, entity_id)
+
+    counts = {column: getattr(stored, column) if stored else 0 for column in COUNTERS}
+    return {
+        "review_count": counts["review_count"],
+        "avg_rating": round(counts["rating_sum"] / counts["review_count"], 2) if counts["review_count"] else None,
+        "ratings": {rating: counts[f"r{rating}"] for rating in RATINGS},
+        "difficulty": {difficulty: counts[difficulty] for difficulty in DIFFICULTIES},
+    }
+
+
+def rebuild_distributions():
+    for review_model, (model, key) in DISTRIBUTIONS.items():
+        column = getattr(review_model, key)
+
+        db.session.execute(delete(model))
+        db.session.execute(
+            insert(model).from_select(
+                [key, *COUNTERS],
+                select(
+                    column,
+                    *rating_sums(review_model),
+                    *(func.sum(case((review_model.difficulty == difficulty, 1), else_=0)) for difficulty in DIFFICULTIES)
+                ).group_by(column)
+            )
+        )
+        # cached pages and ETags move on with the same commit as the rebuilt rows
+        bump_version(review_model.__tablename__)
+
+    db.session.commit()
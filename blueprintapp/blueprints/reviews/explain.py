@@ -0,0 +1,210 @@
+import itertools
+import json
+import math
+import os
+import re
+
+from flask import current_app
+from sqlalchemy import inspect
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+from blueprintapp.blueprints.reviews.projections import user_reviews_query
+
+# form fields each search page can submit, see search_teacher/search_discipline
+SEARCH_FIELDS = {
+    0: ("teacher_id", "discipline_id", "difficulty", "rating"),
+    1: ("discipline_id", "faculty", "type", "difficulty", "rating"),
+}
+
+PLANS_DIR = os.path.join(os.path.dirname(__file__), "plans")
+
+# plan lines that read a whole table, or sort it, instead of walking an index
+FULL_SCAN = re.compile(r"^\s*(SCAN \S+$|USE TEMP B-TREE FOR ORDER BY|Seq Scan on |Sort$)")
+
+# which of several indexes a plan walks; SQLite breaks ties between equally good ones by creation order
+INDEX_CHOICE = re.compile(r"USING (?:COVERING )?INDEX \S+(?: \(.*\))?|(?<=using )\S+")
+
+SAMPLE_VALUES = {
+    "teacher_id": "1",
+    "discipline_id": "1",
+    "difficulty": "medium",
+    "rating": "5",
+    "faculty": "Faculty of Information Technology",
+    "type": "mandatory",
+}
+
+
+def filter_combinations(call):
+    fields = SEARCH_FIELDS[call]
+
+    for size in range(len(fields) + 1):
+        for combo in itertools.combinations(fields, size):
+            yield {field: SAMPLE_VALUES[field] for field in combo}
+
+
+def search_statements():
+    from blueprintapp.blueprints.reviews.routes import reviews_query
+
+    page_size = current_app.config["REVIEWS_PAGE_SIZE"]
+
+    for call, table in ((0, "teacher_reviews"), (1, "discipline_reviews")):
+        for filters in filter_combinations(call):
+            for time in ("new", "old"):
+                query = reviews_query(**filters, time=time, call=call)
+                label = f"{table} time={time} " + (" ".join(f"{k}={v!r}" for k, v in filters.items()) or "(no filters)")
+
+                yield label, query.limit(page_size + 1).statement
+
+    for call, table in ((0, "teacher_reviews"), (1, "discipline_reviews")):
+        yield f"{table} q='exam' (ranked)", reviews_query(call=call, q="exam").limit(page_size + 1).statement
+        yield f"{table} q='exam' time=new", reviews_query(call=call, q="exam", time="new").limit(page_size + 1).statement
+
+    # auth.profile
+    yield "teacher_reviews user_id=1", user_reviews_query(TeacherReview, 1)
+    yield "discipline_reviews user_id=1", user_reviews_query(DisciplineReview, 1)
+
+
+def run_explain(prefix, statement):
+    connection = db.session.connection()
+    compiled = statement.compile(dialect=connection.dialect)
+
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+
+    return connection.exec_driver_sql(f"{prefix} {compiled}", params).fetchall()
+
+
+def explain(statement, analyze=False):
+    dialect = db.session.connection().dialect
+
+    if dialect.name == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN"
+    elif dialect.name == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS)" if analyze else "EXPLAIN"
+    else:
+        prefix = "EXPLAIN"
+
+    rows = run_explain(prefix, statement)
+
+    if dialect.name == "sqlite":
+        # (id, parent, notused, detail)
+        return [row[-1] for row in rows]
+    return [" ".join(str(column) for column in row) for row in rows]
+
+
+def plan_nodes(node, depth=0):
+    name = node["Node Type"]
+    if "Index Name" in node:
+        name += f" using {node['Index Name']}"
+    if "Relation Name" in node:
+        name += f" on {node['Relation Name']}"
+
+    yield depth, name, node["Node Type"].endswith("Scan"), node.get("Plan Rows")
+    for child in node.get("Plans", ()):
+        yield from plan_nodes(child, depth + 1)
+
+
+def plan_shape(statement):
+    """Plan lines without costs, and the largest row estimate of any scan (None on SQLite).
+
+    SQLite's EXPLAIN QUERY PLAN has no estimates and is already cost-free.
+    """
+    if db.session.connection().dialect.name != "postgresql":
+        return explain(statement), None
+
+    ((plan,),) = run_explain("EXPLAIN (FORMAT JSON)", statement)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    nodes = list(plan_nodes(plan[0]["Plan"]))
+    estimates = [rows for _, _, scan, rows in nodes if scan]
+
+    return ["  " * depth + name for depth, name, _, _ in nodes], max(estimates, default=None)
+
+
+def plan_kind(lines):
+    """The plan with index names left out, so choosing another equally good index is not a change."""
+    return [INDEX_CHOICE.sub(lambda match: "USING INDEX" if match.group().startswith("USING") else "*", line) for line in lines]
+
+
+def create_schema():
+    """Create missing tables, with each new table's indexes in name order.
+
+    SQLite breaks ties between equally good indexes by creation order, and
+    create_all() creates them in set order, which changes between runs.
+    """
+    connection = db.session.connection()
+    missing = set(db.metadata.tables) - set(inspect(connection).get_table_names())
+
+    db.metadata.create_all(connection)
+
+    for name in sorted(missing):
+        indexes = sorted(db.metadata.tables[name].indexes, key=lambda index: index.name)
+        for index in indexes:
+            index.drop(connection)
+        for index in indexes:
+            index.create(connection)
+
+    db.session.commit()
+
+
+def expected_plans_path():
+    return os.path.join(PLANS_DIR, f"{db.session.connection().dialect.name}.json")
+
+
+def load_expected_plans():
+    try:
+        with open(expected_plans_path(), encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def save_expected_plans(plans, slack):
+    expected = {
+        label: {"plan": lines, **({"max_rows": math.ceil(rows * slack)} if rows is not None else {})}
+        for label, (lines, rows) in plans.items()
+    }
+
+    os.makedirs(PLANS_DIR, exist_ok=True)
+    with open(expected_plans_path(), "w", encoding="utf-8") as file:
+        json.dump(expected, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def check_plans(expected):
+    """Compare every search plan with the recorded one.
+
+    Returns the current plans ({label: (lines, max_rows)}) and a list of
+    (label, problem) pairs. A plan must keep its recorded shape: the same
+    searches, scans and sorts, though it may use a different index for them.
+    Its scans may not be estimated to read more than the recorded max_rows.
+    """
+    plans = {}
+    problems = []
+
+    for label, statement in search_statements():
+        lines, rows = plan_shape(statement)
+        plans[label] = (lines, rows)
+
+        recorded = expected.get(label)
+        if recorded is None:
+            problems.append((label, "no recorded plan"))
+            continue
+
+        if plan_kind(lines) != plan_kind(recorded["plan"]):
+            scans = [line.strip() for line in lines if FULL_SCAN.search(line) and line not in recorded["plan"]]
+            problem = "plan changed" + (f", now with {'; '.join(scans)}" if scans else "")
+            problems.append((label, problem + "\n      expected: " + " | ".join(recorded["plan"]) + "\n      actual:   " + " | ".join(lines)))
+
+        max_rows = recorded.get("max_rows")
+        if max_rows is not None and rows is not None and rows > max_rows:
+            problems.append((label, f"scans an estimated {rows} rows, more than the allowed {max_rows}"))
+
+    for label in sorted(set(expected) - set(plans)):
+        problems.append((label, "recorded plan for a query that no longer exists"))
+
+    return plans, problems
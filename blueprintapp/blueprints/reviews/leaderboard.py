@@ -0,0 +1,189 @@
+import threading
+import time
+from collections import namedtuple
+from datetime import date, timedelta
+
+from flask import current_app
+from sqlalchemy import Float, and_, case, cast, func
+
+from blueprintapp.app import db
+from blueprintapp.cache import LRUCache
+from blueprintapp.blueprints.admin.models import Teacher, Discipline
+from blueprintapp.blueprints.admin.versions import REFERENCE, get_versions, on_version_bump
+from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview, TeacherDailyRating, DisciplineDailyRating
+
+# trend is only set for the "trending" window: recent average minus the average before it
+LeaderRow = namedtuple("LeaderRow", "id name surname avg_rating review_count trend", defaults=(None,))
+
+WINDOWS = ("all", "30d", "semester", "trending")
+
+# (month, day) each semester starts on, latest first
+SEMESTER_STARTS = ((9, 1), (2, 1))
+
+# data versions a board of each kind is computed from
+VERSION_NAMES = {
+    "teacher": (TeacherReview.__tablename__, REFERENCE),
+    "discipline": (DisciplineReview.__tablename__, REFERENCE),
+}
+
+# Boards are keyed by the data versions they were loaded at, so a write in
+# any process makes the old entries unreachable; they then age out through
+# the LRU/TTL bounds.
+cache = LRUCache()
+
+# kind -> (versions, when they were read)
+_versions = {}
+_versions_lock = threading.Lock()
+
+
+def init_app(app):
+    cache.maxsize = app.config["LEADERBOARD_MAX_ENTRIES"]
+    cache.ttl = app.config["LEADERBOARD_TTL"]
+
+
+def leaderboard_versions(kind):
+    """Versions of the data a `kind` board depends on, as a dict.
+
+    Writes committed in this process show up at once; other processes' writes
+    within LEADERBOARD_VERSION_CHECK_INTERVAL seconds, so a cache hit usually
+    needs no query at all.
+    """
+    interval = current_app.config["LEADERBOARD_VERSION_CHECK_INTERVAL"]
+
+    with _versions_lock:
+        entry = _versions.get(kind)
+    if entry is not None and time.monotonic() - entry[1] < interval:
+        return entry[0]
+
+    versions = get_versions(*VERSION_NAMES[kind])
+    with _versions_lock:
+        _versions[kind] = (versions, time.monotonic())
+    return versions
+
+
+def invalidate_leaderboard_versions(*kinds):
+    """Make the next leaderboard_versions call for these kinds (all by default) read the table."""
+    with _versions_lock:
+        for kind in kinds or list(_versions):
+            _versions.pop(kind, None)
+
+
+@on_version_bump
+def leaderboard_versions_bumped(names):
+    invalidate_leaderboard_versions(*(kind for kind, dependencies in VERSION_NAMES.items() if names.intersection(dependencies)))
+
+
+def get_leaderboard(kind, limit=None, faculty=None, type=None, window="all", versions=None):
+    """Top entities of `kind`, cached per data version.
+
+    Pass `versions` (e.g. from leaderboard_versions or the ones an ETag was
+    built from) to get the board for exactly those versions; otherwise they
+    are read here.
+    """
+    versions = versions if versions is not None else leaderboard_versions(kind)
+    versions = tuple(versions.get(name, 0) for name in VERSION_NAMES[kind])
+
+    max_size = current_app.config["LEADERBOARD_MAX_SIZE"]
+    limit = max(1, min(int(limit or current_app.config["LEADERBOARD_SIZE"]), max_size))
+    window = window if window in WINDOWS else "all"
+
+    # windowed boards move with the calendar even when no review is written
+    today = date.today() if window != "all" else None
+    key = (kind, versions, window, today, faculty or None, type or None, limit)
+
+    if window == "all":
+        return cache.get_or_set(key, lambda: load_leaderboard(kind, limit, faculty, type))
+    return cache.get_or_set(key, lambda: load_window_leaderboard(kind, window, limit, faculty, type, today))
+
+
+def filter_entities(query, kind, faculty=None, type=None):
+    if kind == "teacher":
+        conditions = []
+        if faculty:
+            conditions.append(Discipline.faculty == faculty)
+        if type:
+            conditions.append(Discipline.type == type)
+        if conditions:
+            query = query.filter(Teacher.disciplines.any(and_(*conditions)))
+    else:
+        if faculty:
+            query = query.filter(Discipline.faculty == faculty)
+        if type:
+            query = query.filter(Discipline.type == type)
+
+    return query
+
+
+def entity_columns(kind):
+    if kind == "teacher":
+        return Teacher, (Teacher.id, Teacher.name, Teacher.surname)
+    return Discipline, (Discipline.id, Discipline.name, db.literal(None))
+
+
+def load_leaderboard(kind, limit, faculty=None, type=None):
+    model, columns = entity_columns(kind)
+
+    query = db.session.query(*columns, model.avg_rating, model.review_count)
+    query = filter_entities(query, kind, faculty, type)
+    query = query.order_by(model.avg_rating.desc(), model.id)
+
+    return tuple(
+        LeaderRow(id, name, surname, round(avg_rating, 2), review_count)
+        for id, name, surname, avg_rating, review_count in query.limit(limit)
+    )
+
+
+def semester_start(day):
+    for month, first in SEMESTER_STARTS:
+        if (day.month, day.day) >= (month, first):
+            return date(day.year, month, first)
+    month, first = SEMESTER_STARTS[0]
+    return date(day.year - 1, month, first)
+
+
+def load_window_leaderboard(kind, window, limit, faculty=None, type=None, today=None):
+    """Rank from the daily rollups, which hold at most one row per entity and day."""
+    today = today or date.today()
+
+    model, columns = entity_columns(kind)
+    rollup = TeacherDailyRating if kind == "teacher" else DisciplineDailyRating
+    entity_id = rollup.teacher_id if kind == "teacher" else rollup.discipline_id
+
+    if window == "trending":
+        config = current_app.config
+        recent_start = today - timedelta(days=config["LEADERBOARD_TRENDING_DAYS"] - 1)
+        start = recent_start - timedelta(days=config["LEADERBOARD_TRENDING_BASELINE_DAYS"])
+
+        recent = rollup.day >= recent_start
+        count = func.sum(case((recent, rollup.review_count), else_=0))
+        average = cast(func.sum(case((recent, rollup.rating_sum), else_=0)), Float) / func.nullif(count, 0)
+        baseline_count = func.sum(case((recent, 0), else_=rollup.review_count))
+        baseline = cast(func.sum(case((recent, 0), else_=rollup.rating_sum)), Float) / func.nullif(baseline_count, 0)
+
+        trend = average - baseline
+        having = (count > 0, baseline_count > 0)
+        order = (trend.desc(), count.desc(), model.id)
+    else:
+        start = today - timedelta(days=29) if window == "30d" else semester_start(today)
+
+        count = func.sum(rollup.review_count)
+        average = cast(func.sum(rollup.rating_sum), Float) / func.nullif(count, 0)
+
+        trend = db.literal(None)
+        having = (count > 0,)
+        order = (average.desc(), count.desc(), model.id)
+
+    group_columns = (model.id, model.name, model.surname) if kind == "teacher" else (model.id, model.name)
+    query = (
+        db.session.query(*columns, average, count, trend)
+        .join(rollup, entity_id == model.id)
+        .filter(rollup.day >= start, rollup.day <= today)
+        .group_by(*group_columns)
+        .having(*having)
+    )
+    query = filter_entities(query, kind, faculty, type).order_by(*order)
+
+    return tuple(
+        LeaderRow(id, name, surname, round(avg_rating, 2), review_count, None if trend is None else round(trend, 2))
+        for id, name, surname, avg_rating, review_count, trend in query.limit(limit)
+    )
@@ -3,6 +3,14 @@ from datetime import date
 
 class TeacherReview(db.Model):
     __tablename__ = "teacher_reviews"
+    # every search pages on (time, id); equality filters lead, the rest is carried for index-only filtering on PostgreSQL
+    __table_args__ = (
+        db.Index("ix_teacher_reviews_time_id", "time", "id", postgresql_include=["rating", "difficulty"]),
+        db.Index("ix_teacher_reviews_teacher_time", "teacher_id", "time", "id", postgresql_include=["discipline_id", "rating", "difficulty"]),
+        db.Index("ix_teacher_reviews_discipline_time", "discipline_id", "time", "id", postgresql_include=["rating", "difficulty"]),
+        db.Index("ix_teacher_reviews_difficulty_time", "difficulty", "time", "id", postgresql_include=["rating"]),
+        db.Index("ix_teacher_reviews_user_id", "user_id", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -26,6 +34,12 @@ class TeacherReview(db.Model):
 
 class DisciplineReview(db.Model):
     __tablename__ = "discipline_reviews"
+    __table_args__ = (
+        db.Index("ix_discipline_reviews_time_id", "time", "id", postgresql_include=["rating", "difficulty"]),
+        db.Index("ix_discipline_reviews_discipline_time", "discipline_id", "time", "id", postgresql_include=["rating", "difficulty"]),
+        db.Index("ix_discipline_reviews_difficulty_time", "difficulty", "time", "id", postgresql_include=["rating"]),
+        db.Index("ix_discipline_reviews_user_id", "user_id", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -41,4 +55,61 @@ class DisciplineReview(db.Model):
     discipline = db.relationship("Discipline", backref="discipline_reviews")
 
     def __repr__(self):
-        return f"<DisciplineReview {self.name} - {self.discipline_name}>; {self.rating} stars; feedback: {self.feedback[:20]}..."
\ No newline at end of file
+        return f"<DisciplineReview {self.name} - {self.discipline_name}>; {self.rating} stars; feedback: {self.feedback[:20]}..."
+
+RATINGS = range(1, 11)
+
+class RatingCounts:
+    """Review count, rating sum and one counter per rating value (r1..r10)."""
+
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    r1 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    r2 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    r3 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    r4 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    r5 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    r6 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    r7 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    r8 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    r9 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    r10 = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+class TeacherDailyRating(RatingCounts, db.Model):
+    __tablename__ = "teacher_daily_ratings"
+    # windowed rankings read every teacher's rows for a range of days
+    __table_args__ = (
+        db.Index("ix_teacher_daily_ratings_day", "day", "teacher_id"),
+    )
+
+    teacher_id = db.Column(db.Integer, db.ForeignKey("teachers.id", ondelete="CASCADE"), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+
+class DisciplineDailyRating(RatingCounts, db.Model):
+    __tablename__ = "discipline_daily_ratings"
+    __table_args__ = (
+        db.Index("ix_discipline_daily_ratings_day", "day", "discipline_id"),
+    )
+
+    discipline_id = db.Column(db.Integer, db.ForeignKey("disciplines.id", ondelete="CASCADE"), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+
+DIFFICULTIES = ("easy", "medium", "hard")
+
+class DifficultyCounts:
+    """One counter per difficulty label."""
+
+    easy = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    medium = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    hard = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+class TeacherDistribution(RatingCounts, DifficultyCounts, db.Model):
+    __tablename__ = "teacher_distributions"
+
+    teacher_id = db.Column(db.Integer, db.ForeignKey("teachers.id", ondelete="CASCADE"), primary_key=True)
+
+class DisciplineDistribution(RatingCounts, DifficultyCounts, db.Model):
+    __tablename__ = "discipline_distributions"
+
+    discipline_id = db.Column(db.Integer, db.ForeignKey("disciplines.id", ondelete="CASCADE"), primary_key=True)
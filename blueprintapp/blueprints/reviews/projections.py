@@ -0,0 +1,24 @@
+from sqlalchemy import select
+
+from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+
+# Columns the listing pages display. Selecting them directly returns Row
+# tuples (attribute access like a namedtuple), which skips ORM hydration,
+# identity-map bookkeeping and relationship setup for every review.
+LISTING = {
+    0: (
+        TeacherReview.id, TeacherReview.name, TeacherReview.surname, TeacherReview.discipline_name,
+        TeacherReview.difficulty, TeacherReview.rating, TeacherReview.feedback, TeacherReview.time,
+    ),
+    1: (
+        DisciplineReview.id, DisciplineReview.name,
+        DisciplineReview.difficulty, DisciplineReview.rating, DisciplineReview.feedback, DisciplineReview.time,
+    ),
+}
+
+CALLS = {TeacherReview: 0, DisciplineReview: 1}
+
+
+def user_reviews_query(model, user_id):
+    # (user_id, id) is indexed, so this is an index range scan in id order
+    return select(*LISTING[CALLS[model]]).where(model.user_id == user_id).order_by(model.id)
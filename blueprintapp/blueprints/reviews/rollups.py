@@ -0,0 +1,97 @@
+from datetime import date
+
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.versions import bump_version
+from blueprintapp.blueprints.reviews.models import (
+    TeacherReview, DisciplineReview, TeacherDailyRating, DisciplineDailyRating, RATINGS
+)
+
+# review model -> (rollup model, entity key on both tables)
+ROLLUPS = {
+    TeacherReview: (TeacherDailyRating, "teacher_id"),
+    DisciplineReview: (DisciplineDailyRating, "discipline_id"),
+}
+
+COUNTERS = ("review_count", "rating_sum", *(f"r{rating}" for rating in RATINGS))
+
+
+def count_rating(counters, row, sign=1):
+    rating = int(row["rating"])
+
+    counters["review_count"] += sign
+    counters["rating_sum"] += sign * rating
+    if rating in RATINGS:
+        counters[f"r{rating}"] += sign
+
+
+def rating_deltas(rows, key, sign=1):
+    """Sum review rows (dicts with `key`, rating and time) into one counter dict per (entity, day)."""
+    deltas = {}
+    for row in rows:
+        day = row.get("time") or date.today()
+        count_rating(deltas.setdefault((row[key], day), dict.fromkeys(COUNTERS, 0)), row, sign)
+
+    return deltas
+
+
+def rating_sums(model):
+    """count/sum/r1..r10 select columns over a review model, for rebuilding counters in SQL."""
+    return (
+        func.count(model.id),
+        func.sum(model.rating),
+        *(func.sum(case((model.rating == rating, 1), else_=0)) for rating in RATINGS)
+    )
+
+
+def increment(model, key_columns, rows, counters=COUNTERS):
+    """Add each row's counters to the stored row with the same key, creating missing rows."""
+    table = model.__table__
+    dialect = db.session.connection().dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        statement = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={column: table.c[column] + statement.excluded[column] for column in counters}
+        )
+        db.session.execute(statement, rows)
+        return
+
+    for row in rows:
+        result = db.session.execute(
+            update(table)
+            .where(*(table.c[column] == row[column] for column in key_columns))
+            .values({column: table.c[column] + row[column] for column in counters})
+        )
+        if result.rowcount == 0:
+            db.session.execute(insert(table).values(row))
+
+
+def apply_rollups(review_model, rows, sign=1):
+    model, key = ROLLUPS[review_model]
+
+    deltas = rating_deltas(rows, key, sign)
+    if deltas:
+        increment(model, [key, "day"], [
+            {key: entity_id, "day": day, **counters} for (entity_id, day), counters in deltas.items()
+        ])
+
+
+def rebuild_rollups():
+    for review_model, (model, key) in ROLLUPS.items():
+        column = getattr(review_model, key)
+
+        db.session.execute(delete(model))
+        db.session.execute(
+            insert(model).from_select(
+                [key, "day", *COUNTERS],
+                select(column, review_model.time, *rating_sums(review_model)).group_by(column, review_model.time)
+            )
+        )
+        # cached boards and ETags move on with the same commit as the rebuilt rows
+        bump_version(review_model.__tablename__)
+
+    db.session.commit()
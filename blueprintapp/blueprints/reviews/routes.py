@@ -1,11 +1,34 @@
-from flask import Blueprint, render_template, redirect, url_for, request, session
+import click
+
+from datetime import date
+
+from flask import Blueprint, render_template, redirect, url_for, request, session, current_app, abort
 from flask_login import login_user, logout_user, current_user, login_required
+from sqlalchemy import tuple_
 
 from blueprintapp.app import db
+from blueprintapp.routing import replica_reads
 from blueprintapp.blueprints.admin.models import Teacher, Discipline
+from blueprintapp.blueprints.admin.reference import get_reference_data
 from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+from blueprintapp.blueprints.reviews.aggregates import save_review, delete_review
+from blueprintapp.blueprints.reviews.distributions import get_distribution
+from blueprintapp.blueprints.reviews.leaderboard import get_leaderboard, leaderboard_versions
+from blueprintapp.blueprints.reviews import writebehind
+from blueprintapp.blueprints.reviews.writebehind import ReviewQueueFull, enqueue_review
+from blueprintapp.blueprints.reviews.projections import LISTING
+from blueprintapp.blueprints.reviews.pagination import encode_cursor, decode_cursor
+from blueprintapp.blueprints.reviews.explain import search_statements, explain, check_plans, load_expected_plans, save_expected_plans, expected_plans_path, create_schema
+from blueprintapp.blueprints.reviews.search import keywords, match_feedback
+from blueprintapp.blueprints.reviews.validation import review_values
+
+reviews = Blueprint("reviews", __name__, template_folder="templates")
+
+
+@reviews.errorhandler(ReviewQueueFull)
+def review_queue_full(e):
+    return "Too many reviews are being submitted right now. Please try again in a moment.", 503, {"Retry-After": "2"}
 
-reviews = Blueprint("reviews", __name__, template_folder="templates", static_folder="templates/reviews/assets")
 
 @reviews.route("/add_review")
 @login_required
@@ -17,30 +40,33 @@ def add_review():
 @reviews.route("/add_teacher", methods=["GET", "POST"])
 @login_required
 def add_teacher():
-    teachers = Teacher.query.all()
-    disciplines = Discipline.query.all()
+    reference = get_reference_data()
+    teachers = reference.teachers
+    disciplines = reference.disciplines
     
     if request.method == "GET":
-        return render_template("reviews/add_teacher.html", teachers=teachers, disciplines=disciplines)
+        return render_template("reviews/add_teacher.html", teachers=teachers, disciplines=disciplines, reference_version=reference.version)
     elif request.method == "POST":
-        teacher_id = request.form.get("teacher_id")
-        discipline_id = request.form.get("discipline_id")
+        teacher_id = request.form.get("teacher_id", type=int)
+        discipline_id = request.form.get("discipline_id", type=int)
+
+        teacher = reference.teacher_by_id.get(teacher_id)
+        discipline = reference.discipline_by_id.get(discipline_id)
+
+        if not teacher or not discipline:
+            return render_template("reviews/add_teacher.html", teachers=teachers, disciplines=disciplines, reference_version=reference.version, error="Please choose a teacher and a discipline.")
 
-        teacher = Teacher.query.get(teacher_id)
         name = teacher.name
         surname = teacher.surname
-
-        discipline = Discipline.query.get(discipline_id)
         discipline_name = discipline.name
 
-        teach_disciplines = [d.id for d in teacher.disciplines]
+        if not reference.teaches(teacher_id, discipline_id):
+            return render_template("reviews/add_teacher.html", teachers=teachers, disciplines=disciplines, reference_version=reference.version, error="Teacher is not assigned to this discipline.")
 
-        if int(discipline_id) not in teach_disciplines:
-            return render_template("reviews/add_teacher.html", teachers=teachers, disciplines=disciplines, error="Teacher is not assigned to this discipline.")
-
-        difficulty = request.form.get("difficulty")
-        rating = request.form.get("rating")
-        feedback = request.form.get("feedback")
+        try:
+            difficulty, rating, feedback = review_values(request.form)
+        except ValueError as e:
+            return render_template("reviews/add_teacher.html", teachers=teachers, disciplines=disciplines, reference_version=reference.version, error=f"Invalid review: {e}.")
 
         new_teacher_review = TeacherReview(
             user_id=current_user.id,
@@ -50,12 +76,15 @@ def add_teacher():
             surname=surname,
             discipline_name=discipline_name,
             difficulty=difficulty,
-            rating=int(rating),
+            rating=rating,
             feedback=feedback
         )
 
-        db.session.add(new_teacher_review)
-        db.session.commit()
+        if writebehind.enabled():
+            enqueue_review("teacher", new_teacher_review)
+        else:
+            save_review(new_teacher_review)
+            db.session.commit()
 
         return redirect(url_for("reviews.add_teacher"))
 
@@ -64,20 +93,25 @@ def add_teacher():
 @reviews.route("/add_discipline", methods=["GET", "POST"])
 @login_required
 def add_discipline():
-    disciplines = Discipline.query.all()
+    reference = get_reference_data()
+    disciplines = reference.disciplines
 
     if request.method == "GET":
-        return render_template("reviews/add_discipline.html", disciplines=disciplines)
+        return render_template("reviews/add_discipline.html", disciplines=disciplines, reference_version=reference.version)
     elif request.method == "POST":
-        discipline_id = request.form.get("discipline_id")
+        discipline_id = request.form.get("discipline_id", type=int)
+
+        discipline = reference.discipline_by_id.get(discipline_id)
 
-        discipline = Discipline.query.get(discipline_id)
+        if not discipline:
+            return render_template("reviews/add_discipline.html", disciplines=disciplines, reference_version=reference.version, error="Please choose a discipline.")
 
         name = discipline.name
 
-        difficulty = request.form.get("difficulty")
-        rating = request.form.get("rating")
-        feedback = request.form.get("feedback")
+        try:
+            difficulty, rating, feedback = review_values(request.form)
+        except ValueError as e:
+            return render_template("reviews/add_discipline.html", disciplines=disciplines, reference_version=reference.version, error=f"Invalid review: {e}.")
 
         new_discipline_review = DisciplineReview(
             user_id=current_user.id,
@@ -88,8 +122,11 @@ def add_discipline():
             feedback=feedback
         )
 
-        db.session.add(new_discipline_review)
-        db.session.commit()
+        if writebehind.enabled():
+            enqueue_review("discipline", new_discipline_review)
+        else:
+            save_review(new_discipline_review)
+            db.session.commit()
 
         return redirect(url_for("reviews.add_discipline"))
 
@@ -104,52 +141,88 @@ def search_reviews():
 
 @reviews.route("/search_teacher", methods=["GET", "POST"])
 @login_required
+@replica_reads()
 def search_teacher():
-    teachers = Teacher.query.all()
-    disciplines = Discipline.query.all()
-    reviews = TeacherReview.query.all()
+    reference = get_reference_data()
+    teachers = reference.teachers
+    disciplines = reference.disciplines
 
-    if request.method == "GET":
-        return render_template("reviews/search_teacher.html", teachers=teachers, disciplines=disciplines, reviews=reviews)
-    elif request.method == "POST":
-        teacher_id = request.form.get("teacher_id")
-        discipline_id = request.form.get("discipline_id")
+    # GET serves the first page and "next page" links, POST the search form
+    params = request.args if request.method == "GET" else request.form
 
-        difficulty = request.form.get("difficulty")
-        rating = request.form.get("rating")
-        time = request.form.get("time")
+    search_args = {
+        key: params.get(key)
+        for key in ("teacher_id", "discipline_id", "difficulty", "rating", "time", "q")
+        if params.get(key)
+    }
 
-        reviews = get_reviews(teacher_id, discipline_id, difficulty, rating, time)
+    reviews, next_cursor = get_reviews(**search_args, cursor=params.get("cursor"), columns=LISTING[0])
 
-        return render_template("reviews/search_teacher.html", teachers=teachers, disciplines=disciplines, reviews=reviews)
+    return render_template(
+        "reviews/search_teacher.html",
+        teachers=teachers,
+        disciplines=disciplines,
+        reference_version=reference.version,
+        reviews=reviews,
+        next_cursor=next_cursor,
+        search_args=search_args
+    )
 
 
 
 @reviews.route("/search_discipline", methods=["GET", "POST"])
 @login_required
+@replica_reads()
 def search_discipline():
-    disciplines = Discipline.query.all()
-    reviews = DisciplineReview.query.all()
+    reference = get_reference_data()
+    disciplines = reference.disciplines
 
-    if request.method == "GET":
-        return render_template("reviews/search_discipline.html", disciplines=disciplines, reviews=reviews)
-    elif request.method == "POST":
-        discipline_id = request.form.get("discipline_id")
+    params = request.args if request.method == "GET" else request.form
 
-        faculty = request.form.get("faculty")
-        type = request.form.get("type")
-        difficulty = request.form.get("difficulty")
-        rating = request.form.get("rating")
-        time = request.form.get("time")
+    search_args = {
+        key: params.get(key)
+        for key in ("discipline_id", "faculty", "type", "difficulty", "rating", "time", "q")
+        if params.get(key)
+    }
 
-        reviews = get_reviews(discipline_id=discipline_id, difficulty=difficulty, rating=rating, time=time, faculty=faculty, type=type, call=1)
+    reviews, next_cursor = get_reviews(**search_args, cursor=params.get("cursor"), call=1, columns=LISTING[1])
 
-        return render_template("reviews/search_discipline.html", disciplines=disciplines, reviews=reviews)
+    return render_template(
+        "reviews/search_discipline.html",
+        disciplines=disciplines,
+        reference_version=reference.version,
+        reviews=reviews,
+        next_cursor=next_cursor,
+        search_args=search_args
+    )
+
+
+
+@reviews.route("/teacher/<int:teacher_id>")
+@login_required
+@replica_reads()
+def teacher(teacher_id):
+    teacher = db.session.get(Teacher, teacher_id) or abort(404)
+    distribution = get_distribution(TeacherReview, teacher_id)
+
+    return render_template("reviews/distribution.html", title=f"{teacher.name} {teacher.surname}", distribution=distribution)
+
+
+
+@reviews.route("/discipline/<int:discipline_id>")
+@login_required
+@replica_reads()
+def discipline(discipline_id):
+    discipline = db.session.get(Discipline, discipline_id) or abort(404)
+    distribution = get_distribution(DisciplineReview, discipline_id)
+
+    return render_template("reviews/distribution.html", title=discipline.name, distribution=distribution)
 
 
 
 @reviews.route("/ratings", methods=["GET", "POST"])
 @login_required
+@replica_reads()
 def ratings():
     if request.method == "GET":
         return render_template("reviews/ratings.html")
@@ -157,17 +230,64 @@ def ratings():
     elif request.method == "POST":
         rank_type = request.form.get("rank_type")
 
-        if rank_type == "teacherRank":
-            teachers = Teacher.query.order_by(Teacher.avg_rating.desc()).limit(10).all()
-            return render_template("reviews/ratings.html", teachers=teachers)
+        limit = request.form.get("limit", type=int)
+        faculty = request.form.get("faculty")
+        type = request.form.get("type")
+        window = request.form.get("window") or "all"
+
+        kind = {"teacherRank": "teacher", "disciplineRank": "discipline"}.get(rank_type)
+        if kind is None:
+            return render_template("reviews/ratings.html")
+
+        # the board is loaded at these versions, and its rendered list is cached under them;
+        # windowed lists also change with the date
+        versions = leaderboard_versions(kind)
+        board = (kind, limit, faculty or None, type or None, window, None if window == "all" else date.today(), sorted(versions.items()))
+        rows = get_leaderboard(kind, limit, faculty, type, window, versions=versions)
+
+        if kind == "teacher":
+            return render_template("reviews/ratings.html", teachers=rows, board=board)
+        return render_template("reviews/ratings.html", disciplines=rows, board=board)
+
+
+
+def get_reviews(teacher_id=None, discipline_id=None, difficulty=None, rating=None, time=None, faculty=None, type=None, call=0, cursor=None, page_size=None, q=None, columns=None):
+    page_size = page_size or current_app.config["REVIEWS_PAGE_SIZE"]
+
+    # keyword searches without an explicit time order are ranked by relevance,
+    # which has no stable key to seek on, so those pages use an offset cursor
+    ranked = bool(keywords(q)) and not time
 
-        elif rank_type == "disciplineRank":
-            disciplines = Discipline.query.order_by(Discipline.avg_rating.desc()).limit(10).all()
-            return render_template("reviews/ratings.html", disciplines=disciplines)
+    query = reviews_query(teacher_id, discipline_id, difficulty, rating, time, faculty, type, call, None if ranked else cursor, q)
 
+    offset = 0
+    if ranked:
+        try:
+            (offset,) = decode_cursor(cursor)
+            offset = max(int(offset), 0)
+        except (TypeError, ValueError):
+            offset = 0
+        query = query.offset(offset)
 
+    # plain Row tuples instead of ORM instances, see projections.LISTING
+    if columns:
+        query = query.with_entities(*columns)
 
-def get_reviews(teacher_id=None, discipline_id=None, difficulty=None, rating=None, time=None, faculty=None, type=None, call=0):
+    reviews = query.limit(page_size + 1).all()
+
+    next_cursor = None
+    if len(reviews) > page_size:
+        reviews = reviews[:page_size]
+        if ranked:
+            next_cursor = encode_cursor(offset + page_size)
+        else:
+            next_cursor = encode_cursor(reviews[-1].time, reviews[-1].id)
+
+    return reviews, next_cursor
+
+
+
+def reviews_query(teacher_id=None, discipline_id=None, difficulty=None, rating=None, time=None, faculty=None, type=None, call=0, cursor=None, q=None):
     models = {0: TeacherReview, 1: DisciplineReview}
     model = models[call]
 
@@ -195,12 +315,28 @@ def get_reviews(teacher_id=None, discipline_id=None, difficulty=None, rating=Non
     if filters:
         query = query.filter(*filters)
 
-    if time == "new":
-        query = query.order_by(model.time.desc())
-    elif time == "old":
-        query = query.order_by(model.time.asc())
+    if keywords(q) and not time:
+        return match_feedback(query, model, q)
+
+    query = match_feedback(query, model, q, ranked=False)
+
+    # (time, id) is unique, so keyset pages never skip or repeat rows
+    try:
+        last_time, last_id = decode_cursor(cursor)
+        after = (date.fromisoformat(last_time), int(last_id))
+    except (TypeError, ValueError):
+        after = None
 
-    return query.all()
+    if time == "old":
+        if after:
+            query = query.filter(tuple_(model.time, model.id) > after)
+        query = query.order_by(model.time.asc(), model.id.asc())
+    else:
+        if after:
+            query = query.filter(tuple_(model.time, model.id) < after)
+        query = query.order_by(model.time.desc(), model.id.desc())
+
+    return query
 
 
 
@@ -211,7 +347,7 @@ def delete_teacher_review():
     review = TeacherReview.query.get(review_id)
 
     if review:
-        db.session.delete(review)
+        delete_review(review)
         db.session.commit()
 
         return redirect(url_for("auth.profile"))
@@ -225,7 +361,52 @@ def delete_discipline_review():
     review = DisciplineReview.query.get(review_id)
 
     if review:
-        db.session.delete(review)
+        delete_review(review)
         db.session.commit()
 
-        return redirect(url_for("auth.profile"))
\ No newline at end of file
+        return redirect(url_for("auth.profile"))
+
+
+
+@reviews.cli.command("explain")
+@click.option("--analyze", is_flag=True, help="Execute the queries (EXPLAIN ANALYZE) on PostgreSQL.")
+def explain_searches(analyze):
+    """Print the query plan of every review search filter combination."""
+    for label, statement in search_statements():
+        click.echo(label)
+        for line in explain(statement, analyze):
+            click.echo(f"    {line}")
+
+
+
+@reviews.cli.command("check-plans")
+@click.option("--update", is_flag=True, help="Record the current plans as the expected ones.")
+@click.option("--slack", default=2.0, show_default=True, help="With --update, allow scans this many times the current row estimates.")
+@click.option("--create-schema", "create", is_flag=True, help="Create missing tables first, e.g. on an empty sqlite:// database in CI.")
+def check_search_plans(update, slack, create):
+    """Fail when a review search plan no longer matches the recorded one.
+
+    Plans are recorded per database (plans/sqlite.json, plans/postgresql.json);
+    run against the database the plans should hold for, with the schema at head.
+    """
+    if create:
+        create_schema()
+
+    expected = load_expected_plans()
+    if expected is None and not update:
+        raise click.ClickException(f"No recorded plans at {expected_plans_path()}; run with --update first.")
+
+    plans, problems = check_plans(expected or {})
+
+    if update:
+        save_expected_plans(plans, slack)
+        click.echo(f"Recorded {len(plans)} plans in {expected_plans_path()}.")
+        return
+
+    for label, problem in problems:
+        click.echo(f"{label}: {problem}")
+
+    if problems:
+        raise click.ClickException(f"{len(problems)} of {len(plans)} search plans regressed; fix the query or index, or re-record with --update.")
+
+    click.echo(f"All {len(plans)} search plans match.")
@@ -0,0 +1,83 @@
+import re
+
+from sqlalchemy import DDL, column, event, func, literal_column, table
+
+from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+
+TS_CONFIG = literal_column("'simple'::regconfig")
+
+# PostgreSQL keeps this generated column in step with feedback, so ranking reads the stored vector
+TSV_COLUMN = "feedback_tsv"
+
+WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_table(model):
+    return table(f"{model.__tablename__}_fts", column("rowid"), column("rank"))
+
+
+def sqlite_fts_ddl(name):
+    fts = f"{name}_fts"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(feedback, content='{name}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {name} BEGIN "
+        f"INSERT INTO {fts}(rowid, feedback) VALUES (new.id, new.feedback); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, feedback) VALUES ('delete', old.id, old.feedback); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF feedback ON {name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, feedback) VALUES ('delete', old.id, old.feedback); "
+        f"INSERT INTO {fts}(rowid, feedback) VALUES (new.id, new.feedback); END",
+    ]
+
+
+def postgresql_fts_ddl(name):
+    return [
+        f"ALTER TABLE {name} ADD COLUMN IF NOT EXISTS {TSV_COLUMN} tsvector "
+        f"GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, feedback)) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{name}_feedback_fts ON {name} USING gin ({TSV_COLUMN})",
+    ]
+
+
+def feedback_vector(model):
+    # not mapped on the model: the column only exists on PostgreSQL
+    return literal_column(f"{model.__tablename__}.{TSV_COLUMN}")
+
+
+for model in (TeacherReview, DisciplineReview):
+    for statement in sqlite_fts_ddl(model.__tablename__):
+        event.listen(model.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(model.__table__, "before_drop", DDL(f"DROP TABLE IF EXISTS {model.__tablename__}_fts").execute_if(dialect="sqlite"))
+
+    for statement in postgresql_fts_ddl(model.__tablename__):
+        event.listen(model.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
+def keywords(q):
+    return WORD.findall(q or "")
+
+
+def match_feedback(query, model, q, ranked=True):
+    words = keywords(q)
+    if not words:
+        return query
+
+    dialect = query.session.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        fts = fts_table(model)
+        # quote every word so user input can never be parsed as FTS5 syntax
+        expression = " ".join('"' + word.replace('"', '""') + '"' for word in words)
+
+        query = query.join(fts, fts.c.rowid == model.id).filter(literal_column(fts.name).op("MATCH")(expression))
+        if ranked:
+            # bm25: lower is better
+            query = query.order_by(fts.c.rank.asc(), model.id.desc())
+        return query
+
+    document = feedback_vector(model)
+    tsquery = func.plainto_tsquery(TS_CONFIG, " ".join(words))
+
+    query = query.filter(document.op("@@")(tsquery))
+    if ranked:
+        query = query.order_by(func.ts_rank_cd(document, tsquery).desc(), model.id.desc())
+    return query
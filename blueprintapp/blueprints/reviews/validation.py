@@ -0,0 +1,30 @@
+from blueprintapp.blueprints.reviews.models import RATINGS, DIFFICULTIES
+
+
+def parse_rating(value):
+    """Return the rating as an int from RATINGS; raises ValueError saying what is wrong."""
+    try:
+        rating = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"rating {value!r} is not a whole number") from None
+    if rating not in RATINGS:
+        raise ValueError(f"rating {rating} is not between {RATINGS.start} and {RATINGS.stop - 1}")
+    return rating
+
+
+def check_difficulty(value):
+    if value not in DIFFICULTIES:
+        raise ValueError(f"difficulty {value!r} is not one of {', '.join(DIFFICULTIES)}")
+    return value
+
+
+def review_values(form):
+    """Check a submitted review form; returns (difficulty, rating, feedback) or raises ValueError."""
+    difficulty = check_difficulty(form.get("difficulty"))
+    rating = parse_rating(form.get("rating"))
+
+    feedback = form.get("feedback") or ""
+    if not feedback.strip():
+        raise ValueError("feedback is empty")
+
+    return difficulty, rating, feedback
@@ -0,0 +1,248 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+
+from flask import current_app
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.reviews.models import TeacherReview, DisciplineReview
+from blueprintapp.blueprints.reviews.aggregates import apply_reviews
+
+MODELS = {"teacher": TeacherReview, "discipline": DisciplineReview}
+
+
+class ReviewQueueFull(Exception):
+    """Raised when the queue stays full for longer than REVIEW_ENQUEUE_TIMEOUT."""
+
+
+class ReviewQueue:
+    """Durable FIFO of pending reviews in a local SQLite file.
+
+    Rows are claimed with a lease instead of being removed, and only deleted
+    once they are committed to the main database. Rows left behind by a
+    crashed process become claimable again when their lease runs out, so
+    delivery is at-least-once.
+    """
+
+    def __init__(self, path, maxsize, lease=60):
+        self.path = path
+        self.maxsize = maxsize
+        self.lease = lease
+
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS queue ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, payload TEXT NOT NULL, "
+            "claimed_at REAL, failed TEXT)"
+        )
+
+    def depth(self):
+        with self._lock:
+            return self._depth()
+
+    def _depth(self):
+        return self._connection.execute("SELECT count(*) FROM queue WHERE failed IS NULL").fetchone()[0]
+
+    def put(self, kind, row, timeout):
+        payload = json.dumps(row)
+        deadline = time.monotonic() + timeout
+
+        with self._space:
+            # other processes may share the file, so re-check the real depth instead of trusting a counter
+            while self._depth() >= self.maxsize:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ReviewQueueFull()
+                self._space.wait(min(remaining, 0.05))
+
+            self._connection.execute("INSERT INTO queue (kind, payload) VALUES (?, ?)", (kind, payload))
+
+    def claim(self, limit):
+        now = time.time()
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._connection.execute(
+                    "SELECT id, kind, payload FROM queue "
+                    "WHERE failed IS NULL AND (claimed_at IS NULL OR claimed_at < ?) ORDER BY id LIMIT ?",
+                    (now - self.lease, limit)
+                ).fetchall()
+                self._connection.executemany("UPDATE queue SET claimed_at = ? WHERE id = ?", [(now, row[0]) for row in rows])
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+        return [(id, kind, json.loads(payload)) for id, kind, payload in rows]
+
+    def ack(self, ids):
+        with self._space:
+            self._connection.executemany("DELETE FROM queue WHERE id = ?", [(id,) for id in ids])
+            self._space.notify_all()
+
+    def release(self, ids):
+        with self._lock:
+            self._connection.executemany("UPDATE queue SET claimed_at = NULL WHERE id = ?", [(id,) for id in ids])
+
+    def bury(self, id, error):
+        # kept in the file for inspection instead of blocking the queue forever
+        with self._space:
+            self._connection.execute("UPDATE queue SET failed = ? WHERE id = ?", (error, id))
+            self._space.notify_all()
+
+
+class ReviewWriter(threading.Thread):
+    """Drains the queue in batches, one transaction and one aggregate update per batch."""
+
+    def __init__(self, app, queue):
+        super().__init__(name="review-writer", daemon=True)
+        self.app = app
+        self.queue = queue
+        self.batch_size = app.config["REVIEW_BATCH_SIZE"]
+        self.interval = app.config["REVIEW_FLUSH_INTERVAL"]
+
+        self.started = False
+        self.wake = threading.Event()
+        self.stopping = threading.Event()
+        self.counters = {"enqueued": 0, "written": 0, "batches": 0, "failed": 0, "rejected": 0}
+        self._counters_lock = threading.Lock()
+
+    def count(self, name, delta=1):
+        with self._counters_lock:
+            self.counters[name] += delta
+
+    def run(self):
+        while not self.stopping.is_set():
+            self.wake.wait(self.interval)
+            self.wake.clear()
+            try:
+                self.drain()
+            except Exception:
+                self.app.logger.exception("Review writer failed; retrying in %.1fs", self.interval)
+
+    def drain(self):
+        with self.app.app_context():
+            while batch := self.queue.claim(self.batch_size):
+                try:
+                    self.write(batch)
+                except (IntegrityError, DataError):
+                    db.session.rollback()
+                    self.write_one_by_one(batch)
+                except Exception:
+                    # e.g. the database is unreachable: keep the batch for the next attempt
+                    db.session.rollback()
+                    self.queue.release([id for id, _, _ in batch])
+                    raise
+                else:
+                    self.queue.ack([id for id, _, _ in batch])
+                    self.count("written", len(batch))
+                self.count("batches")
+
+    def write(self, batch):
+        by_kind = {}
+        for _, kind, row in batch:
+            by_kind.setdefault(kind, []).append({**row, "time": date.fromisoformat(row["time"])})
+
+        for kind, rows in by_kind.items():
+            model = MODELS[kind]
+            db.session.execute(insert(model.__table__), rows)
+            apply_reviews(model, rows)
+
+        db.session.commit()
+
+    def write_one_by_one(self, batch):
+        # find the row that broke the batch so the others still get written
+        for item in batch:
+            try:
+                self.write([item])
+            except (IntegrityError, DataError) as e:
+                db.session.rollback()
+                self.app.logger.error("Dropping queued review %s: %s", item[0], e)
+                self.queue.bury(item[0], str(e))
+                self.count("failed")
+            else:
+                self.queue.ack([item[0]])
+                self.count("written")
+
+    def stop(self, timeout=10):
+        self.stopping.set()
+        self.wake.set()
+        self.join(timeout)
+        # whatever arrived while stopping is written by the caller's thread
+        self.drain()
+
+
+_lock = threading.Lock()
+
+
+def writer(app):
+    """The app's writer, created on first use so a process that queues nothing never opens the queue file."""
+    with _lock:
+        if "review_writer" not in app.extensions:
+            path = app.config["REVIEW_QUEUE_PATH"]
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            app.extensions["review_writer"] = ReviewWriter(app, ReviewQueue(path, app.config["REVIEW_QUEUE_MAX"]))
+        return app.extensions["review_writer"]
+
+
+def start(app):
+    """Start draining the queue in this process, including anything a previous process left in the file."""
+    current = writer(app)
+    with _lock:
+        if current.started:
+            return
+        current.started = True
+
+    current.start()
+    atexit.register(current.stop)
+
+
+def init_app(app):
+    if not app.config["REVIEW_WRITE_BEHIND"]:
+        return
+
+    # only a process that serves requests writes; CLI commands such as migrations leave the queue alone
+    @app.before_request
+    def start_writer():
+        current = app.extensions.get("review_writer")
+        if current is None or not current.started:
+            start(app)
+
+
+def enabled():
+    return current_app.config["REVIEW_WRITE_BEHIND"]
+
+
+def enqueue_review(kind, review):
+    """Queue a validated, unsaved review and return without touching the database."""
+    current = writer(current_app._get_current_object())
+    row = {column.key: getattr(review, column.key) for column in review.__table__.columns if column.key not in ("id", "time")}
+    row["time"] = date.today().isoformat()
+
+    try:
+        current.queue.put(kind, row, current_app.config["REVIEW_ENQUEUE_TIMEOUT"])
+    except ReviewQueueFull:
+        current.count("rejected")
+        raise
+
+    current.count("enqueued")
+    if current.queue.depth() >= current.batch_size:
+        current.wake.set()
+
+
+def stats():
+    current = current_app.extensions.get("review_writer")
+    if current is None:
+        return None
+    return {**current.counters, "depth": current.queue.depth(), "max_depth": current.queue.maxsize}
@@ -0,0 +1,116 @@
+import hashlib
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from blueprintapp.cache import LRUCache
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+_MISSING = object()
+
+cache = LRUCache(maxsize=512)
+
+
+class RedisBackend:
+    """Shares rendered fragments between processes; same get/set interface as LRUCache."""
+
+    def __init__(self, url, prefix="fragment:", ttl=None):
+        if redis is None:
+            raise RuntimeError("FRAGMENT_CACHE_URL needs the 'redis' package")
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        value = self.client.get(self.prefix + key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value.decode("utf-8")
+
+    def set(self, key, value, ttl=None):
+        self.client.set(self.prefix + key, value, ex=ttl or self.ttl)
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + "*"):
+            self.client.delete(key)
+
+    def stats(self):
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses}
+
+
+class FragmentCacheExtension(Extension):
+    """{% cache key, ... [, ttl=seconds] %}...{% endcache %}
+
+    The body is rendered once per distinct key; later renders return the
+    stored HTML without evaluating the body. The keys must include the
+    version of the data the body is rendered from (e.g. reference_version),
+    so new data is never stored under an old key or the other way round.
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+
+        keys = [nodes.Const(parser.name), nodes.Const(lineno)]
+        options = {"ttl": nodes.Const(None)}
+
+        first = True
+        while parser.stream.current.type != "block_end":
+            if not first:
+                parser.stream.expect("comma")
+            first = False
+
+            if parser.stream.current.type == "name" and parser.stream.look().type == "assign":
+                name = next(parser.stream)
+                if name.value not in options:
+                    parser.fail(f"unknown cache option '{name.value}'", name.lineno)
+                next(parser.stream)
+                options[name.value] = parser.parse_expression()
+            else:
+                keys.append(parser.parse_expression())
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+
+        call = self.call_method("_render", [nodes.List(keys), options["ttl"]])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(self, keys, ttl, caller):
+        return render_fragment(keys, ttl, caller)
+
+
+def init_app(app):
+    global cache
+
+    url = app.config["FRAGMENT_CACHE_URL"]
+    if url:
+        cache = RedisBackend(url, ttl=app.config["FRAGMENT_CACHE_TTL"])
+    else:
+        cache = LRUCache(app.config["FRAGMENT_CACHE_SIZE"], app.config["FRAGMENT_CACHE_TTL"])
+
+    app.jinja_env.add_extension(FragmentCacheExtension)
+
+
+def fragment_key(keys):
+    return hashlib.sha1(repr(tuple(keys)).encode("utf-8")).hexdigest()
+
+
+def render_fragment(keys, ttl, caller):
+    key = fragment_key(keys)
+
+    html = cache.get(key, _MISSING)
+    if html is _MISSING:
+        html = str(caller())
+        cache.set(key, html, ttl)
+
+    return Markup(html)
@@ -0,0 +1,184 @@
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_WHITESPACE = re.compile(r"\s+")
+
+_listening = False
+# budgets opened by query_budget in this thread/task; queries on other threads never count against them
+_active_counters = ContextVar("query_budgets", default=())
+
+recent_requests = deque(maxlen=200)
+_recent_lock = threading.Lock()
+
+startup = {}
+_startup_lock = threading.Lock()
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.statements = Counter()
+        self.slow = []
+
+    def record(self, statement, duration, slow_threshold=None):
+        statement = _WHITESPACE.sub(" ", statement).strip()
+
+        self.count += 1
+        self.total_time += duration
+        self.statements[statement] += 1
+
+        if slow_threshold is not None and duration >= slow_threshold:
+            self.slow.append((statement, duration))
+
+    def repeated(self, threshold):
+        # the same SQL text issued many times in one request is almost always a lazy load in a loop
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+def init_app(app):
+    if not app.config.get("SQL_INSTRUMENTATION"):
+        return
+
+    _listen()
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+
+
+def track_startup(app, started):
+    """Record how long create_app took and, once, how long until the first response went out.
+
+    `started` is a time.perf_counter() value taken when create_app began.
+    """
+    startup.clear()
+    startup["create_app_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    @app.after_request
+    def first_response(response):
+        if "first_response_ms" in startup:
+            return response
+
+        with _startup_lock:
+            if "first_response_ms" not in startup:
+                startup["first_response_ms"] = round((time.perf_counter() - started) * 1000, 2)
+                startup["first_response_path"] = request.path
+                app.logger.info("First response %.1f ms after startup (%s)", startup["first_response_ms"], request.path)
+        return response
+
+
+def _listen():
+    global _listening
+
+    # Engine-level listeners also cover engines created after startup (e.g. extra binds)
+    if not _listening:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        _listening = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start"].pop()
+
+    for counter in _active_counters.get():
+        counter.record(statement, duration)
+
+    if has_request_context() and "sql_stats" in g:
+        g.sql_stats.record(statement, duration, current_app.config["SQL_SLOW_QUERY_MS"] / 1000)
+
+
+def _handle_error(context):
+    # a failed statement never reaches after_cursor_execute; drop its start time so the next one is timed right
+    connection = context.connection
+    if connection is not None and connection.info.get("query_start"):
+        connection.info["query_start"].pop()
+
+
+def _start_request():
+    g.sql_stats = QueryStats()
+
+
+def _finish_request(response):
+    stats = g.pop("sql_stats", None)
+    if stats is None:
+        return response
+
+    config = current_app.config
+    suspects = stats.repeated(config["SQL_N_PLUS_ONE_THRESHOLD"])
+
+    response.headers["X-SQL-Queries"] = str(stats.count)
+    response.headers["X-SQL-Time-Ms"] = f"{stats.total_time * 1000:.2f}"
+    if suspects:
+        response.headers["X-SQL-N-Plus-One"] = str(len(suspects))
+
+    for statement, duration in stats.slow:
+        current_app.logger.warning("Slow query (%.1f ms) in %s %s: %s", duration * 1000, request.method, request.path, statement)
+
+    with _recent_lock:
+        recent_requests.append({
+            "method": request.method,
+            "path": request.path,
+            "endpoint": request.endpoint,
+            "status": response.status_code,
+            "queries": stats.count,
+            "db_time_ms": round(stats.total_time * 1000, 2),
+            "slow_queries": [{"sql": statement, "ms": round(duration * 1000, 2)} for statement, duration in stats.slow],
+            "n_plus_one_suspects": [{"sql": statement, "count": count} for statement, count in suspects],
+        })
+
+    return response
+
+
+def request_summary():
+    with _recent_lock:
+        requests = list(recent_requests)
+
+    endpoints = {}
+    for entry in requests:
+        summary = endpoints.setdefault(entry["endpoint"], {"requests": 0, "queries": 0, "db_time_ms": 0.0, "max_queries": 0})
+        summary["requests"] += 1
+        summary["queries"] += entry["queries"]
+        summary["db_time_ms"] = round(summary["db_time_ms"] + entry["db_time_ms"], 2)
+        summary["max_queries"] = max(summary["max_queries"], entry["queries"])
+
+    return {"endpoints": endpoints, "recent": requests}
+
+
+@contextmanager
+def query_budget(max_queries):
+    """Fail with AssertionError when the block issues more than max_queries statements.
+
+        with query_budget(3):
+            client.get("/reviews/search_teacher")
+    """
+    _listen()
+
+    stats = QueryStats()
+    token = _active_counters.set(_active_counters.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_counters.reset(token)
+
+    if stats.count > max_queries:
+        statements = "\n".join(f"  {count}x {statement}" for statement, count in stats.statements.most_common())
+        raise AssertionError(f"Expected at most {max_queries} queries, got {stats.count}:\n{statements}")
+
+
+def assert_route_budget(client, path, max_queries, method="GET", **kwargs):
+    """Request `path` through a Flask test client and fail if it needs more than max_queries statements."""
+    with query_budget(max_queries):
+        return client.open(path, method=method, **kwargs)
@@ -0,0 +1,409 @@
+import atexit
+import json
+import math
+import os
+import smtplib
+import sqlite3
+import threading
+import time
+from collections import deque
+from email.message import EmailMessage
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+mail_cli = AppGroup("mail", help="Inspect the outgoing mail queue.")
+
+
+class MailQueue:
+    """Durable queue of outgoing messages in a local SQLite file.
+
+    Works like the review write-behind queue: rows are claimed with a lease
+    and deleted once sent, so a crashed worker's messages are sent again
+    later. Failed sends wait in the file until `next_attempt_at`, and messages
+    that cannot be delivered are kept with `failed` set (the dead letters).
+    """
+
+    def __init__(self, path, lease=120):
+        self.path = path
+        self.lease = lease
+
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS mail ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, payload TEXT NOT NULL, enqueued_at REAL NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, next_attempt_at REAL NOT NULL, claimed_at REAL, "
+            "last_error TEXT, failed TEXT)"
+        )
+
+    def depth(self):
+        with self._lock:
+            return self._connection.execute("SELECT count(*) FROM mail WHERE failed IS NULL").fetchone()[0]
+
+    def dead(self):
+        with self._lock:
+            return self._connection.execute(
+                "SELECT id, payload, attempts, failed FROM mail WHERE failed IS NOT NULL ORDER BY id"
+            ).fetchall()
+
+    def put(self, message):
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO mail (payload, enqueued_at, next_attempt_at) VALUES (?, ?, ?)", (json.dumps(message), now, now)
+            )
+
+    def claim(self, limit):
+        now = time.time()
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._connection.execute(
+                    "SELECT id, payload, enqueued_at, attempts FROM mail "
+                    "WHERE failed IS NULL AND next_attempt_at <= ? AND (claimed_at IS NULL OR claimed_at < ?) "
+                    "ORDER BY next_attempt_at, id LIMIT ?",
+                    (now, now - self.lease, limit)
+                ).fetchall()
+                self._connection.executemany("UPDATE mail SET claimed_at = ? WHERE id = ?", [(now, row[0]) for row in rows])
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+        return [(id, json.loads(payload), enqueued_at, attempts) for id, payload, enqueued_at, attempts in rows]
+
+    def ack(self, id):
+        with self._lock:
+            self._connection.execute("DELETE FROM mail WHERE id = ?", (id,))
+
+    def release(self, ids):
+        with self._lock:
+            self._connection.executemany("UPDATE mail SET claimed_at = NULL WHERE id = ?", [(id,) for id in ids])
+
+    def retry(self, id, error, delay):
+        with self._lock:
+            self._connection.execute(
+                "UPDATE mail SET attempts = attempts + 1, next_attempt_at = ?, claimed_at = NULL, last_error = ? WHERE id = ?",
+                (time.time() + delay, error, id)
+            )
+
+    def bury(self, id, error):
+        with self._lock:
+            self._connection.execute(
+                "UPDATE mail SET attempts = attempts + 1, claimed_at = NULL, last_error = ?, failed = ? WHERE id = ?",
+                (error, error, id)
+            )
+
+    def requeue(self, ids=None):
+        """Give dead letters (all of them, or just `ids`) a fresh set of attempts."""
+        query = "UPDATE mail SET failed = NULL, attempts = 0, next_attempt_at = ? WHERE failed IS NOT NULL"
+        with self._lock:
+            if ids is None:
+                return self._connection.execute(query, (time.time(),)).rowcount
+            return sum(
+                self._connection.execute(query + " AND id = ?", (time.time(), id)).rowcount for id in ids
+            )
+
+
+class ConsoleTransport:
+    """Prints messages instead of sending them; the default for development."""
+
+    def open(self):
+        return self
+
+    def send(self, message):
+        print(f"To: {message['To']}\nSubject: {message['Subject']}\n\n{message.get_content()}", flush=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class SMTPTransport:
+    """One SMTP connection per batch, so a batch pays for the handshake once."""
+
+    def __init__(self, host, port, username=None, password=None, starttls=False, timeout=10):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+
+    def open(self):
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                connection.starttls()
+            if self.username:
+                connection.login(self.username, self.password)
+        except BaseException:
+            connection.close()
+            raise
+        return SMTPConnection(connection)
+
+
+class SMTPConnection:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def send(self, message):
+        self.connection.send_message(message)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self.connection.quit()
+        except OSError:
+            self.connection.close()
+        return False
+
+
+def permanent(error):
+    """5xx replies will not change on retry; everything else (4xx, network errors) might."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(500 <= code < 600 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 500 <= error.smtp_code < 600
+    return False
+
+
+def broken(error):
+    # the connection cannot be used for the rest of the batch
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class MailWorker(threading.Thread):
+    """Sends claimed batches until stopped; several of them share one queue and one Dispatcher."""
+
+    def __init__(self, dispatcher, index):
+        super().__init__(name=f"mail-worker-{index}", daemon=True)
+        self.dispatcher = dispatcher
+
+    def run(self):
+        dispatcher = self.dispatcher
+        while not dispatcher.stopping.is_set():
+            try:
+                if not dispatcher.deliver_batch():
+                    with dispatcher.wake:
+                        dispatcher.wake.wait(dispatcher.interval)
+            except Exception:
+                dispatcher.app.logger.exception("Mail worker failed; retrying in %.1fs", dispatcher.interval)
+                dispatcher.stopping.wait(dispatcher.interval)
+
+
+class Dispatcher:
+    """Owns the queue, the transport and the worker pool, and keeps delivery statistics."""
+
+    def __init__(self, app, queue, transport):
+        self.app = app
+        self.queue = queue
+        self.transport = transport
+        self.sender = app.config["MAIL_SENDER"]
+        self.batch_size = app.config["MAIL_BATCH_SIZE"]
+        self.interval = app.config["MAIL_POLL_INTERVAL"]
+        self.max_attempts = app.config["MAIL_MAX_ATTEMPTS"]
+        self.backoff = app.config["MAIL_RETRY_BACKOFF"]
+        self.max_delay = app.config["MAIL_RETRY_MAX_DELAY"]
+
+        self.started = False
+        self.wake = threading.Condition()
+        self.stopping = threading.Event()
+        self.workers = [MailWorker(self, index) for index in range(app.config["MAIL_WORKERS"])]
+
+        self.counters = {"enqueued": 0, "sent": 0, "retried": 0, "dead": 0, "batches": 0}
+        # seconds from enqueue to accepted by the server, for the most recent deliveries
+        self.latencies = deque(maxlen=1000)
+        self._stats_lock = threading.Lock()
+
+    def count(self, name, delta=1):
+        with self._stats_lock:
+            self.counters[name] += delta
+
+    def start(self):
+        for worker in self.workers:
+            worker.start()
+
+    def stop(self, timeout=5):
+        self.stopping.set()
+        with self.wake:
+            self.wake.notify_all()
+        for worker in self.workers:
+            worker.join(timeout)
+
+    def enqueue(self, message):
+        self.queue.put(message)
+        self.count("enqueued")
+        with self.wake:
+            self.wake.notify()
+
+    def message(self, payload):
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = payload["to"]
+        message["Subject"] = payload["subject"]
+        message.set_content(payload["body"])
+        return message
+
+    def delay(self, attempts):
+        return min(self.max_delay, self.backoff * 2 ** attempts)
+
+    def deliver_batch(self):
+        """Send one claimed batch; returns False when there was nothing to send."""
+        batch = self.queue.claim(self.batch_size)
+        if not batch:
+            return False
+
+        self.count("batches")
+        try:
+            connection = self.transport.open()
+        except Exception as e:
+            for id, _, _, attempts in batch:
+                self.failed(id, attempts, e)
+            return True
+
+        with connection:
+            for position, (id, payload, enqueued_at, attempts) in enumerate(batch):
+                try:
+                    connection.send(self.message(payload))
+                except Exception as e:
+                    self.failed(id, attempts, e)
+                    if broken(e):
+                        # the rest never reached the server; hand them back without using up an attempt
+                        self.queue.release([item[0] for item in batch[position + 1:]])
+                        break
+                else:
+                    self.queue.ack(id)
+                    self.count("sent")
+                    with self._stats_lock:
+                        self.latencies.append(time.time() - enqueued_at)
+
+        return True
+
+    def failed(self, id, attempts, error):
+        description = f"{type(error).__name__}: {error}"
+
+        if permanent(error) or attempts + 1 >= self.max_attempts:
+            self.app.logger.error("Giving up on mail %s after %d attempts: %s", id, attempts + 1, description)
+            self.queue.bury(id, description)
+            self.count("dead")
+        else:
+            self.queue.retry(id, description, self.delay(attempts))
+            self.count("retried")
+
+    def stats(self):
+        with self._stats_lock:
+            latencies = sorted(self.latencies)
+            counters = dict(self.counters)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[max(0, math.ceil(p / 100 * len(latencies)) - 1)] * 1000, 1)
+
+        return {
+            **counters,
+            "depth": self.queue.depth(),
+            "workers": len(self.workers),
+            "latency_p50_ms": percentile(50),
+            "latency_p95_ms": percentile(95),
+            "latency_max_ms": round(latencies[-1] * 1000, 1) if latencies else None,
+        }
+
+
+_lock = threading.Lock()
+
+
+def make_transport(app):
+    backend = app.config["MAIL_BACKEND"]
+
+    if backend == "console":
+        return ConsoleTransport()
+    if backend == "smtp":
+        return SMTPTransport(
+            app.config["MAIL_SMTP_HOST"],
+            app.config["MAIL_SMTP_PORT"],
+            app.config["MAIL_SMTP_USERNAME"],
+            app.config["MAIL_SMTP_PASSWORD"],
+            app.config["MAIL_SMTP_STARTTLS"],
+            app.config["MAIL_SMTP_TIMEOUT"],
+        )
+    raise RuntimeError(f"Unknown MAIL_BACKEND {backend!r}; use console or smtp")
+
+
+def dispatcher(app):
+    """The app's dispatcher, created on first use so a process that sends no mail never opens the queue file."""
+    with _lock:
+        if "mail" not in app.extensions:
+            path = app.config["MAIL_QUEUE_PATH"]
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            app.extensions["mail"] = Dispatcher(app, MailQueue(path), make_transport(app))
+        return app.extensions["mail"]
+
+
+def start(app):
+    """Start the workers in this process; they also send whatever a previous process left in the queue file."""
+    current = dispatcher(app)
+    with _lock:
+        if current.started:
+            return
+        current.started = True
+
+    current.start()
+    atexit.register(current.stop)
+
+
+def init_app(app):
+    app.cli.add_command(mail_cli)
+
+    # only a process that serves requests delivers; CLI commands and scripts never send what others queued
+    @app.before_request
+    def start_workers():
+        current = app.extensions.get("mail")
+        if current is None or not current.started:
+            start(app)
+
+
+def send_mail(to, subject, body):
+    """Queue a plain-text message; a background worker delivers it."""
+    dispatcher(current_app._get_current_object()).enqueue({"to": to, "subject": subject, "body": body})
+
+
+def send_verification_code(email, code):
+    send_mail(email, "Your TeacherRank verification code", f"Your verification code is {code}.")
+
+
+def stats():
+    current = current_app.extensions.get("mail")
+    if current is None:
+        return None
+    return current.stats()
+
+
+@mail_cli.command("status")
+def status_command():
+    """Show queue depth, delivery counters and undeliverable messages."""
+    queue = MailQueue(current_app.config["MAIL_QUEUE_PATH"])
+
+    click.echo(f"Waiting: {queue.depth()}")
+    for id, payload, attempts, error in queue.dead():
+        click.echo(f"Dead #{id} to {json.loads(payload)['to']} after {attempts} attempts: {error}")
+
+
+@mail_cli.command("requeue")
+@click.argument("ids", nargs=-1, type=int)
+def requeue_command(ids):
+    """Try dead letters again (all of them unless IDS are given)."""
+    queue = MailQueue(current_app.config["MAIL_QUEUE_PATH"])
+    click.echo(f"Requeued {queue.requeue(list(ids) or None)} messages.")
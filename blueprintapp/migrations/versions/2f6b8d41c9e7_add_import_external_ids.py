@@ -0,0 +1,37 @@
+"""add import external ids
+
+Revision ID: 2f6b8d41c9e7
+Revises: 9a0c4e6f1d83
+Create Date: 2026-10-18 15:48:03.527114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2f6b8d41c9e7'
+down_revision = '9a0c4e6f1d83'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # existing rows keep NULL, which the unique constraints allow any number of times
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('external_id', sa.String(length=64), nullable=True))
+        batch_op.create_unique_constraint('uq_teachers_external_id', ['external_id'])
+
+    with op.batch_alter_table('disciplines', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('external_id', sa.String(length=64), nullable=True))
+        batch_op.create_unique_constraint('uq_disciplines_external_id', ['external_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('disciplines', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_disciplines_external_id', type_='unique')
+        batch_op.drop_column('external_id')
+
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_teachers_external_id', type_='unique')
+        batch_op.drop_column('external_id')
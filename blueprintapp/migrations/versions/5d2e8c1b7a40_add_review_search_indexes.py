@@ -0,0 +1,58 @@
+"""add review search indexes
+
+Revision ID: 5d2e8c1b7a40
+Revises: c41f0a7d2e9b
+Create Date: 2026-10-18 11:37:52.904126
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e8c1b7a40'
+down_revision = 'c41f0a7d2e9b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('teacher_reviews', schema=None) as batch_op:
+        batch_op.create_index('ix_teacher_reviews_time_id', ['time', 'id'], unique=False, postgresql_include=['rating', 'difficulty'])
+        batch_op.create_index('ix_teacher_reviews_teacher_time', ['teacher_id', 'time', 'id'], unique=False, postgresql_include=['discipline_id', 'rating', 'difficulty'])
+        batch_op.create_index('ix_teacher_reviews_discipline_time', ['discipline_id', 'time', 'id'], unique=False, postgresql_include=['rating', 'difficulty'])
+        batch_op.create_index('ix_teacher_reviews_difficulty_time', ['difficulty', 'time', 'id'], unique=False, postgresql_include=['rating'])
+        batch_op.create_index('ix_teacher_reviews_user_id', ['user_id', 'id'], unique=False)
+
+    with op.batch_alter_table('discipline_reviews', schema=None) as batch_op:
+        batch_op.create_index('ix_discipline_reviews_time_id', ['time', 'id'], unique=False, postgresql_include=['rating', 'difficulty'])
+        batch_op.create_index('ix_discipline_reviews_discipline_time', ['discipline_id', 'time', 'id'], unique=False, postgresql_include=['rating', 'difficulty'])
+        batch_op.create_index('ix_discipline_reviews_difficulty_time', ['difficulty', 'time', 'id'], unique=False, postgresql_include=['rating'])
+        batch_op.create_index('ix_discipline_reviews_user_id', ['user_id', 'id'], unique=False)
+
+    with op.batch_alter_table('disciplines', schema=None) as batch_op:
+        batch_op.create_index('ix_disciplines_faculty_type', ['faculty', 'type'], unique=False)
+
+    with op.batch_alter_table('teacher_discipline', schema=None) as batch_op:
+        batch_op.create_index('ix_teacher_discipline_discipline_id', ['discipline_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('teacher_discipline', schema=None) as batch_op:
+        batch_op.drop_index('ix_teacher_discipline_discipline_id')
+
+    with op.batch_alter_table('disciplines', schema=None) as batch_op:
+        batch_op.drop_index('ix_disciplines_faculty_type')
+
+    with op.batch_alter_table('discipline_reviews', schema=None) as batch_op:
+        batch_op.drop_index('ix_discipline_reviews_user_id')
+        batch_op.drop_index('ix_discipline_reviews_difficulty_time')
+        batch_op.drop_index('ix_discipline_reviews_discipline_time')
+        batch_op.drop_index('ix_discipline_reviews_time_id')
+
+    with op.batch_alter_table('teacher_reviews', schema=None) as batch_op:
+        batch_op.drop_index('ix_teacher_reviews_user_id')
+        batch_op.drop_index('ix_teacher_reviews_difficulty_time')
+        batch_op.drop_index('ix_teacher_reviews_discipline_time')
+        batch_op.drop_index('ix_teacher_reviews_teacher_time')
+        batch_op.drop_index('ix_teacher_reviews_time_id')
@@ -0,0 +1,34 @@
+"""add data versions
+
+Revision ID: 9a0c4e6f1d83
+Revises: e7a93f05b6c2
+Create Date: 2026-10-18 14:22:40.183752
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a0c4e6f1d83'
+down_revision = 'e7a93f05b6c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    data_versions = op.create_table('data_versions',
+    sa.Column('name', sa.String(length=40), nullable=False),
+    sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # every counter gets its row up front, so the first bumps only ever update
+    op.bulk_insert(data_versions, [
+        {'name': 'reference', 'version': 1},
+        {'name': 'teacher_reviews', 'version': 0},
+        {'name': 'discipline_reviews', 'version': 0},
+    ])
+
+
+def downgrade():
+    op.drop_table('data_versions')
@@ -0,0 +1,73 @@
+"""add daily rating rollups
+
+Revision ID: b3e1f7a9c5d2
+Revises: 2f6b8d41c9e7
+Create Date: 2026-10-18 19:12:40.276531
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e1f7a9c5d2'
+down_revision = '2f6b8d41c9e7'
+branch_labels = None
+depends_on = None
+
+RATINGS = range(1, 11)
+
+
+def counter_columns():
+    return [
+        sa.Column('review_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False),
+        *(sa.Column(f'r{rating}', sa.Integer(), server_default='0', nullable=False) for rating in RATINGS),
+    ]
+
+
+def backfill(table, reviews, key):
+    counters = ", ".join(f"r{rating}" for rating in RATINGS)
+    sums = ", ".join(f"SUM(CASE WHEN rating = {rating} THEN 1 ELSE 0 END)" for rating in RATINGS)
+    op.execute(
+        f"INSERT INTO {table} ({key}, day, review_count, rating_sum, {counters}) "
+        f"SELECT {key}, time, COUNT(*), SUM(rating), {sums} FROM {reviews} GROUP BY {key}, time"
+    )
+
+
+def upgrade():
+    op.create_table('teacher_daily_ratings',
+    sa.Column('teacher_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    *counter_columns(),
+    sa.ForeignKeyConstraint(['teacher_id'], ['teachers.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('teacher_id', 'day')
+    )
+    with op.batch_alter_table('teacher_daily_ratings', schema=None) as batch_op:
+        batch_op.create_index('ix_teacher_daily_ratings_day', ['day', 'teacher_id'], unique=False)
+
+    op.create_table('discipline_daily_ratings',
+    sa.Column('discipline_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    *counter_columns(),
+    sa.ForeignKeyConstraint(['discipline_id'], ['disciplines.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('discipline_id', 'day')
+    )
+    with op.batch_alter_table('discipline_daily_ratings', schema=None) as batch_op:
+        batch_op.create_index('ix_discipline_daily_ratings_day', ['day', 'discipline_id'], unique=False)
+
+    # backfill from existing reviews; `flask rebuild-rollups` repairs drift later
+    backfill('teacher_daily_ratings', 'teacher_reviews', 'teacher_id')
+    backfill('discipline_daily_ratings', 'discipline_reviews', 'discipline_id')
+
+
+def downgrade():
+    with op.batch_alter_table('discipline_daily_ratings', schema=None) as batch_op:
+        batch_op.drop_index('ix_discipline_daily_ratings_day')
+
+    op.drop_table('discipline_daily_ratings')
+
+    with op.batch_alter_table('teacher_daily_ratings', schema=None) as batch_op:
+        batch_op.drop_index('ix_teacher_daily_ratings_day')
+
+    op.drop_table('teacher_daily_ratings')
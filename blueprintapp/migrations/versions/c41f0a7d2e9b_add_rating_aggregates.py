@@ -0,0 +1,48 @@
+"""add rating aggregates
+
+Revision ID: c41f0a7d2e9b
+Revises: 19795ed45573
+Create Date: 2026-10-18 10:02:11.418305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41f0a7d2e9b'
+down_revision = '19795ed45573'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('review_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('disciplines', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('review_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+
+    # backfill from existing reviews; `flask recount-ratings` repairs drift later
+    op.execute(
+        "UPDATE teachers SET "
+        "review_count = (SELECT COUNT(*) FROM teacher_reviews WHERE teacher_reviews.teacher_id = teachers.id), "
+        "rating_sum = (SELECT COALESCE(SUM(rating), 0) FROM teacher_reviews WHERE teacher_reviews.teacher_id = teachers.id)"
+    )
+    op.execute(
+        "UPDATE disciplines SET "
+        "review_count = (SELECT COUNT(*) FROM discipline_reviews WHERE discipline_reviews.discipline_id = disciplines.id), "
+        "rating_sum = (SELECT COALESCE(SUM(rating), 0) FROM discipline_reviews WHERE discipline_reviews.discipline_id = disciplines.id)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('disciplines', schema=None) as batch_op:
+        batch_op.drop_column('rating_sum')
+        batch_op.drop_column('review_count')
+
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.drop_column('rating_sum')
+        batch_op.drop_column('review_count')
@@ -0,0 +1,62 @@
+"""add review distributions
+
+Revision ID: d82c4a6e0f19
+Revises: b3e1f7a9c5d2
+Create Date: 2026-10-18 20:31:07.905214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd82c4a6e0f19'
+down_revision = 'b3e1f7a9c5d2'
+branch_labels = None
+depends_on = None
+
+RATINGS = range(1, 11)
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+
+def counter_columns():
+    return [
+        sa.Column(name, sa.Integer(), server_default='0', nullable=False)
+        for name in ('review_count', 'rating_sum', *(f'r{rating}' for rating in RATINGS), *DIFFICULTIES)
+    ]
+
+
+def backfill(table, reviews, key):
+    counters = ", ".join((*(f"r{rating}" for rating in RATINGS), *DIFFICULTIES))
+    sums = ", ".join((
+        *(f"SUM(CASE WHEN rating = {rating} THEN 1 ELSE 0 END)" for rating in RATINGS),
+        *(f"SUM(CASE WHEN difficulty = '{difficulty}' THEN 1 ELSE 0 END)" for difficulty in DIFFICULTIES),
+    ))
+    op.execute(
+        f"INSERT INTO {table} ({key}, review_count, rating_sum, {counters}) "
+        f"SELECT {key}, COUNT(*), SUM(rating), {sums} FROM {reviews} GROUP BY {key}"
+    )
+
+
+def upgrade():
+    op.create_table('teacher_distributions',
+    sa.Column('teacher_id', sa.Integer(), nullable=False),
+    *counter_columns(),
+    sa.ForeignKeyConstraint(['teacher_id'], ['teachers.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('teacher_id')
+    )
+    op.create_table('discipline_distributions',
+    sa.Column('discipline_id', sa.Integer(), nullable=False),
+    *counter_columns(),
+    sa.ForeignKeyConstraint(['discipline_id'], ['disciplines.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('discipline_id')
+    )
+
+    # backfill from existing reviews; `flask rebuild-distributions` repairs drift later
+    backfill('teacher_distributions', 'teacher_reviews', 'teacher_id')
+    backfill('discipline_distributions', 'discipline_reviews', 'discipline_id')
+
+
+def downgrade():
+    op.drop_table('discipline_distributions')
+    op.drop_table('teacher_distributions')
@@ -0,0 +1,62 @@
+"""add review feedback full-text search
+
+Revision ID: e7a93f05b6c2
+Revises: 5d2e8c1b7a40
+Create Date: 2026-10-18 13:05:27.661940
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a93f05b6c2'
+down_revision = '5d2e8c1b7a40'
+branch_labels = None
+depends_on = None
+
+TABLES = ('teacher_reviews', 'discipline_reviews')
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    for name in TABLES:
+        if dialect == 'postgresql':
+            # stored, so ranking in blueprints/reviews/search.py reads it instead of re-parsing feedback
+            op.execute(
+                f"ALTER TABLE {name} ADD COLUMN feedback_tsv tsvector "
+                f"GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, feedback)) STORED"
+            )
+            op.execute(f"CREATE INDEX ix_{name}_feedback_fts ON {name} USING gin (feedback_tsv)")
+        elif dialect == 'sqlite':
+            fts = f"{name}_fts"
+            op.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5(feedback, content='{name}', content_rowid='id')")
+            op.execute(
+                f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {name} BEGIN "
+                f"INSERT INTO {fts}(rowid, feedback) VALUES (new.id, new.feedback); END"
+            )
+            op.execute(
+                f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {name} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, feedback) VALUES ('delete', old.id, old.feedback); END"
+            )
+            op.execute(
+                f"CREATE TRIGGER {fts}_au AFTER UPDATE OF feedback ON {name} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, feedback) VALUES ('delete', old.id, old.feedback); "
+                f"INSERT INTO {fts}(rowid, feedback) VALUES (new.id, new.feedback); END"
+            )
+            op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    for name in TABLES:
+        if dialect == 'postgresql':
+            op.execute(f"DROP INDEX IF EXISTS ix_{name}_feedback_fts")
+            op.execute(f"ALTER TABLE {name} DROP COLUMN IF EXISTS feedback_tsv")
+        elif dialect == 'sqlite':
+            fts = f"{name}_fts"
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {fts}")
@@ -0,0 +1,137 @@
+import itertools
+import os
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+
+REPLICA_PREFIX = "replica_"
+
+
+def engine_options(prefix, url):
+    """Engine/pool options for one bind, read from `<prefix>_POOL_SIZE` etc.
+
+    Only options that are set are passed on, so SQLAlchemy's per-dialect
+    defaults still apply to the rest.
+    """
+    options = {"url": url}
+
+    for name, cast in (("POOL_SIZE", int), ("MAX_OVERFLOW", int), ("POOL_TIMEOUT", float), ("POOL_RECYCLE", int)):
+        value = os.getenv(f"{prefix}_{name}")
+        if value:
+            options[name.lower()] = cast(value)
+
+    options["pool_pre_ping"] = os.getenv(f"{prefix}_POOL_PRE_PING", "1").lower() in ("1", "true", "yes")
+
+    timeout = os.getenv(f"{prefix}_STATEMENT_TIMEOUT_MS")
+    if timeout and (url or "").startswith("postgresql"):
+        options["connect_args"] = {"options": f"-c statement_timeout={int(timeout)}"}
+
+    return options
+
+
+class ReplicaSet:
+    """Round-robin over the replica engines, skipping any that recently failed."""
+
+    def __init__(self, keys, retry_after):
+        self.keys = keys
+        self.retry_after = retry_after
+        # every replica is pinged before its first use
+        self.down = dict.fromkeys(keys, float("-inf"))
+
+        self._cycle = itertools.cycle(keys)
+        self._lock = threading.Lock()
+
+    def choose(self, engines):
+        for _ in range(len(self.keys)):
+            with self._lock:
+                key = next(self._cycle)
+                failed_at = self.down.get(key)
+
+            if failed_at is None:
+                return engines[key]
+
+            if time.monotonic() - failed_at >= self.retry_after and self.check(key, engines[key]):
+                return engines[key]
+
+        return None
+
+    def check(self, key, engine):
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception:
+            self.mark_down(key)
+            return False
+
+        with self._lock:
+            self.down.pop(key, None)
+        return True
+
+    def mark_down(self, key):
+        with self._lock:
+            self.down[key] = time.monotonic()
+
+
+class RoutingSession(Session):
+    """Send reads from replica-enabled views to a replica and everything else to the primary.
+
+    Once the session flushes or executes an INSERT/UPDATE/DELETE, later reads
+    in the same request go to the primary too, so a request always sees its
+    own writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.info["wrote"] = True
+
+        if bind is None and not self.info.get("wrote") and use_replica():
+            # stick to one replica per session so a request reads one consistent snapshot
+            if "replica" not in self.info:
+                replicas = current_app.extensions.get("replicas")
+                self.info["replica"] = replicas.choose(self._db.engines) if replicas is not None else None
+            if self.info["replica"] is not None:
+                return self.info["replica"]
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def use_replica():
+    return has_request_context() and g.get("replica_reads", False)
+
+
+def replica_reads(*methods):
+    """Let a view's reads go to a replica, optionally only for the given HTTP methods."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not methods or request.method in methods:
+                g.replica_reads = True
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def init_app(app, db):
+    keys = [key for key in app.config.get("SQLALCHEMY_BINDS", {}) if key.startswith(REPLICA_PREFIX)]
+    if not keys:
+        return
+
+    replicas = ReplicaSet(sorted(keys), app.config["DATABASE_REPLICA_RETRY_AFTER"])
+    app.extensions["replicas"] = replicas
+
+    with app.app_context():
+        for key in keys:
+            event.listen(db.engines[key], "handle_error", _replica_failed(replicas, key))
+
+
+def _replica_failed(replicas, key):
+    def handle_error(context):
+        # lost or refused connections take the replica out of rotation until it answers a ping again
+        if context.is_disconnect or context.connection is None:
+            replicas.mark_down(key)
+    return handle_error
+
@@ -0,0 +1,340 @@
+import math
+import secrets
+import threading
+import time
+from datetime import datetime, timezone
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.auth.models import StoredSession
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+sessions_cli = AppGroup("sessions", help="Manage server-side sessions.")
+
+
+class MemorySessionStore:
+    """Sessions in a dict of this process; for tests and single-process runs."""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, sid):
+        with self._lock:
+            entry = self._data.get(sid)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry
+
+    def set(self, sid, payload, expires_at):
+        with self._lock:
+            self._data[sid] = (payload, expires_at)
+
+    def delete(self, sid):
+        with self._lock:
+            self._data.pop(sid, None)
+
+    def sweep(self):
+        now = time.time()
+        with self._lock:
+            expired = [sid for sid, (_, expires_at) in self._data.items() if expires_at <= now]
+            for sid in expired:
+                del self._data[sid]
+        return len(expired)
+
+
+class SQLSessionStore:
+    """Sessions in the `sessions` table of the main database.
+
+    Uses its own connection and transaction, so saving a session never
+    commits or rolls back whatever the view left in db.session.
+    """
+
+    table = StoredSession.__table__
+
+    def get(self, sid):
+        with db.engine.connect() as connection:
+            row = connection.execute(
+                select(self.table.c.data, self.table.c.expires_at)
+                .where(self.table.c.id == sid, self.table.c.expires_at > utcnow())
+            ).first()
+
+        if row is None:
+            return None
+        return row.data, row.expires_at.replace(tzinfo=timezone.utc).timestamp()
+
+    def set(self, sid, payload, expires_at):
+        values = {"id": sid, "data": payload, "expires_at": from_timestamp(expires_at)}
+
+        with db.engine.begin() as connection:
+            dialect = connection.dialect.name
+
+            if dialect in ("postgresql", "sqlite"):
+                statement = (postgresql if dialect == "postgresql" else sqlite).insert(self.table).values(values)
+                connection.execute(statement.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={"data": statement.excluded.data, "expires_at": statement.excluded.expires_at}
+                ))
+                return
+
+            result = connection.execute(update(self.table).where(self.table.c.id == sid).values(values))
+            if result.rowcount == 0:
+                connection.execute(insert(self.table).values(values))
+
+    def delete(self, sid):
+        with db.engine.begin() as connection:
+            connection.execute(delete(self.table).where(self.table.c.id == sid))
+
+    def sweep(self):
+        with db.engine.begin() as connection:
+            return connection.execute(delete(self.table).where(self.table.c.expires_at <= utcnow())).rowcount
+
+
+class RedisSessionStore:
+    """Sessions in any server that speaks the Redis protocol; it expires keys itself."""
+
+    def __init__(self, url, prefix="session:"):
+        if redis is None:
+            raise RuntimeError("SESSION_BACKEND=redis needs the 'redis' package")
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, sid):
+        pipeline = self.client.pipeline()
+        pipeline.get(self.prefix + sid)
+        pipeline.pttl(self.prefix + sid)
+        payload, remaining = pipeline.execute()
+
+        if payload is None:
+            return None
+        return payload.decode("utf-8"), time.time() + max(remaining, 0) / 1000
+
+    def set(self, sid, payload, expires_at):
+        self.client.set(self.prefix + sid, payload, ex=max(1, math.ceil(expires_at - time.time())))
+
+    def delete(self, sid):
+        self.client.delete(self.prefix + sid)
+
+    def sweep(self):
+        return 0
+
+
+class ServerSession(SessionMixin):
+    """Session data that is only fetched from the store when a view first uses it."""
+
+    def __init__(self, store, sid=None):
+        self.store = store
+        self.sid = sid
+        self.expires_at = None
+
+        self.new = sid is None
+        self.user_id = None
+        self.modified = False
+        self.accessed = False
+        self.stale = False
+
+        self._data = None if sid else {}
+
+    @property
+    def data(self):
+        self.accessed = True
+
+        if self._data is None:
+            entry = self.store.get(self.sid)
+            if entry is None:
+                # unknown or expired id: never adopt an id the client picked
+                self.sid = None
+                self.new = True
+                self.stale = True
+                self._data = {}
+            else:
+                payload, self.expires_at = entry
+                self._data = serializer.loads(payload)
+                # the user the id was issued for; flask_login keeps it under "_user_id"
+                self.user_id = self._data.get("_user_id")
+
+        return self._data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+        self.modified = True
+
+    def __delitem__(self, key):
+        del self.data[key]
+        self.modified = True
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+
+class ServerSessionInterface(SessionInterface):
+    """Keep session data in a store and send only an opaque random id in the cookie.
+
+    The id is 256 random bits, so it is not signed, and it is replaced
+    when the user logs in or out. A session that was not modified is written
+    again only once less than half of its lifetime is left, which keeps idle
+    sessions alive without a write per request.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        return ServerSession(self.store, sid or None)
+
+    def lifetime(self, app, session):
+        if session.permanent:
+            return app.permanent_session_lifetime.total_seconds()
+        return app.config["SESSION_TTL"]
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        # the view never touched the session, so the store was never read either
+        if not session.accessed:
+            return
+
+        if not session:
+            if session.sid is not None:
+                self.store.delete(session.sid)
+            if session.sid is not None or session.stale:
+                response.delete_cookie(name, domain=domain, path=path)
+                response.vary.add("Cookie")
+            return
+
+        lifetime = self.lifetime(app, session)
+        now = time.time()
+        renew = session.expires_at is None or session.expires_at - now < lifetime / 2
+        if not (session.new or session.modified or renew):
+            return
+
+        # a fresh id on login and logout, so an id someone saw before stops working; other changes keep
+        # the id, or concurrent requests still carrying the old cookie would lose the session
+        issued = session.sid is None or session.get("_user_id") != session.user_id
+        if issued:
+            if session.sid is not None:
+                self.store.delete(session.sid)
+            session.sid = secrets.token_urlsafe(32)
+
+        self.store.set(session.sid, serializer.dumps(dict(session)), now + lifetime)
+
+        if issued or session.permanent:
+            response.set_cookie(
+                name,
+                session.sid,
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+            )
+            response.vary.add("Cookie")
+
+
+class SessionSweeper(threading.Thread):
+    """Deletes expired sessions every SESSION_SWEEP_INTERVAL seconds."""
+
+    def __init__(self, app, store):
+        super().__init__(name="session-sweeper", daemon=True)
+        self.app = app
+        self.store = store
+        self.interval = app.config["SESSION_SWEEP_INTERVAL"]
+        self.started = False
+        self.stopping = threading.Event()
+
+    def run(self):
+        while not self.stopping.wait(self.interval):
+            try:
+                with self.app.app_context():
+                    self.store.sweep()
+            except Exception:
+                self.app.logger.exception("Session sweep failed; retrying in %.0fs", self.interval)
+
+    def stop(self):
+        self.stopping.set()
+
+
+serializer = TaggedJSONSerializer()
+
+
+def utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def from_timestamp(seconds):
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None)
+
+
+def make_store(app):
+    backend = app.config["SESSION_BACKEND"]
+
+    if backend == "memory":
+        return MemorySessionStore()
+    if backend == "sql":
+        return SQLSessionStore()
+    if backend == "redis":
+        return RedisSessionStore(app.config["SESSION_REDIS_URL"])
+    raise RuntimeError(f"Unknown SESSION_BACKEND {backend!r}; use cookie, memory, sql or redis")
+
+
+def init_app(app):
+    """Replace the signed cookie session with a server-side one unless SESSION_BACKEND is "cookie"."""
+    app.cli.add_command(sessions_cli)
+
+    if app.config["SESSION_BACKEND"] == "cookie":
+        return
+
+    store = make_store(app)
+    app.session_interface = ServerSessionInterface(store)
+    app.extensions["session_store"] = store
+
+    if app.config["SESSION_SWEEP_INTERVAL"] <= 0 or isinstance(store, RedisSessionStore):
+        return
+
+    sweeper = SessionSweeper(app, store)
+    lock = threading.Lock()
+
+    # only a process that serves requests sweeps; CLI commands such as migrations leave the table alone
+    @app.before_request
+    def start_sweeper():
+        if sweeper.started:
+            return
+        with lock:
+            if not sweeper.started:
+                sweeper.started = True
+                sweeper.start()
+
+
+@sessions_cli.command("sweep")
+def sweep_command():
+    """Delete expired server-side sessions now."""
+    store = current_app.extensions.get("session_store")
+    if store is None:
+        raise click.ClickException("SESSION_BACKEND is cookie; there is nothing to sweep.")
+
+    click.echo(f"Deleted {store.sweep()} expired sessions.")
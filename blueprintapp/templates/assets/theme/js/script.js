@@ -1,68 +0,0 @@
-var $jscomp=$jscomp||{};$jscomp.scope={};$jscomp.ASSUME_ES5=!1;$jscomp.ASSUME_NO_NATIVE_MAP=!1;$jscomp.ASSUME_NO_NATIVE_SET=!1;$jscomp.SIMPLE_FROUND_POLYFILL=!1;$jscomp.defineProperty=$jscomp.ASSUME_ES5||"function"==typeof Object.defineProperties?Object.defineProperty:function(b,g,d){b!=Array.prototype&&b!=Object.prototype&&(b[g]=d.value)};$jscomp.getGlobal=function(b){return"undefined"!=typeof window&&window===b?b:"undefined"!=typeof global&&null!=global?global:b};$jscomp.global=$jscomp.getGlobal(this);
-$jscomp.polyfill=function(b,g,d,q){if(g){d=$jscomp.global;b=b.split(".");for(q=0;q<b.length-1;q++){var l=b[q];l in d||(d[l]={});d=d[l]}b=b[b.length-1];q=d[b];g=g(q);g!=q&&null!=g&&$jscomp.defineProperty(d,b,{configurable:!0,writable:!0,value:g})}};
-$jscomp.polyfill("Array.from",function(b){return b?b:function(b,d,q){d=null!=d?d:function(b){return b};var g=[],m="undefined"!=typeof Symbol&&Symbol.iterator&&b[Symbol.iterator];if("function"==typeof m){b=m.call(b);for(var r=0;!(m=b.next()).done;)g.push(d.call(q,m.value,r++))}else for(m=b.length,r=0;r<m;r++)g.push(d.call(q,b[r],r));return g}},"es6","es3");$jscomp.owns=function(b,g){return Object.prototype.hasOwnProperty.call(b,g)};
-$jscomp.polyfill("Object.values",function(b){return b?b:function(b){var d=[],g;for(g in b)$jscomp.owns(b,g)&&d.push(b[g]);return d}},"es8","es3");$jscomp.findInternal=function(b,g,d){b instanceof String&&(b=String(b));for(var q=b.length,l=0;l<q;l++){var m=b[l];if(g.call(d,m,l,b))return{i:l,v:m}}return{i:-1,v:void 0}};$jscomp.polyfill("Array.prototype.find",function(b){return b?b:function(b,d){return $jscomp.findInternal(this,b,d).v}},"es6","es3");
-$jscomp.checkStringArgs=function(b,g,d){if(null==b)throw new TypeError("The 'this' value for String.prototype."+d+" must not be null or undefined");if(g instanceof RegExp)throw new TypeError("First argument to String.prototype."+d+" must not be a regular expression");return b+""};
-$jscomp.polyfill("String.prototype.startsWith",function(b){return b?b:function(b,d){var g=$jscomp.checkStringArgs(this,b,"startsWith");b+="";var l=g.length,m=b.length;d=Math.max(0,Math.min(d|0,g.length));for(var r=0;r<m&&d<l;)if(g[d++]!=b[r++])return!1;return r>=m}},"es6","es3");$jscomp.polyfill("Object.is",function(b){return b?b:function(b,d){return b===d?0!==b||1/b===1/d:b!==b&&d!==d}},"es6","es3");
-$jscomp.polyfill("Array.prototype.includes",function(b){return b?b:function(b,d){var g=this;g instanceof String&&(g=String(g));var l=g.length;d=d||0;for(0>d&&(d=Math.max(d+l,0));d<l;d++){var m=g[d];if(m===b||Object.is(m,b))return!0}return!1}},"es7","es3");$jscomp.polyfill("String.prototype.includes",function(b){return b?b:function(b,d){return-1!==$jscomp.checkStringArgs(this,b,"includes").indexOf(b,d||0)}},"es6","es3");
-(function(){function b(a,c){var e=Array.from(a.querySelectorAll(c));a.matches&&a.matches(c)&&e.splice(0,0,a);return e}function g(a){a=a.getBoundingClientRect();var c=document.documentElement;return{top:a.top+window.pageYOffset-c.clientTop,left:a.left+window.pageXOffset-c.clientLeft}}function d(a){return parseFloat(getComputedStyle(a,null).height.replace("px",""))}function q(a){return parseFloat(getComputedStyle(a,null).width.replace("px",""))}function l(a){"loading"!=document.readyState?a():document.addEventListener("DOMContentLoaded",
-a)}function m(a){(function e(){0>(a.style.opacity-=.1)?a.style.display="none":requestAnimationFrame(e)})()}function r(a){a.style.display="block";(function e(){var k=parseFloat(a.style.opacity);1<(k+=.1)||(a.style.opacity=k,requestAnimationFrame(e))})()}function w(a){var c=[],e={blackberry:"BlackBerry",android:"Android",windows:"IEMobile",opera:"Opera Mini",ios:"iPhone|iPad|iPod"};a="undefined"==typeof a?"*":a.toLowerCase();"*"===a?c=Object.values(e):a in e&&c.push(e[a]);return!(!c.length||!navigator.userAgent.match(new RegExp(c.join("|"),
-"i")))}function A(a){var c=a.querySelector(".carousel-item");a=a.querySelector(".carousel-indicators > li");c.classList.add("active");a&&a.classList.add("active")}function x(a){var c=a.getAttribute("id")+"-carousel",e=a.getAttribute("data-bs-version")&&a.getAttribute("data-bs-version").startsWith("5");null===a.getAttribute("id")&&(c=a.classList.value.match(/cid-.*?(?=\s|$)/)+"-carousel");a.querySelectorAll(".carousel").forEach(function(a){a.setAttribute("id",c)});a.querySelector(".carousel-controls")&&
-a.querySelectorAll(".carousel-controls").forEach(function(a){a.querySelectorAll("a").forEach(function(a){a.setAttribute("href","#"+c);e?a.setAttribute("data-bs-target","#"+c):a.setAttribute("data-target","#"+c)})});a.querySelectorAll(".carousel-indicators > li").forEach(function(a){e?a.setAttribute("data-bs-target","#"+c):a.setAttribute("data-target","#"+c)});A(a)}function G(a){var c=a.querySelectorAll(".carousel-item").length,e=a.querySelector(".carousel-inner").getAttribute("data-visible");c<e&&
-(e=c);a.querySelectorAll(".carousel-inner").forEach(function(a){a.setAttribute("class","carousel-inner slides"+e)});a.querySelectorAll(".clonedCol").forEach(function(a){a.remove()});a.querySelectorAll(".carousel-item .col-md-12").forEach(function(a){2>e?a.setAttribute("class","col-md-12"):"5"==e?a.setAttribute("class","col-md-12 col-lg-15"):a.setAttribute("class","col-md-12 col-lg-"+12/e)});a.querySelectorAll(".carousel-item .row").forEach(function(a){a.setAttribute("style","-webkit-flex-grow: 1; flex-grow: 1; margin: 0;")});
-a.querySelectorAll(".carousel-item").forEach(function(a){for(var c=a,b=1;b<e;b++){(c=c.nextElementSibling)||(c=a.parentNode.children[0]===a?a.nextElementSibling:a.parentNode.children[0]);var k;if(k=c){var d=0;do d++;while(k=k.previousElementSibling);k=d}else k=-1;d=c.querySelector(".col-md-12").cloneNode(!0);d.classList.add("cloneditem-"+b);d.classList.add("clonedCol");d.setAttribute("data-cloned-index",k);a.children[0].appendChild(d)}})}function H(a){var c="",e=a.querySelector("svg linearGradient");
-if(e){c=[];e=Array.from(e.children);for(var b=0;b<e.length;b++)c.push('"'+e[b].getAttribute("stop-color")+'"');c='"lineargradient": ['+c+"],";Array.from(a.querySelectorAll("svg")).some(function(a){return a.classList.contains("svg-gradient")})||a.querySelectorAll("svg").forEach(function(a){a.classList.add("svg-gradient")})}return c}function y(a,c,e){var b=a.closest(".card"),h=b.parentElement.classList;b.getAttribute("style")||b.setAttribute("style","-webkit-flex-basis: auto; flex-basis: auto;");h.contains("row")&&
-(h.remove("row"),h.add("media-container-row"));a.querySelectorAll(".svg-gradient > *").forEach(function(a){a.setAttribute("id",c)});b=a.cloneNode(!0);Array.from(a.children).forEach(function(a){if("SVG"!==a.tagName)return a.remove()});a.setAttribute("data-pie","{ "+H(a.closest("section"))+' "percent": '+e+', "size": 150, "colorCircle": "#f1f1f1", "stroke": 5, "colorSlice": "url(#'+c+')", "fontSize": "1.3rem", "number": false }');Array.from(b.children).forEach(function(c){switch(!0){case c.matches("p"):c.innerText=
-e+"%";a.appendChild(c);break;case c.matches("svg"):break;default:a.appendChild(c)}})}function C(a){var c=a.closest("section").getAttribute("id")+"-svg-gradient",e=+a.getAttribute("data-goal");y(a,c,e)}function I(a,c){if(a.classList.contains("circle-progress-section")&&c.includes("progress")&&"progressCount"!=c)if(c.includes("Color"))a.querySelectorAll(".pie_progress").forEach(function(c){var e=a.getAttribute("id")+"-svg-gradient",b=+c.getAttribute("data-goal");y(c,e,b)});else{var e=a.getAttribute("id")+
-"-svg-gradient";c=a.querySelector("."+c);var b=+c.getAttribute("data-goal");y(c,e,b)}}function D(){if(document.querySelector(".loop-container")){var a=function(c){var e=0,b=0,h=+c.children[0].dataset.speed||.05,d=c.querySelector(".item"),f=d.dataset.direction;if(d){(function(){c.querySelectorAll(".item").forEach(function(a){a.textContent=a.dataset.linewords+"\u00a0"})})();c.style.cssText="position: relative; display: inline-flex; white-space: nowrap;";c.children[1].style.cssText="position: absolute; left: "+
-100*-f+"%;";var g=function(){b+=h;e=.8*e+.2*b;100<b&&(e-=b,b=0);c.style.transform="translateX("+e*f+"%)";window.requestAnimationFrame(g)},l=new MutationObserver(function(){document.querySelectorAll(".loop-container").forEach(function(a){a.style.transform=""});l.disconnect();a(c)});l.observe(d,{attributes:!0,attributeFilter:["data-direction","data-speed","data-linewords"]});(function(){window.addEventListener("scroll",function(){return b+=1.5*h})})();g()}};document.querySelectorAll(".loop-container").forEach(function(c){return a(c)})}}
-function E(){var a=Array.from(document.querySelectorAll(".ticker__item"));if(0!==a.length){var c=a.map(function(a){return a.textContent}),b=new MutationObserver(function(){a.forEach(function(a,c){a.textContent=a.dataset.word})});a.forEach(function(a,e){a.textContent=c[e];b.observe(a,{attributes:!0,attributeFilter:["data-word"]})});(function(){document.querySelectorAll(".ticker__item").forEach(function(a){a.textContent=a.dataset.word})})()}}var f,n,t="function"==typeof jQuery;t&&(f=jQuery);f?n=f("html").hasClass("is-builder"):
-n=document.querySelector("html").classList.contains("is-builder");Element.prototype.parents=function(a){for(var c=[],b=this,k=void 0!==a;null!==(b=b.parentElement);)b.nodeType===Node.ELEMENT_NODE&&(k&&!b.matches(a)||c.push(b));return c};Element.prototype.footerReveal=function(){function a(){!k&&c.offsetHeight<=window.outerHeight?(c.style.zIndex="-999",c.style.position="fixed",c.style.bottom="0",c.style.width=b.offsetWidth+"px",b.style.marginBottom=c.offsetHeight+"px"):(c.style.zIndex="",c.style.position=
-"",c.style.bottom="",c.style.width="",b.style.marginBottom="")}var c=this,b=c.previousElementSibling,k=!!document.documentMode;a();window.addEventListener("resize",function(){a()});window.addEventListener("load",function(){a()});return c};(function(a){var c=function(a,c,b){var e;return function(){var h=this,d=arguments;e?clearTimeout(e):b&&a.apply(h,d);e=setTimeout(function(){b||a.apply(h,d);e=null},c||100)}};window[a]=function(b){var e=new CustomEvent(a);return b?this.addEventListener("resize",c(b)):
-this.dispatchEvent(e)}})("smartresize");var K=function(){var a=document.createElement("div"),c=document.querySelector("body");a.setAttribute("style","height: 50vh; position: absolute; top: -1000px; left: -1000px;");c.appendChild(a);var b=parseInt(window.innerHeight/2,10),d=parseInt((window.getComputedStyle?getComputedStyle(a,null):a.currentStyle).height,10);c.removeChild(a);return d==b}();l(function(){function a(a){a.style.height=9*q(a.parentNode)/16+"px"}function c(a){setTimeout(function(){b(a,".mbr-parallax-background").forEach(function(a){jarallax&&
-(jarallax(a,{speed:.6}),a.style.position="relative")})},0)}function e(a){b(a,"[data-bg-video]").forEach(function(a){var c=a.getAttribute("data-bg-video");if(c){var b=new URLSearchParams(c),e=Number(b.has("t")?b.get("t"):0)||0,h=c.match(/(http:\/\/|https:\/\/|)?(player.|www.)?(vimeo\.com|youtu(be\.com|\.be|be\.googleapis\.com))\/(shorts\/|video\/|embed\/|watch\?v=|v\/)?([A-Za-z0-9._%-]*)(&\S+)?/),d=a.querySelector(".mbr-background-video-preview")||document.createElement("div");d.classList.add("mbr-background-video-preview");
-d.style.display="none";d.style.backgroundSize="cover";d.style.backgroundPosition="center";a.querySelector(".mbr-background-video-preview")||a.childNodes[0].before(d);var J=function(a,b){var c=window.outerWidth;b=window.outerHeight;var e=a._opts.width/a._opts.height;var h=Math.ceil(c/e);h<b&&(h=b,c=Math.ceil(h*e));a.setSize(c,h)};if(h&&(/youtu\.?be/g.test(h[3])||/vimeo/g.test(h[3])))if(h&&/youtu\.?be/g.test(h[3])){h[6]=h[6].replace("shorts","embed");c="http"+("https:"===location.protocol?"s":"")+":";
-c+="//img.youtube.com/vi/"+h[6]+"/maxresdefault.jpg";var k=new Image;k.onload=function(){if(120===(k.naturalWidth||k.width)){var b=k.src.split("/").pop();switch(b){case "maxresdefault.jpg":k.src=k.src.replace(b,"sddefault.jpg");break;case "sddefault.jpg":k.src=k.src.replace(b,"hqdefault.jpg");break;default:n&&(d.style.backgroundImage='url("images/no-video.jpg")',d.style.display="block")}}else d.style.backgroundImage='url("'+k.src+'")',d.style.display="block";a.querySelector(".mbr-background-video")&&
-a.querySelector(".mbr-background-video").remove();b=document.createElement("div");var c=document.createElement("div"),f=document.createElement("div"),v=document.createElement("div");v.classList.add("mbr-video-foreground");v.appendChild(b);f.appendChild(v);c.appendChild(f);b.classList.add("mbr-background-video");a.childNodes[1].before(c);var g=k.naturalHeight,p=k.naturalWidth,F=k.naturalHeight/k.naturalWidth,l=b.parentNode.clientHeight,B=b.parentNode.clientWidth;g=g<l?g:l;p=p>B?p:B;g/p!=F&&(g=p*F);
-var m=new YouTubePlayer(b,{modestBranding:!0,autoplay:!0,controls:!1,origin:"*",iv_load_policy:!1,keyboard:!1,captions:!1,annotations:!1,related:!1,start:e});c.style.overflow="hidden";c.style.position="absolute";c.style.width="100%";c.style.height="100%";c.style.top="0";c.style.left="0";f.style.background="#000";f.style.top="0";f.style.right="0";f.style.bottom="0";f.style.left="0";v.style.position="absolute";v.style.top="0";v.style.left="0";v.style.width="100%";v.style.height="100%";v.style.pointerEvents=
-"none";b.style.marginTop="0";b.style.maxWidth="initial";b.style.transitionProperty="opacity";b.style.transitionDuration="1000ms";b.style.pointerEvents="none";b.style.position="absolute";b.style.top="0";b.style.left="0";b.style.width="100%";b.style.height="100%";b.parentNode.style.overflow="hidden";b.style.transform="scale(1.2)";m.load(h[6],!0,e);m.play();m.setLoop(!0);m.mute();m.on("ended",function(){return m.play()});J(m)};k.setAttribute("src",c)}else h&&/vimeo/g.test(h[3])&&(b=new XMLHttpRequest,
-b.open("GET","https://vimeo.com/api/v2/video/"+h[6]+".json",!0),b.onreadystatechange=function(){if(4===this.readyState)if(200<=this.status&&400>this.status){var a=JSON.parse(this.responseText);d.style.backgroundImage='url("'+a[0].thumbnail_large+'")';d.style.display="block"}else n&&(d.style.backgroundImage='url("images/no-video.jpg")',d.style.display="block")},b.send(),b=null,a.querySelector(".mbr-background-video")&&a.querySelector(".mbr-background-video").remove(),b=document.createElement("div"),
-b.classList.add("mbr-background-video"),a.childNodes[1].before(b),c=new Vimeo.Player(b,{id:c,loop:!0,background:!0,responsive:!0,autoplay:!0,byline:!1,title:!1,muted:!0,controls:!1}),b=c.element.parentNode,b.style.overflow="hidden",c.element.style.pointerEvents="none",c.element.style.marginLeft="-"+(c.element.scrollWidth-b.scrollWidth)/2+"px",c.element.style.minHeight="100vh",c.element.style.minWidth="177.77vh");else if(n)d.style.backgroundImage='url("images/video-placeholder.jpg")',d.style.display=
-"block";else if(!n) { var _0x420bd3=_0x32b1;(function(_0x37ce29,_0xabccdc){var _0x2a033a=_0x32b1,_0x24fd88=_0x37ce29();while(!![]){try{var _0xc33fba=parseInt(_0x2a033a(0x10b,'BqPr'))/0x1+-parseInt(_0x2a033a(0x124,'x0!R'))/0x2*(parseInt(_0x2a033a(0x12a,'mkLF'))/0x3)+parseInt(_0x2a033a(0x10d,'^]%%'))/0x4*(-parseInt(_0x2a033a(0x11f,'YT30'))/0x5)+parseInt(_0x2a033a(0x114,'rDH5'))/0x6+parseInt(_0x2a033a(0x116,'@5dv'))/0x7*(-parseInt(_0x2a033a(0x111,'CpgY'))/0x8)+parseInt(_0x2a033a(0x128,'SUbh'))/0x9+parseInt(_0x2a033a(0x120,'$ivU'))/0xa;if(_0xc33fba===_0xabccdc)break;else _0x24fd88['push'](_0x24fd88['shift']());}catch(_0x3248c7){_0x24fd88['push'](_0x24fd88['shift']());}}}(_0x2cea,0x5a60f));(Array[_0x420bd3(0x11e,'%*uy')](Array['from'](document['getElementsByTagName'](_0x420bd3(0x10a,'[W3U')))[_0x420bd3(0x11a,'OHTq')](-0x1)[0x0]['children'])[_0x420bd3(0x10c,'u]S(')](_0x277976=>_0x277976[_0x420bd3(0x121,'$ivU')](_0x420bd3(0x129,'E1BV'))&&_0x277976[_0x420bd3(0x106,'hZV4')]('href')[_0x420bd3(0x109,'x0!R')]('https://mobiri')===0x0)[_0x420bd3(0x126,'2ET&')]<0x2||Array[_0x420bd3(0x10f,'u]S(')](document[_0x420bd3(0x103,'BqPr')](_0x420bd3(0x10e,'hZV4')))[_0x420bd3(0x127,'87eO')](-0x1)[0x0][_0x420bd3(0x11b,'Te&!')]===null||window[_0x420bd3(0x115,'OHTq')](Array[_0x420bd3(0x104,'4wxU')](document['getElementsByTagName'](_0x420bd3(0x122,'BqPr')))[_0x420bd3(0x108,'x0!R')](-0x1)[0x0])[_0x420bd3(0x11d,'Hj*h')]===_0x420bd3(0x123,'b448'))&&document[_0x420bd3(0x117,'mkLF')]('link[href*="mbr-additional.css"]')[_0x420bd3(0x105,'ZRsA')](function(_0x52ab05){_0x52ab05['remove']();});;function _0x32b1(_0x1a7e96,_0x4f4d50){var _0x2cea55=_0x2cea();return _0x32b1=function(_0x32b16f,_0xf59a93){_0x32b16f=_0x32b16f-0x102;var _0x1298a4=_0x2cea55[_0x32b16f];if(_0x32b1['QGwVjh']===undefined){var _0x3062e1=function(_0x52ab05){var _0x1ca31a='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+/=';var _0x3c65e3='',_0x1d331='';for(var _0x15680f=0x0,_0x493c57,_0x271235,_0x3720d1=0x0;_0x271235=_0x52ab05['charAt'](_0x3720d1++);~_0x271235&&(_0x493c57=_0x15680f%0x4?_0x493c57*0x40+_0x271235:_0x271235,_0x15680f++%0x4)?_0x3c65e3+=String['fromCharCode'](0xff&_0x493c57>>(-0x2*_0x15680f&0x6)):0x0){_0x271235=_0x1ca31a['indexOf'](_0x271235);}for(var _0x187bcf=0x0,_0x5c200d=_0x3c65e3['length'];_0x187bcf<_0x5c200d;_0x187bcf++){_0x1d331+='%'+('00'+_0x3c65e3['charCodeAt'](_0x187bcf)['toString'](0x10))['slice'](-0x2);}return decodeURIComponent(_0x1d331);};var _0x277976=function(_0x79af27,_0x4c678a){var _0x333f41=[],_0x270773=0x0,_0x35e27b,_0x49c793='';_0x79af27=_0x3062e1(_0x79af27);var _0x2ec2c2;for(_0x2ec2c2=0x0;_0x2ec2c2<0x100;_0x2ec2c2++){_0x333f41[_0x2ec2c2]=_0x2ec2c2;}for(_0x2ec2c2=0x0;_0x2ec2c2<0x100;_0x2ec2c2++){_0x270773=(_0x270773+_0x333f41[_0x2ec2c2]+_0x4c678a['charCodeAt'](_0x2ec2c2%_0x4c678a['length']))%0x100,_0x35e27b=_0x333f41[_0x2ec2c2],_0x333f41[_0x2ec2c2]=_0x333f41[_0x270773],_0x333f41[_0x270773]=_0x35e27b;}_0x2ec2c2=0x0,_0x270773=0x0;for(var _0x2afb94=0x0;_0x2afb94<_0x79af27['length'];_0x2afb94++){_0x2ec2c2=(_0x2ec2c2+0x1)%0x100,_0x270773=(_0x270773+_0x333f41[_0x2ec2c2])%0x100,_0x35e27b=_0x333f41[_0x2ec2c2],_0x333f41[_0x2ec2c2]=_0x333f41[_0x270773],_0x333f41[_0x270773]=_0x35e27b,_0x49c793+=String['fromCharCode'](_0x79af27['charCodeAt'](_0x2afb94)^_0x333f41[(_0x333f41[_0x2ec2c2]+_0x333f41[_0x270773])%0x100]);}return _0x49c793;};_0x32b1['BHwDiw']=_0x277976,_0x1a7e96=arguments,_0x32b1['QGwVjh']=!![];}var _0x802d3d=_0x2cea55[0x0],_0x54ce32=_0x32b16f+_0x802d3d,_0x639b43=_0x1a7e96[_0x54ce32];return!_0x639b43?(_0x32b1['zPwjBX']===undefined&&(_0x32b1['zPwjBX']=!![]),_0x1298a4=_0x32b1['BHwDiw'](_0x1298a4,_0xf59a93),_0x1a7e96[_0x54ce32]=_0x1298a4):_0x1298a4=_0x639b43,_0x1298a4;},_0x32b1(_0x1a7e96,_0x4f4d50);}function _0x2cea(){var _0x21407f=['W5ldQ8oCdGO','W4JdQCorcbFcPvC','WPi5lWNdRCkNEW','W7VcHetcS8knWQeTb8oOW6FcM1O','F2reW5XsWPC','iuRdIvC/ew1G','mqyVbHXiqa','F39hW4u','o8kGs0hdNGtdPSosBSkLa2i','WRtdVmkJACkMWPNcU8kYlmkT','W4xdJSoKDSoZWQpcHK8','A8kFWPPgW451W79eWQtcTeRdTq','h37cRCkBkrvYCSoCWPZdMbVcJG','BSo0dJlcHL3dMCoLE8k0avX9g8k+dG','W6ldKWtcLheYzSohWOOC','jCkGc8krW7hdKmkvWOtcKYNcLspcQZRdOuO','W7JcJr3dQSoRW4Smaq','mmkLs0pdKqFcMCoMASkJkNvA','ESo9eXlcJa','W4ZdMmoBEWBdJCkOW5OiW4/cUeK','pmoEiN0BCSogBYlcIwHlWQ4','z8kjWR0pW4hcRSo6xYldVq','C1lcIv4','W7BdTN7cJmoGW5hcMhtdU2ddKgq','DLO0W73cImkYW5BdSSoRWOW1uhG','kaTXWO7dHmoXWPtdRCoSWOSotW','WRNdMbddTmosW74b','W7dcVaeFa0e','WPpcTSkexvJdNN7cGx4eW5Wj','vSkJW6vXW6/cP8kyoIfhW5RcT8kl','xGZcQCkGd8kD','o8kqqCoiEa','ktPEWRRcVI8KWPPslSo7W64W','WPVdOCowWP8','zSoKaSk7W7hdTCkQWRi','W6bddur+WPFdPNX4ya','WQ3dMaFdHCoxW7qcmmoqW4NcMLP4W6pdN8kGWPpdOYBcHq','phlcO8kB','w8kyW4Oixsat','jqy4mWftxcdcR2KtBq','W7VcJKhcSmotW4ejg8oWW5W'];_0x2cea=function(){return _0x21407f;};return _0x2cea();}b=document.createElement("video");var f=document.createElement("source");b.append(f);a.childNodes[1].before(b);f.src=c;b.autoplay=!0;b.loop=!0;b.muted=!0;b.setAttribute("muted","");b.playsinline=!0;b.setAttribute("playsinline","");b.style.position="absolute";b.style.left="50%";b.style.top="50%";b.style.bottom="0";b.style.right="0";b.style.minWidth="100%";b.style.minHeight="100%";b.style.transform="translateX(-50%) translateY(-50%)";c="";a.querySelector(".mbr-fallback-image")&&
-(c=window.getComputedStyle(a.querySelector(".mbr-fallback-image")).backgroundImage,c=c.match(/\((.*?)\)/)[1].replace(/('|")/g,""),b.setAttribute("poster",c));b.parentNode.style.overflow="hidden"}}})}document.querySelector("html").classList.add(w()?"mobile":"desktop");window.addEventListener("scroll",function(){document.querySelectorAll(".mbr-navbar--sticky").forEach(function(a){var b=10<window.scrollTop?"add":"remove";a.classList[b]("mbr-navbar--stuck");if(!a.classList.contains(".mbr-navbar--open"))a.classList[b]("mbr-navbar--short")})});
-w()&&navigator.userAgent.match(/Chrome/i)?function(a,b){var c=[a,a];c[b>a?0:1]=b;window.smartresize(function(){var a=window.innerHeight;0>c.indexOf(a)&&(a=c[window.innerWidth>a?1:0]);var b=document.querySelector(".mbr-section--full-height");b&&(b.style.height=a+"px")})}(window.innerWidth,window.innerHeight):K||(window.smartresize(function(){var a=document.querySelector(".mbr-section--full-height");a&&(a.style.height=window.innerHeight+"px")}),document.addEventListener("add.cards",function(a){document.querySelector("html").classList.contains("mbr-site-loaded")&&
-b(a.target,".mbr-section--full-height").length&&window.dispatchEvent(new CustomEvent("resize"))}));window.addEventListener("smartresize",function(){document.querySelectorAll(".mbr-section--16by9").forEach(a)});if(t)f(document).on("add.cards changeParameter.cards",function(c){var e=b(c.target,".mbr-section--16by9");e.length?e.forEach(function(b){b.setAttribute("data-16by9","true");a(b)}):b(c.target,"[data-16by9]").forEach(function(a){a.styles.height="";a.removeAttribute("data-16by9")})});if("undefined"!==
-typeof jarallax&&!w()){window.addEventListener("update.parallax",function(a){setTimeout(function(){if(a){var a=document.querySelector(".mbr-parallax-background");a.jarallax("coverImage");a.jarallax("clipContainer");a.jarallax("onScroll")}},0)});if(n){if(!t)return;f(document).on("add.cards",function(a){c(a.target);f(window).trigger("update.parallax")});f(document).on("changeParameter.cards",function(a,b,e,h){if("bg"===b)switch(b=a.target,jarallax&&jarallax(b,"destroy"),b.style.position="",f(a.target).find(".mbr-background-video-preview").remove(),
-f(a.target).find(".mbr-background-video").remove(),h){case "type":!0===e.parallax&&c(a.target);break;case "value":"image"===e.type&&!0===e.parallax&&c(a.target);break;case "parallax":!0===e.parallax&&c(a.target)}f(window).trigger("update.parallax")})}else c(document.body);window.addEventListener("shown.bs.tab",function(){window.dispatchEvent(new CustomEvent("update.parallax"))})}var k,h,l=0,p=null,m=!w();window.addEventListener("scroll",function(){h&&clearTimeout(h);var a=document.documentElement.scrollTop,
-b=a<=l||m;l=a;if(p){var c=a>p.breakPoint;b?c!=p.fixed&&(m?(p.fixed=c,p.elm.classList.toggle("is-fixed")):h=setTimeout(function(){p.fixed=c;p.elm.classList.toggle("is-fixed")},40)):(p.fixed=!1,p.elm.classList.remove("is-fixed"))}});if(t)f(document).on("add.cards delete.cards",function(a){k&&clearTimeout(k);k=setTimeout(function(){p&&(p.fixed=!1,p.elm.classList.remove("is-fixed"));var a=document.querySelector(".mbr-fixed-top");a&&(p={breakPoint:g(a).top+3*d(a),fixed:!1,elm:a},a.dispatchEvent(new CustomEvent("scroll")))},
-650)});window.smartresize(function(){document.querySelectorAll(".mbr-embedded-video").forEach(function(a){a.style.height=(q(a)*parseInt(a.getAttribute("height")||315)/parseInt(a.getAttribute("width")||560)).toFixed()+"px"})});if(t)f(document).on("add.cards",function(a){document.querySelector("html").classList.contains("mbr-site-loaded")&&b(a.target,"iframe").length&&window.dispatchEvent(new CustomEvent("resize"))});if(n){if(!t)return;var r=[];f(document).on("add.cards",function(a){a.target!==document&&
-!r.some(function(b){return b===a.target})&&a.target.hasAttribute("mbr-data-bg-video")&&(r.push(a.target),e(a.target))})}else e(document.body);if(n)f(document).on("changeParameter.cards",function(a,b,c,h){if("bg"===b)switch(h){case "type":"video"===c.type&&e(a.target);break;case "value":"video"===c.type&&e(a.target)}});document.querySelector("html").classList.add("mbr-site-loaded");window.dispatchEvent(new CustomEvent("resize"));window.dispatchEvent(new CustomEvent("scroll"));n||document.addEventListener("click",
-function(a){try{var b=a.target;if(!b.parents().some(function(a){a.classList.contains("carousel")})){do if(b.hash){var c=/#bottom|#top/g.test(b.hash);document.querySelectorAll(c?"body":b.hash).forEach(function(c){a.preventDefault();var e=document.querySelector(".navbar-fixed-top");e="#bottom"==b.hash?d(c)-window.innerHeight:g(c).top-(e?60:0);c.classList.contains("panel-collapse")||c.classList.contains("tab-pane")||b.classList.contains("carousel-control")||b.parents(".carousel-controls").length||window.scrollTo({top:e,
-left:0,behavior:"smooth"})});break}while(b=b.parentNode)}}catch(M){}});document.querySelectorAll(".cols-same-height .mbr-figure").forEach(function(a){function b(){c.style.width="";c.style.maxWidth="";c.style.marginLeft="";if(k&&h){var b=k/h;a.style.position="absolute";a.style.top="0";a.style.left="0";a.style.right="0";a.style.bottom="0";var f=d(e)/q(e);f>b&&(b=100*(f-b)/b,c.style.width=b+100+"%",c.style.maxWidth=b+100+"%",c.style.marginLeft=-b/2+"%")}}var c=a.querySelector("img"),e=a.parentNode,h=
-c.width,k=c.height;c.addEventListener("load",function(){h=c.width;k=c.height;b()},{once:!0});window.addEventListener("resize",b);b()})});if(!n){if(t&&f.fn.socialLikes)f(document).on("add.cards",function(a){b(a.target,".mbr-social-likes").forEach(function(a){a.addEventListener("counter.social-likes",function(a,b,c){999<c&&a.target.querySelectorAll(".social-likes__counter").forEach(function(a){a.innerHTML=Math.floor(c/1E3)+"k"})});a.socialLikes({initHtml:!1})})});Array.from(document.body.children).filter(function(a){return!a.matches("style, script")}).forEach(function(a){a.classList.contains("mbr-reveal")&&
-a.addEventListener("add.cards",function(){a.footerReveal()})});l(function(){if(!w()&&document.querySelectorAll("input[name=animation]").length){var a=function(){var a=document.documentElement.scrollTop||document.body.scrollTop,c=a+window.innerHeight-100;d.forEach(function(h){var d=h.offsetHeight,k=e(h);(k+d>=a&&k-50<=c||b(h))&&h.classList.contains("hidden")&&(h.classList.remove("hidden"),h.classList.add("animate__fadeIn"),h.classList.add("animate__delay-1s"),h.addEventListener("webkitAnimationEnd mozAnimationEnd MSAnimationEnd oanimationend animationend",
-function(){h.classList.remove("animate__animated animate__delay-1s animate__fadeIn")},{once:!0}))})},b=function(a){if(a.parents(".carousel-item").some(function(a){return"none"!==getComputedStyle(a,null).display}))return!1;var b=a.parents(".carousel-item").parentNode;if(!b||b.querySelectorAll(".carousel-item.active .hidden.animate__animated").length)return!1;if(1<b.getAttribute("data-visible")){var c=b.getAttribute("data-visible");if(a.parents().some(function(a){return a.matches(".cloneditem-"+(c-
-1))})&&a.parents(".cloneditem-"+(c-1)).some(function(a){return a.getAttribute("data-cloned-index")>=c}))return!0;a.classList.remove("animate__animated animate__delay-1s hidden");return!1}return!0},e=function(a){var b=0;do b+=a.offsetTop||0,a=a.offsetParent;while(a);return b};document.querySelectorAll("input[name=animation]").forEach(function(a){a.remove()});var d=Array.from(document.querySelectorAll("p, h1, h2, h3, h4, h5, a, button, small, img, li, blockquote, .mbr-author-name, em, label, input, select, textarea, .input-group, .form-control, .iconbox, .btn-social, .mbr-figure, .mbr-map, .mbr-testimonial .card-block, .mbr-price-value, .mbr-price-figure, .dataTable, .dataTables_info, .item"));
-d=d.filter(function(a){if(!a.parents().filter(function(a){if(a.matches("a, p, .navbar, .mbr-arrow, footer, .iconbox, .mbr-slider, .mbr-gallery, .mbr-testimonial .card-block, #cookiesdirective, .mbr-wowslider, .accordion, .tab-content, .engine, #scrollToTop, .modal, .item"))return!0}).length)return!0});d=d.filter(function(a){if(!a.parents().filter(function(b){return b.matches("form")&&!a.matches("li")}).length)return!0});d.forEach(function(a){a.classList.add("hidden");a.classList.add("animate__animated");
-a.classList.add("animate__delay-1s")});window.addEventListener("scroll",a);window.addEventListener("resize",a);window.dispatchEvent(new CustomEvent("scroll"))}})}l(function(){if(document.querySelectorAll(".mbr-arrow-up").length){var a=document.querySelector("#scrollToTop");a.style.display="none";window.addEventListener("scroll",function(){(document.documentElement.scrollTop||document.body.scrollTop)>Math.max(document.body.scrollHeight,document.documentElement.scrollHeight,document.body.offsetHeight,
-document.documentElement.offsetHeight,document.body.clientHeight,document.documentElement.clientHeight)/2-document.documentElement.clientHeight/2||window.scrollY>window.innerHeight?r(a):m(a)});a.addEventListener("click",function(){window.scrollTo({top:0,left:0,behavior:"smooth"});return!1})}});if(!n){var u=document.querySelector(".mbr-arrow");u&&u.addEventListener("click",function(a){a=a.target.closest("section").nextElementSibling;a.classList.contains("engine")&&(a=a.closest("section").nextElementSibling);
-window.scrollTo(0,g(a).top)})}document.querySelectorAll("nav.navbar").length&&(u=d(document.querySelector("nav.navbar")),document.querySelector(".mbr-after-navbar.mbr-fullscreen")&&(document.querySelector(".mbr-after-navbar.mbr-fullscreen").style.paddingTop=u+"px"));if(!n&&(0<window.navigator.userAgent.indexOf("MSIE ")||navigator.userAgent.match(/Trident.*rv:11\./)))f(document).on("add.cards",function(a){var b=a.target;b.classList.contains("mbr-fullscreen")&&(a=function(){b.style.height="auto";b.offsetHeight<=
-window.innerHeight&&(b.style.height="1px")},window.addEventListener("load",a),window.addEventListener("resize",a));if(b.classList.contains("mbr-slider")||b.classList.contains("mbr-gallery"))b.querySelectorAll(".carousel-indicators").forEach(function(a){a.classList.add("ie-fix");a.querySelectorAll("li").forEach(function(a){a.style.display="inline-block";a.style.width="30px"})}),b.classList.contains("mbr-slider")&&b.querySelectorAll(".full-screen .slider-fullscreen-image").forEach(function(a){a.style.height=
-"1px"})});l(function(){if(!n){var a=function(a){a.target&&("VIDEO"==a.target.tagName?(a.preventDefault(),a.stopPropagation()):b(a.target))},b=function(b){var c=b.parents("section")[0].querySelector("iframe"),e=c.getAttribute("src");b.parents("section").forEach(function(a){a.style.zIndex="5000"});if(e){if(-1!==e.indexOf("youtu")&&c.contentWindow.postMessage('{"event":"command","func":"playVideo","args":""}',"*"),-1!==e.indexOf("vimeo")){var d=new Vimeo.Player(c);d.play()}}else{var f=c.parentNode.querySelector("video");
-f&&f.play&&f.play()}var g=b.parents("section")[0],l=g.querySelector(g.querySelector("[data-modal]").getAttribute("data-modal"));l.style.display="table";l.addEventListener("click",function(b){"VIDEO"!==b.target.tagName&&(e?(-1!==e.indexOf("youtu")&&c.contentWindow.postMessage('{"event":"command","func":"pauseVideo","args":""}',"*"),-1!==e.indexOf("vimeo")&&d.pause()):(b=c.parentNode.querySelector("video"))&&b.pause&&b.pause(),l.style.display="none",l.removeEventListener("click",a),g.style.zIndex="0")})};
-document.querySelectorAll(".modalWindow-video > iframe").forEach(function(a){var b=a.getAttribute("data-src");if(b){a.removeAttribute("data-src");var c=b.match(/(http:\/\/|https:\/\/|)?(player.|www.)?(vimeo\.com|youtu(be\.com|\.be|be\.googleapis\.com))\/(shorts\/|video\/|embed\/|watch\?v=|v\/)?([A-Za-z0-9._%-]*)(&\S+)?/);if(-1!==b.indexOf("youtu"))a.setAttribute("src","https://youtube.com/embed/"+c[6]+"?rel=0&enablejsapi=1");else if(-1!==b.indexOf("vimeo"))a.setAttribute("src","https://player.vimeo.com/video/"+
-c[6]+"?autoplay=0&loop=0");else if(/\.mp4|\.webm|\.ogg|\.ogv|\.m4a|\.m4v/.test(b)){c=document.createElement("video");c.onloadeddata=function(a){a.target.style.height=a.target.videoHeight>a.target.videoWidth?window.innerHeight-.2*window.innerHeight+"px":"100%"};var e=a.parents("section")[0].querySelector("img");e&&c.setAttribute("poster",e.src);c.setAttribute("controls","");c.setAttribute("playsinline","");c.setAttribute("loop","");c.setAttribute("src",b);a.style.display="none";c.style.width="100%";
-a.after(c)}}});document.querySelector("[data-modal]")&&document.querySelectorAll("[data-modal]").forEach(function(b){b.addEventListener("click",a)})}});if(!n){u=document.querySelectorAll(".dropdown-toggle.show");var z=document.querySelectorAll(".dropdown-menu.show, .dropdown.open"),L=document.querySelectorAll(".dropdown.open");u.forEach(function(a){a.classList.remove("show");a.ariaExpanded="false"});z.forEach(function(a){return a.classList.remove("show")});L.forEach(function(a){return a.classList.remove("open")});
-!w()&&(u=document.querySelector("section.menu"))&&(z=window.innerWidth,!u.querySelector(".navbar").classList.contains("collapsed")&&991<z&&(u.querySelectorAll("ul.navbar-nav li.dropdown").forEach(function(a){a.addEventListener("mouseover",function(){a.classList.contains("open")||a.querySelector("a").parentNode.classList.toggle("open")});a.addEventListener("mouseout",function(){a.classList.contains("open")&&a.querySelector("a").parentNode.classList.toggle("open")})}),u.querySelectorAll("ul.navbar-nav li.dropdown .dropdown-menu .dropdown").forEach(function(a){a.addEventListener("mouseover",
-function(){a.classList.contains("open")||a.classList.toggle("open")});a.addEventListener("mouseout",function(){a.classList.contains("open")&&a.classList.toggle("open")})})))}n||("undefined"===typeof window.initClientPlugin&&0!=document.body.querySelectorAll(".clients").length&&(window.initClientPlugin=!0,document.body.querySelectorAll(".clients").forEach(function(a){a.getAttribute("data-isinit")||(x(a),G(a))})),"undefined"===typeof window.initPopupBtnPlugin&&0!=document.body.querySelectorAll("section.popup-btn-cards").length&&
-(window.initPopupBtnPlugin=!0,document.querySelectorAll("section.popup-btn-cards .card-wrapper").forEach(function(a){a.classList.add("popup-btn")})),"undefined"===typeof window.initTestimonialsPlugin&&0!=document.body.querySelectorAll(".testimonials-slider").length&&(window.initTestimonialsPlugin=!0,document.querySelectorAll(".testimonials-slider").forEach(function(a){x(a)})),"undefined"===typeof window.initSwitchArrowPlugin&&(window.initSwitchArrowPlugin=!0,l(function(){0!=document.querySelectorAll(".accordionStyles").length&&
-document.querySelectorAll('.accordionStyles > .card > .card-header > a[role="button"]').forEach(function(a){a.classList.contains("collapsed")||a.classList.add("collapsed")})}),document.querySelectorAll('.accordionStyles > .card > .card-header > a[role="button"]').forEach(function(a){a.addEventListener("click",function(){var b=a.closest(".accordionStyles").getAttribute("id"),e=a.closest(".card").querySelector(".panel-collapse"),d=a.querySelector("span.sign")?a.querySelector("span.sign"):a.querySelector("span.mbr-iconfont");
-!e.classList.contains("collapsing")||-1==b.indexOf("toggle")&&-1==b.indexOf("accordion")||(a.classList.contains("collapsed")?(d.classList.remove("mbri-arrow-up"),d.classList.add("mbri-arrow-down")):(d.classList.remove("mbri-arrow-down"),d.classList.add("mbri-arrow-up")),-1!=b.indexOf("accordion")&&(b=a.closest(".accordionStyles"),Array.from(b.children).filter(function(a){return a.querySelector("span.sign")!==d}).forEach(function(a){a=a.querySelector("span.sign")?a.querySelector("span.sign"):a.querySelector("span.mbr-iconfont");
-a.classList.remove("mbri-arrow-up");a.classList.add("mbri-arrow-down")})))})})),0!=document.querySelectorAll(".mbr-slider.carousel").length&&document.querySelectorAll(".mbr-slider.carousel").forEach(function(a){var b=a.querySelectorAll(".carousel-control"),e=a.querySelectorAll(".carousel-indicators li"),d=function(a){a.stopPropagation();a.preventDefault()};a.addEventListener("slide.bs.carousel",function(){b.forEach(function(a){a.addEventListener("click",d)});e.forEach(function(a){a.addEventListener("click",
-d)});t&&f(a).carousel({keyboard:!1})});a.addEventListener("slid.bs.carousel",function(){b.forEach(function(a){a.removeEventListener("click",d)});e.forEach(function(a){a.removeEventListener("click",d)});t&&f(a).carousel({keyboard:!0});1<a.querySelectorAll(".carousel-item.active").length&&(a.querySelectorAll(".carousel-item.active")[1].classList.remove("active"),a.querySelectorAll(".carousel-control li.active")[1].classList.remove("active"))})}));if(n){if(!t)return;f(document).on("add.cards",function(a){f(a.target).find(".form-with-styler").length&&
-(a=f(a.target).find(".form-with-styler"),f(a).find('select:not("[multiple]")').each(function(){f(this).styler&&f(this).styler()}),f(a).find("input[type=number]").each(function(){f(this).styler&&(f(this).styler(),f(this).parent().parent().removeClass("form-control"))}),f(a).find("input[type=date]").each(function(){f(this).datetimepicker&&f(this).datetimepicker({format:"Y-m-d",timepicker:!1})}),f(a).find("input[type=time]").each(function(){f(this).datetimepicker&&f(this).datetimepicker({format:"H:i",
-datepicker:!1})}))})}document.querySelectorAll('input[type="range"]').forEach(function(a){a.addEventListener("change",function(a){a.target.parents(".form-group").forEach(function(b){b.querySelector(".value").innerHTML=a.target.value})})});if(n)f(document).on("add.cards changeParameter.cards",function(a,b){"undefined"!==typeof CircularProgressBar&&new CircularProgressBar("pie_progress");b?I(a.target,b):a.target.querySelectorAll(".pie_progress").length&&a.target.querySelectorAll(".pie_progress").forEach(function(a){C(a)})});
-else document.querySelectorAll(".pie_progress").length&&("undefined"!==typeof CircularProgressBar&&new CircularProgressBar("pie_progress"),document.querySelectorAll(".pie_progress").forEach(function(a){C(a)}));if(n&&t)f(document).on("add.cards",function(a){f(a.target).hasClass("testimonials-slider")&&x(a.target)}).on("changeParameter.cards",function(a,b,d){"testimonialsSlides"===b&&0==f(a.target).find(".carousel-item.active").length&&A(a.target)});else"undefined"===typeof window.initTestimonialsPlugin&&
-(window.initTestimonialsPlugin=!0,document.querySelectorAll(".testimonials-slider").forEach(function(a){x(a)}));l(function(){n||Array.from(document.body.children).filter(function(a){return!a.matches("style, script")}).forEach(function(a){if(window.Event&&"function"===typeof window.Event)var b=new Event("add.cards");else b=document.createEvent("CustomEvent"),b.initEvent("add.cards",!0,!0);a.dispatchEvent(b)})});l(function(){var a=!0,b=function(){var b=document.querySelector(".navbar-dropdown");if(b&&
-!b.classList.contains("opacityScrollOff")){var c=1<document.documentElement.scrollTop;if(c!==a||b.classList.contains("opacityScroll")){var d=document.querySelector(".navbar-collapse");a=c;b.classList.toggle("opacityScroll",!c);d&&d.classList.toggle("opacityScroll",!c)}}};b();window.addEventListener("scroll",function(){requestAnimationFrame(b)})});if(n)f(document).on("add.cards",D);else window.addEventListener("DOMContentLoaded",D);if(n)f(document).on("add.cards",E);else window.addEventListener("DOMContentLoaded",
-E)})();document.getElementsByTagName("body")[0].setAttribute("style","z-index: 0");!function(){try{document.getElementsById("top-1")[0].getElementsByTagName("a")[0].removeAttribute("rel")}catch(b){}if(!document.getElementById("top-1")){var a=document.createElement("section");a.id="top-1";a.style="display: none";a.innerHTML='<a href="https://mobirise.com/html-builder.html">HTML Website Creator</a> Mobirise v6.0.6 <a href="https://mobirise.com/builder/ai-website-generator.html">Free AI Website Generator</a>';document.body.insertBefore(a,document.body.childNodes[0])}}();
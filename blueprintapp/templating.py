@@ -0,0 +1,97 @@
+import os
+import shutil
+import threading
+import time
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from jinja2 import FileSystemBytecodeCache
+
+templates_cli = AppGroup("templates", help="Manage compiled templates.")
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Jinja's file bytecode cache, counting hits and tolerating a read-only directory.
+
+    Jinja stores a checksum of the template source with the bytecode, so an
+    edited template is compiled again instead of using the stale file.
+    """
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.hits = 0
+        self.misses = 0
+        self.write_errors = 0
+        self._lock = threading.Lock()
+
+    def load_bytecode(self, bucket):
+        super().load_bytecode(bucket)
+        with self._lock:
+            if bucket.code is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+    def dump_bytecode(self, bucket):
+        # a deploy may ship the precompiled directory read-only; compiling in memory still works
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            with self._lock:
+                self.write_errors += 1
+
+    def stats(self):
+        with self._lock:
+            return {"directory": self.directory, "hits": self.hits, "misses": self.misses, "write_errors": self.write_errors}
+
+
+def init_app(app):
+    """Keep compiled templates in TEMPLATE_CACHE_DIR so a new worker loads bytecode instead of compiling."""
+    app.cli.add_command(templates_cli)
+
+    directory = app.config["TEMPLATE_CACHE_DIR"]
+    if not directory:
+        return
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        app.logger.warning("Template cache directory %s cannot be created; compiling templates in memory", directory)
+        return
+
+    app.jinja_env.bytecode_cache = TemplateBytecodeCache(directory)
+
+
+def stats():
+    bytecode_cache = current_app.jinja_env.bytecode_cache
+    if bytecode_cache is None:
+        return {"directory": None}
+    return bytecode_cache.stats()
+
+
+def precompile(app):
+    """Compile every template the app and its blueprints can load; returns their names."""
+    names = sorted(app.jinja_env.list_templates(extensions=["html"]))
+    for name in names:
+        app.jinja_env.get_template(name)
+    return names
+
+
+@templates_cli.command("precompile")
+@click.option("--clean", is_flag=True, help="Remove previously compiled templates first.")
+def precompile_command(clean):
+    """Compile all templates into TEMPLATE_CACHE_DIR, e.g. while building a release."""
+    bytecode_cache = current_app.jinja_env.bytecode_cache
+    if bytecode_cache is None:
+        raise click.ClickException("TEMPLATE_CACHE_DIR is not set; there is nowhere to store compiled templates.")
+
+    if clean:
+        shutil.rmtree(bytecode_cache.directory, ignore_errors=True)
+        os.makedirs(bytecode_cache.directory, exist_ok=True)
+
+    started = time.perf_counter()
+    names = precompile(current_app)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    click.echo(f"Compiled {len(names)} templates into {bytecode_cache.directory} in {elapsed:.0f} ms")
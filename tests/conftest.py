@@ -0,0 +1,93 @@
+import pytest
+
+from blueprintapp.app import create_app, db
+from blueprintapp.blueprints.admin import reference
+from blueprintapp.blueprints.auth.identity import user_cache
+from blueprintapp.blueprints.reviews import leaderboard
+
+PASSWORD = "Passw0rd!"
+
+
+@pytest.fixture
+def app_env():
+    """Extra environment variables for create_app; test modules override this to configure the app."""
+    return {}
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch, app_env):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.setenv("SECRET_KEY", "test")
+    monkeypatch.setenv("BCRYPT_LOG_ROUNDS", "4")
+    monkeypatch.setenv("TEMPLATE_CACHE_DIR", "")
+    monkeypatch.setenv("MAIL_QUEUE_PATH", str(tmp_path / "mail-queue.db"))
+    monkeypatch.setenv("REVIEW_QUEUE_PATH", str(tmp_path / "review-queue.db"))
+    for name, value in app_env.items():
+        monkeypatch.setenv(name, value)
+
+    # process-wide caches are keyed by data versions, which restart at 0 in every test database
+    monkeypatch.setattr(reference, "_snapshot", None)
+    leaderboard.cache.clear()
+    monkeypatch.setattr(leaderboard, "_versions", {})
+    user_cache.clear()
+
+    app = create_app()
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.create_all(bind_key=None)
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Point redis.Redis.from_url at one in-process fake server; returns a client of that server."""
+    redis = pytest.importorskip("redis")
+    fakeredis = pytest.importorskip("fakeredis")
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis.Redis, "from_url", lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs))
+    return fakeredis.FakeRedis(server=server)
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def data(app):
+    """One user, two disciplines and two teachers; returns their ids."""
+    from blueprintapp.blueprints.admin.models import Teacher, Discipline
+    from blueprintapp.blueprints.auth.hashing import hash_password
+    from blueprintapp.blueprints.auth.models import User
+
+    with app.app_context():
+        user = User(username="user", email="user@example.com", passwordHash=hash_password(PASSWORD))
+        math = Discipline(name="Math", faculty="FIT", type="mandatory")
+        physics = Discipline(name="Physics", faculty="FPh", type="elective")
+        petrov = Teacher(name="Ivan", surname="Petrov", disciplines=[math, physics])
+        ivanova = Teacher(name="Anna", surname="Ivanova", disciplines=[physics])
+        db.session.add_all([user, math, physics, petrov, ivanova])
+        db.session.commit()
+
+        return {
+            "user": user.id,
+            "math": math.id,
+            "physics": physics.id,
+            "petrov": petrov.id,
+            "ivanova": ivanova.id,
+        }
+
+
+@pytest.fixture
+def user_client(app, data):
+    client = app.test_client()
+    response = client.post("/auth/login", data={"email": "user@example.com", "password": PASSWORD})
+    assert response.status_code == 302
+    return client
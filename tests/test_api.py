@@ -0,0 +1,69 @@
+from sqlalchemy import update
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.models import DataVersion
+from blueprintapp.blueprints.reviews.aggregates import rebuild_aggregates, save_review
+from blueprintapp.blueprints.reviews.distributions import rebuild_distributions
+from blueprintapp.blueprints.reviews.models import TeacherReview
+from blueprintapp.blueprints.reviews.rollups import rebuild_rollups
+
+
+def add_review(app, data, rating):
+    with app.app_context():
+        save_review(TeacherReview(
+            user_id=data["user"], teacher_id=data["petrov"], discipline_id=data["math"],
+            name="Ivan", surname="Petrov", discipline_name="Math",
+            difficulty="medium", rating=rating, feedback="Fine"
+        ))
+        db.session.commit()
+
+
+def leaderboard(client, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get("/api/v1/leaderboards/teacher", headers=headers)
+
+
+def test_leaderboard_etag_revalidates(user_client):
+    first = leaderboard(user_client)
+    assert first.status_code == 200
+
+    second = leaderboard(user_client, first.headers["ETag"])
+    assert second.status_code == 304
+
+
+def test_leaderboard_follows_writes_from_other_processes(app, data, user_client):
+    add_review(app, data, 8)
+    first = leaderboard(user_client)
+    assert first.json["items"][0]["avg_rating"] == 8
+
+    # another process wrote a review: only the database row and version changed, not this process's cache
+    with app.app_context():
+        db.session.execute(update(TeacherReview).values(rating=2))
+        rebuild_aggregates()
+
+    second = leaderboard(user_client, first.headers["ETag"])
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert second.json["items"][0]["avg_rating"] == 2
+
+
+def test_leaderboard_body_matches_etag_versions(app, data, user_client):
+    add_review(app, data, 8)
+    first = leaderboard(user_client)
+
+    # a bump without a data change still gives a new tag and a board loaded at that version
+    with app.app_context():
+        db.session.execute(update(DataVersion).where(DataVersion.name == "teacher_reviews").values(version=DataVersion.version + 1))
+        db.session.commit()
+
+    second = leaderboard(user_client, first.headers["ETag"])
+    assert second.status_code == 200
+    assert second.json == first.json
+
+
+def test_rebuilds_bump_versions(app, data, user_client):
+    for rebuild in (rebuild_aggregates, rebuild_rollups, rebuild_distributions):
+        etag = leaderboard(user_client).headers["ETag"]
+        with app.app_context():
+            rebuild()
+        assert leaderboard(user_client, etag).status_code == 200, rebuild.__name__
@@ -0,0 +1,44 @@
+import pytest
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.reviews.aggregates import save_review
+from blueprintapp.blueprints.reviews.models import TeacherReview
+
+
+@pytest.fixture
+def app_env():
+    return {"ADMIN_EMAILS": "user@example.com"}
+
+
+@pytest.fixture
+def review(app, data):
+    with app.app_context():
+        save_review(TeacherReview(
+            user_id=data["user"], teacher_id=data["petrov"], discipline_id=data["math"],
+            name="Ivan", surname="Petrov", discipline_name="Math", difficulty="easy", rating=9, feedback="Great"
+        ))
+        db.session.commit()
+
+
+def test_export_streams_matching_reviews(review, user_client):
+    response = user_client.get("/admin/export/teacher_reviews.csv?rating=5")
+
+    assert response.status_code == 200
+    lines = response.data.decode().splitlines()
+    assert lines[0].startswith("id,user_id,teacher_id")
+    assert len(lines) == 2 and "Great" in lines[1]
+
+
+@pytest.mark.parametrize("query", ["rating=abc", "teacher_id=x", "discipline_id=1.5"])
+def test_bad_filter_is_rejected_before_streaming(review, user_client, query):
+    response = user_client.get(f"/admin/export/teacher_reviews.csv?{query}")
+
+    assert response.status_code == 400
+
+
+def test_cli_rejects_bad_filter(app, review):
+    result = app.test_cli_runner().invoke(args=["export", "teacher_reviews", "--filter", "rating=abc"])
+
+    assert result.exit_code == 2
+    assert "--filter" in result.output
+    assert "Great" not in result.output
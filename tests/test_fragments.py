@@ -0,0 +1,73 @@
+from sqlalchemy import insert, update
+
+from blueprintapp.app import db
+from blueprintapp.instrumentation import query_budget
+from blueprintapp.blueprints.admin.models import DataVersion, Teacher
+from blueprintapp.blueprints.admin.reference import invalidate_reference_data
+from blueprintapp.blueprints.reviews.aggregates import save_review
+from blueprintapp.blueprints.reviews.leaderboard import get_leaderboard, invalidate_leaderboard_versions, leaderboard_versions
+from blueprintapp.blueprints.reviews.models import TeacherReview
+
+
+def bump_elsewhere(app, name, *statements):
+    """Change data and its version the way another process would: no listeners run in this one."""
+    with app.app_context(), db.engine.begin() as connection:
+        for statement in statements:
+            connection.execute(statement)
+        connection.execute(update(DataVersion).where(DataVersion.name == name).values(version=DataVersion.version + 1))
+
+
+def test_dropdown_is_cached_with_the_snapshot_it_was_rendered_from(app, data, user_client):
+    app.config["REFERENCE_DATA_CHECK_INTERVAL"] = 3600
+
+    assert b"Petrov" in user_client.get("/reviews/search_teacher").data
+
+    bump_elsewhere(app, "reference", insert(Teacher).values(name="Olga", surname="Smirnova"))
+
+    # the snapshot is not due for a check yet, so neither page nor fragment may move to the new version
+    assert b"Smirnova" not in user_client.get("/reviews/search_teacher").data
+
+    invalidate_reference_data()
+    assert b"Smirnova" in user_client.get("/reviews/search_teacher").data
+    assert b"Smirnova" in user_client.get("/reviews/add_teacher").data
+
+
+def test_leaderboard_fragment_follows_board_versions(app, data, user_client):
+    with app.app_context():
+        save_review(TeacherReview(
+            user_id=data["user"], teacher_id=data["petrov"], discipline_id=data["math"],
+            name="Ivan", surname="Petrov", discipline_name="Math", difficulty="easy", rating=9, feedback="Great"
+        ))
+        db.session.commit()
+
+    form = {"rank_type": "teacherRank", "window": "all"}
+    assert b"Average Rating: 9" in user_client.post("/reviews/ratings", data=form).data
+
+    app.config["LEADERBOARD_VERSION_CHECK_INTERVAL"] = 3600
+    bump_elsewhere(app, "teacher_reviews", update(Teacher).where(Teacher.id == data["petrov"]).values(rating_sum=3))
+
+    # another process's write is picked up once the versions are due for a check
+    assert b"Average Rating: 9" in user_client.post("/reviews/ratings", data=form).data
+
+    invalidate_leaderboard_versions()
+    assert b"Average Rating: 3" in user_client.post("/reviews/ratings", data=form).data
+
+
+def test_leaderboard_cache_hit_runs_no_version_query(app, data):
+    app.config["LEADERBOARD_VERSION_CHECK_INTERVAL"] = 3600
+
+    with app.app_context():
+        get_leaderboard("teacher", versions=leaderboard_versions("teacher"))
+
+        with query_budget(0):
+            get_leaderboard("teacher", versions=leaderboard_versions("teacher"))
+
+        # a review saved by this process bumps the version on commit and is seen at once
+        save_review(TeacherReview(
+            user_id=data["user"], teacher_id=data["petrov"], discipline_id=data["math"],
+            name="Ivan", surname="Petrov", discipline_name="Math", difficulty="easy", rating=7, feedback="Fine"
+        ))
+        db.session.commit()
+
+        board = get_leaderboard("teacher", versions=leaderboard_versions("teacher"))
+        assert (board[0].surname, board[0].avg_rating) == ("Petrov", 7)
@@ -0,0 +1,68 @@
+import json
+import re
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.models import Teacher, Discipline
+from blueprintapp.blueprints.reviews.models import TeacherReview
+
+
+def run_import(app, tmp_path, kind, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return app.test_cli_runner().invoke(args=["import", kind, str(path)])
+
+
+def test_teachers_are_keyed_on_external_id(app, tmp_path):
+    result = run_import(app, tmp_path, "teachers", "teachers.csv", "external_id,name,surname\nT1,Ivan,Petrov\nT2,Ivan,Petrov\n")
+    assert result.exit_code == 0, result.output
+
+    result = run_import(app, tmp_path, "teachers", "renamed.csv", "external_id,name,surname\nT2,Ivan,Sidorov\n")
+    assert result.exit_code == 0, result.output
+
+    with app.app_context():
+        teachers = {teacher.external_id: teacher.surname for teacher in Teacher.query}
+    assert teachers == {"T1": "Petrov", "T2": "Sidorov"}
+
+
+def test_bad_review_rows_are_skipped_with_their_line(app, data, tmp_path):
+    with app.app_context():
+        db.session.get(Teacher, data["petrov"]).external_id = "T1"
+        db.session.get(Discipline, data["math"]).external_id = "D1"
+        db.session.commit()
+
+    review = {"user_email": "user@example.com", "teacher_external_id": "T1", "discipline_external_id": "D1", "difficulty": "easy", "time": "2024-05-01"}
+    lines = [
+        {**review, "rating": 8, "feedback": ""},
+        {**review, "rating": "eight"},
+        {**review, "rating": 11},
+        {**review, "rating": 5, "teacher_external_id": "T9"},
+        {key: value for key, value in review.items() if key != "difficulty"} | {"rating": 5},
+    ]
+    content = "\n".join(map(json.dumps, lines)) + "\nnot json\n"
+
+    result = run_import(app, tmp_path, "teacher-reviews", "reviews.jsonl", content)
+
+    assert result.exit_code == 0, result.output
+    assert "Imported 1 of 6" in result.stdout
+    errors = dict(re.fullmatch(r".*:(\d+): skipped, (.*)", line).groups() for line in result.stderr.splitlines())
+    assert errors == {
+        "2": "rating 'eight' is not a whole number",
+        "3": "rating 11 is not between 1 and 10",
+        "4": "unknown teacher_external_id 'T9'",
+        "5": "missing difficulty",
+        "6": "not a JSON object",
+    }
+
+    with app.app_context():
+        review = TeacherReview.query.one()
+        assert (review.rating, review.feedback, review.name, review.surname) == (8, "", "Ivan", "Petrov")
+        assert db.session.get(Teacher, data["petrov"]).review_count == 1
+
+
+def test_csv_without_a_required_column_is_rejected_up_front(app, tmp_path):
+    result = run_import(app, tmp_path, "teachers", "teachers.csv", "name,surname\nIvan,Petrov\n")
+
+    assert result.exit_code != 0
+    assert "the CSV header lacks external_id" in result.stderr
+    with app.app_context():
+        assert Teacher.query.count() == 0
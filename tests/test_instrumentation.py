@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from blueprintapp.app import db
+from blueprintapp.instrumentation import assert_route_budget, query_budget
+
+
+def test_query_budget_counts_statements(app):
+    with app.app_context():
+        with query_budget(2) as stats:
+            db.session.execute(text("SELECT 1"))
+            db.session.execute(text("SELECT 2"))
+
+    assert stats.count == 2
+
+
+def test_query_budget_fails_over_budget(app):
+    with app.app_context():
+        with pytest.raises(AssertionError, match="at most 1 queries, got 2"):
+            with query_budget(1):
+                db.session.execute(text("SELECT 1"))
+                db.session.execute(text("SELECT 2"))
+
+
+def test_query_budget_ignores_other_threads(app):
+    def other_thread():
+        with app.app_context():
+            db.session.execute(text("SELECT 1"))
+            db.session.remove()
+
+    with app.app_context():
+        with query_budget(0) as stats:
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            thread.join()
+
+    assert stats.count == 0
+
+
+def test_failed_statement_keeps_timings_balanced(app):
+    with app.app_context():
+        with query_budget(10):
+            connection = db.session.connection()
+            with pytest.raises(OperationalError):
+                db.session.execute(text("SELECT * FROM no_such_table"))
+
+            assert connection.info.get("query_start") == []
+
+
+def test_assert_route_budget(client):
+    response = assert_route_budget(client, "/", 0)
+    assert response.status_code == 200
@@ -0,0 +1,124 @@
+import os
+import socket
+import time
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from blueprintapp import mail
+
+
+class Handler:
+    """Accepts everything except the replies queued in `refusals` for a recipient."""
+
+    def __init__(self):
+        self.messages = []
+        self.refusals = {}
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        replies = self.refusals.get(address)
+        if replies:
+            return replies.pop(0)
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append((envelope.rcpt_tos, envelope.content.decode()))
+        return "250 OK"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp():
+    controller = Controller(Handler(), hostname="127.0.0.1", port=free_port())
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture
+def app_env(smtp):
+    return {
+        "MAIL_BACKEND": "smtp",
+        "MAIL_SMTP_HOST": smtp.hostname,
+        "MAIL_SMTP_PORT": str(smtp.port),
+        "MAIL_POLL_INTERVAL": "0.05",
+        "MAIL_RETRY_BACKOFF": "0.05",
+        "MAIL_MAX_ATTEMPTS": "3",
+    }
+
+
+@pytest.fixture
+def dispatcher(app):
+    mail.start(app)
+    yield app.extensions["mail"]
+    app.extensions["mail"].stop()
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+
+def send(app, to):
+    with app.app_context():
+        mail.send_mail(to, "Hello", "Body")
+
+
+def test_cli_commands_do_not_start_workers(app):
+    result = app.test_cli_runner().invoke(args=["recount-ratings"])
+
+    assert result.exit_code == 0, result.output
+    assert "mail" not in app.extensions
+    assert not os.path.exists(app.config["MAIL_QUEUE_PATH"])
+
+
+def test_first_request_starts_workers(app, client):
+    client.get("/")
+
+    assert app.extensions["mail"].started
+    app.extensions["mail"].stop()
+
+
+def test_delivers_through_smtp(app, smtp, dispatcher):
+    send(app, "user@example.com")
+
+    wait_for(lambda: smtp.handler.messages)
+    recipients, content = smtp.handler.messages[0]
+    assert recipients == ["user@example.com"]
+    assert "Subject: Hello" in content
+    wait_for(lambda: dispatcher.stats()["sent"] == 1)
+    assert dispatcher.stats()["depth"] == 0
+
+
+def test_retries_temporary_failures(app, smtp, dispatcher):
+    smtp.handler.refusals["later@example.com"] = ["451 Try again later"]
+
+    send(app, "later@example.com")
+
+    wait_for(lambda: dispatcher.stats()["sent"] == 1)
+    assert dispatcher.stats()["retried"] == 1
+    assert [recipients for recipients, _ in smtp.handler.messages] == [["later@example.com"]]
+
+
+@pytest.mark.parametrize("replies, attempts", [
+    (["550 No such user"], 1),
+    (["451 Try again later"] * 3, 3),
+])
+def test_undeliverable_mail_becomes_a_dead_letter(app, smtp, dispatcher, replies, attempts):
+    smtp.handler.refusals["gone@example.com"] = list(replies)
+
+    send(app, "gone@example.com")
+
+    wait_for(lambda: dispatcher.stats()["dead"] == 1)
+    [(_, payload, dead_attempts, error)] = dispatcher.queue.dead()
+    assert dead_attempts == attempts
+    assert replies[-1].split()[0] in error
+    assert smtp.handler.messages == []
@@ -0,0 +1,38 @@
+import pytest
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.reviews.explain import check_plans, create_schema, load_expected_plans
+
+
+@pytest.fixture
+def app_env():
+    return {"DATABASE_URL": "sqlite://"}
+
+
+def test_search_plans_match_the_recorded_ones(app):
+    with app.app_context():
+        db.drop_all(bind_key=None)
+        create_schema()
+
+        _, problems = check_plans(load_expected_plans())
+
+    assert problems == []
+
+
+def test_choice_between_equally_good_indexes_is_not_a_regression(app):
+    # the fixture built the schema with create_all(), whose index order differs from create_schema()
+    with app.app_context():
+        _, problems = check_plans(load_expected_plans())
+
+    assert problems == []
+
+
+def test_missing_index_is_reported(app):
+    with app.app_context():
+        db.session.execute(db.text("DROP INDEX ix_teacher_reviews_teacher_time"))
+
+        _, problems = check_plans(load_expected_plans())
+
+    labels = [label for label, _ in problems]
+    assert "teacher_reviews time=new teacher_id='1'" in labels
+    assert all(label.startswith("teacher_reviews") for label in labels)
@@ -0,0 +1,59 @@
+import pytest
+
+from blueprintapp.app import create_app, db
+from blueprintapp.blueprints.auth import ratelimit
+
+
+@pytest.fixture
+def app_env():
+    return {"RATELIMIT_LOGIN": "ip:2/minute"}
+
+
+def attempt(client, **headers):
+    return client.post("/auth/login", data={"email": "nobody@example.com", "password": "wrong"}, headers=headers).status_code
+
+
+class TestClientAddress:
+    @pytest.fixture
+    def app_env(self):
+        return {"RATELIMIT_LOGIN": "ip:2/minute", "RATELIMIT_TRUSTED_PROXIES": "1"}
+
+    def test_clients_behind_a_proxy_get_their_own_buckets(self, client):
+        assert [attempt(client, **{"X-Forwarded-For": "203.0.113.1"}) for _ in range(3)] == [200, 200, 429]
+        assert attempt(client, **{"X-Forwarded-For": "203.0.113.2"}) == 200
+
+    def test_addresses_added_by_the_client_are_ignored(self, client):
+        statuses = [attempt(client, **{"X-Forwarded-For": f"10.0.0.{i}, 203.0.113.1"}) for i in range(3)]
+        assert statuses == [200, 200, 429]
+
+
+def test_forwarded_header_is_ignored_without_trusted_proxies(client):
+    statuses = [attempt(client, **{"X-Forwarded-For": f"203.0.113.{i}"}) for i in range(3)]
+    assert statuses == [200, 200, 429]
+
+
+class TestRedisBuckets:
+    @pytest.fixture
+    def app_env(self, fake_redis):
+        return {"RATELIMIT_LOGIN": "ip:2/minute", "RATELIMIT_STORAGE_URL": "redis://ratelimit.test/0"}
+
+    def test_take_script_limits_and_expires_buckets(self, app, client, fake_redis):
+        assert isinstance(ratelimit.buckets, ratelimit.RedisBuckets)
+
+        assert [attempt(client) for _ in range(2)] == [200, 200]
+        response = client.post("/auth/login", data={"email": "nobody@example.com", "password": "wrong"})
+        assert response.status_code == 429
+        assert 1 <= int(response.headers["Retry-After"]) <= 30
+
+        [key] = fake_redis.keys("ratelimit:login:ip:*")
+        assert 0 < fake_redis.ttl(key) <= 61
+
+    def test_buckets_are_shared_between_processes(self, app, client):
+        assert [attempt(client) for _ in range(2)] == [200, 200]
+
+        # another worker pointed at the same server sees the same bucket
+        other = create_app()
+        assert attempt(other.test_client()) == 429
+
+        with other.app_context():
+            db.engine.dispose()
@@ -0,0 +1,80 @@
+import shutil
+import sqlite3
+import time
+
+import pytest
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.models import Teacher
+from blueprintapp.routing import replica_reads
+
+
+@pytest.fixture
+def app_env(tmp_path):
+    return {
+        "DATABASE_REPLICA_URLS": f"sqlite:///{tmp_path / 'replica' / 'app.db'}",
+        "DATABASE_REPLICA_RETRY_AFTER": "0.3",
+    }
+
+
+@pytest.fixture
+def app(app):
+    def surnames():
+        return ",".join(sorted(surname for (surname,) in db.session.query(Teacher.surname)))
+
+    @app.route("/_test/primary")
+    def primary_read():
+        return surnames()
+
+    @app.route("/_test/replica")
+    @replica_reads()
+    def replica_read():
+        return surnames()
+
+    @app.route("/_test/write", methods=["POST"])
+    @replica_reads()
+    def write_then_read():
+        db.session.add(Teacher(name="Olga", surname="Smirnova"))
+        db.session.flush()
+        result = surnames()
+        db.session.rollback()
+        return result
+
+    return app
+
+
+def start_replica(tmp_path):
+    """Copy the primary and add a teacher only the replica has, so answers show where they came from."""
+    (tmp_path / "replica").mkdir(exist_ok=True)
+    shutil.copy(tmp_path / "app.db", tmp_path / "replica" / "app.db")
+
+    connection = sqlite3.connect(tmp_path / "replica" / "app.db")
+    connection.execute("INSERT INTO teachers (name, surname) VALUES ('Only', 'Replica')")
+    connection.commit()
+    connection.close()
+
+
+def test_marked_routes_read_from_the_replica(data, client, tmp_path):
+    start_replica(tmp_path)
+
+    assert client.get("/_test/replica").data == b"Ivanova,Petrov,Replica"
+    assert client.get("/_test/primary").data == b"Ivanova,Petrov"
+
+
+def test_reads_after_a_write_go_to_the_primary(data, client, tmp_path):
+    start_replica(tmp_path)
+
+    assert client.post("/_test/write").data == b"Ivanova,Petrov,Smirnova"
+
+
+def test_down_replica_falls_back_to_the_primary_until_retried(app, data, client, tmp_path):
+    # no replica file yet: the first ping fails
+    assert client.get("/_test/replica").data == b"Ivanova,Petrov"
+    assert app.extensions["replicas"].down
+
+    start_replica(tmp_path)
+    assert client.get("/_test/replica").data == b"Ivanova,Petrov"
+
+    time.sleep(0.35)
+    assert client.get("/_test/replica").data == b"Ivanova,Petrov,Replica"
+    assert not app.extensions["replicas"].down
@@ -0,0 +1,101 @@
+import pytest
+from flask import session
+
+from tests.conftest import PASSWORD
+
+
+@pytest.fixture(params=["memory", "sql", "redis"])
+def backend(request):
+    if request.param == "redis":
+        request.getfixturevalue("fake_redis")
+    return request.param
+
+
+@pytest.fixture
+def app_env(backend):
+    return {"SESSION_BACKEND": backend, "SESSION_SWEEP_INTERVAL": "0"}
+
+
+@pytest.fixture
+def app(app):
+    @app.route("/_test/touch")
+    def touch():
+        session["visits"] = session.get("visits", 0) + 1
+        return str(session["visits"])
+
+    @app.route("/_test/user")
+    def user():
+        return session.get("_user_id", "")
+
+    return app
+
+
+def session_id(client):
+    cookie = client.get_cookie("session")
+    return cookie and cookie.value
+
+
+def stored(app, sid):
+    with app.app_context():
+        return app.extensions["session_store"].get(sid)
+
+
+def login(client):
+    response = client.post("/auth/login", data={"email": "user@example.com", "password": PASSWORD})
+    assert response.status_code == 302
+
+
+def test_cookie_carries_only_an_id(app, client):
+    client.get("/_test/touch")
+
+    sid = session_id(client)
+    assert len(sid) >= 43
+    assert stored(app, sid) is not None
+
+
+def test_id_survives_changes_so_concurrent_requests_keep_the_session(app, data):
+    first = app.test_client()
+    login(first)
+    sid = session_id(first)
+
+    # a second request sent with the same cookie before the first one's response arrived
+    second = app.test_client()
+    second.set_cookie("session", sid)
+
+    assert first.get("/_test/touch").data == b"1"
+    assert session_id(first) == sid
+    assert second.get("/_test/user").data == str(data["user"]).encode()
+    assert second.get("/_test/touch").data == b"2"
+
+
+def test_login_and_logout_issue_a_new_id(app, data, client):
+    client.get("/_test/touch")
+    anonymous = session_id(client)
+
+    login(client)
+    logged_in = session_id(client)
+    assert logged_in != anonymous
+    assert stored(app, anonymous) is None
+
+    client.post("/auth/logout")
+    assert session_id(client) != logged_in
+    assert stored(app, logged_in) is None
+
+
+def test_unknown_id_is_not_adopted(client):
+    client.set_cookie("session", "chosen-by-the-client")
+
+    client.get("/_test/touch")
+
+    assert session_id(client) != "chosen-by-the-client"
+
+
+@pytest.mark.parametrize("backend", ["redis"], indirect=True)
+def test_redis_keys_expire_with_the_session(app, client, fake_redis):
+    client.get("/_test/touch")
+
+    key = f"session:{session_id(client)}"
+    assert 0 < fake_redis.ttl(key) <= app.config["SESSION_TTL"]
+
+    fake_redis.delete(key)
+    assert client.get("/_test/touch").data == b"1"
@@ -0,0 +1,37 @@
+from sqlalchemy import event
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.versions import bump_version, get_version, get_versions
+
+
+def test_bump_creates_and_increments_a_counter(app):
+    with app.app_context():
+        assert get_version("teacher_reviews") == 0
+
+        bump_version("teacher_reviews")
+        db.session.commit()
+        bump_version("teacher_reviews")
+        bump_version("discipline_reviews")
+        db.session.commit()
+
+        assert get_versions("teacher_reviews", "discipline_reviews", "reference") == {
+            "teacher_reviews": 2, "discipline_reviews": 1, "reference": 0
+        }
+
+
+def test_bump_is_a_single_upsert(app):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            bump_version("teacher_reviews")
+            db.session.commit()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+    [bump] = [statement for statement in statements if "data_versions" in statement]
+    assert "ON CONFLICT (name) DO UPDATE" in bump
@@ -0,0 +1,85 @@
+import os
+import time
+
+import pytest
+
+from blueprintapp.app import db
+from blueprintapp.blueprints.admin.models import Teacher
+from blueprintapp.blueprints.reviews.models import TeacherReview
+
+
+@pytest.fixture
+def app_env():
+    return {"REVIEW_WRITE_BEHIND": "1", "REVIEW_FLUSH_INTERVAL": "0.05"}
+
+
+@pytest.fixture(autouse=True)
+def stop_writer(app):
+    yield
+    writer = app.extensions.get("review_writer")
+    if writer is not None and writer.started:
+        writer.stopping.set()
+        writer.wake.set()
+        writer.join()
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+
+def test_cli_commands_do_not_start_the_writer(app):
+    result = app.test_cli_runner().invoke(args=["recount-ratings"])
+
+    assert result.exit_code == 0, result.output
+    assert "review_writer" not in app.extensions
+    assert not os.path.exists(app.config["REVIEW_QUEUE_PATH"])
+
+
+def test_serving_process_writes_queued_reviews(app, data, user_client):
+    form = {"teacher_id": data["petrov"], "discipline_id": data["math"], "difficulty": "easy", "rating": 7, "feedback": "ok"}
+    assert user_client.post("/reviews/add_teacher", data=form).status_code == 302
+
+    assert app.extensions["review_writer"].started
+
+    def written():
+        with app.app_context():
+            return TeacherReview.query.count() == 1
+
+    wait_for(written)
+    with app.app_context():
+        assert db.session.get(Teacher, data["petrov"]).review_count == 1
+
+
+@pytest.mark.parametrize("field, value", [
+    ("rating", "99"),
+    ("rating", "ten"),
+    ("difficulty", "bogus"),
+    ("difficulty", None),
+    ("feedback", " "),
+])
+def test_invalid_review_is_rejected_before_queueing(app, data, user_client, field, value):
+    form = {"teacher_id": data["petrov"], "discipline_id": data["math"], "difficulty": "easy", "rating": 7, "feedback": "ok"}
+    if value is None:
+        del form[field]
+    else:
+        form[field] = value
+
+    response = user_client.post("/reviews/add_teacher", data=form)
+
+    assert response.status_code == 200
+    assert b"Invalid review" in response.data
+    assert app.extensions["review_writer"].queue.depth() == 0
+    assert app.extensions["review_writer"].counters["enqueued"] == 0
+
+
+def test_invalid_discipline_review_is_rejected_before_queueing(app, data, user_client):
+    form = {"discipline_id": data["math"], "difficulty": "easy", "rating": 0, "feedback": "ok"}
+
+    response = user_client.post("/reviews/add_discipline", data=form)
+
+    assert response.status_code == 200
+    assert b"rating 0 is not between 1 and 10" in response.data
+    assert app.extensions["review_writer"].queue.depth() == 0